@@ -1,12 +1,28 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, g
 from flask_cors import CORS
+import os
 import threading
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from binance_scanner import BinancePerperualScanner
+from binance_scanner import BinancePerperualScanner, format_signal, scanner_options
+from finyx_scanners import FinyXScannerManager
+from kline_store import KlineStore
+from event_broadcaster import EventBroadcaster
+from upstream_cache import CandleCache, INTERVAL_SECONDS
+from symbol_universe import SymbolUniverse
+from upstream import shared_client as upstream, PRIORITY_CHART
+from metrics import registry, HTTP_REQUESTS, HTTP_SECONDS
+from signal_table import SignalTableReader, send_command
+import numpy as np
 import logging
 
+# msgpack opsiyonel: kuruluysa toplu mum yanıtı ikili formatta da verilebilir
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Logging setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,6 +34,216 @@ CORS(app)
 scanner = None
 scanner_thread = None
 
+# Kline yanıt önbelleği (tüm kline route'ları paylaşır)
+candle_cache = CandleCache()
+
+# Kapanmış mumların disk deposu - yeniden başlatmada geçmiş buradan yüklenir
+kline_store = KlineStore(os.environ.get('KLINE_STORE_DIR',
+                                        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'klines')))
+
+# Tarayıcı olaylarını tüm SSE istemcilerine dağıtan yayıncı
+broadcaster = EventBroadcaster()
+
+# Tarayıcı ayrı süreçte (scanner_service.py) çalışıyorsa sinyal ve durum paylaşılan tablodan kilitsiz okunur;
+# bu modda web worker'ı tarayıcı başlatmaz, start/stop istekleri servise iletilir
+SIGNAL_TABLE_PATH = os.environ.get('SIGNAL_TABLE')
+signal_table = SignalTableReader(SIGNAL_TABLE_PATH) if SIGNAL_TABLE_PATH else None
+TABLE_POLL_INTERVAL = 0.25
+table_forwarder = None
+table_forwarder_lock = threading.Lock()
+
+# exchangeInfo tek kez indirilir, tarayıcı ve tüm sembol route'ları paylaşır
+symbol_universe = SymbolUniverse()
+
+# Grafik istekleri ağırlık bütçesi için en fazla bu kadar bekler (tarayıcı tohumlaması önceliklidir)
+CHART_MAX_WAIT = 15.0
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """Route süresini ve durum kodunu kaydet (route şablonu etiketlenir, ham path değil)"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        HTTP_SECONDS.labels(route, request.method).observe(time.perf_counter() - started)
+        HTTP_REQUESTS.labels(route, request.method, response.status_code).inc()
+    return response
+
+def scanner_gauge(read, read_state):
+    """
+    Tarayıcı çalışıyorsa okunan değeri, yoksa None (seri yazılmaz) döndüren callback
+    Tarayıcı servisi ayrı süreçteyse (SIGNAL_TABLE) değer tablodaki durumdan read_state ile okunur
+    """
+    def collect():
+        if signal_table is not None:
+            state = signal_table.get_state()
+            return read_state(state) if state is not None else None
+        return read(scanner) if scanner else None
+    return collect
+
+# Okuma anında hesaplanan göstergeler
+registry.gauge('scanner_queue_depth', 'Analiz kuyruğunda bekleyen stream mesajları',
+               callback=scanner_gauge(lambda s: s.message_queue.qsize() if s.message_queue else 0,
+                                      lambda state: state['status'].get('queue_depth', 0)))
+registry.gauge('scanner_active_signals', 'Aktif sinyal sayısı',
+               callback=scanner_gauge(lambda s: len(s.signals),
+                                      lambda state: state['status'].get('signals_count', 0)))
+registry.gauge('scanner_active_symbols', 'Taranan sembol sayısı',
+               callback=scanner_gauge(lambda s: len(s.active_symbols),
+                                      lambda state: len(state['active_symbols'])))
+registry.gauge('scanner_stream_connected', 'Bağlı stream bağlantıları', ('connection',),
+               callback=scanner_gauge(lambda s: {(key,): 1 for key in list(s.connected_streams)},
+                                      lambda state: {(key,): 1 for key in state['status'].get('streams', [])}))
+registry.gauge('scanner_scheduler_pending', 'Değerlendirme bekleyen kirli semboller',
+               callback=scanner_gauge(lambda s: len(s.tick_scheduler.dirty) if s.tick_scheduler else 0,
+                                      lambda state: (state['status'].get('scheduler') or {}).get('pending', 0)))
+registry.gauge('upstream_used_weight', 'Host başına son dakikada kullanılan ağırlık', ('host',),
+               callback=lambda: {(host,): state['used_weight'] for host, state in upstream.scheduler.stats().items()})
+registry.gauge('upstream_weight_limit', 'Host başına dakikalık ağırlık limiti', ('host',),
+               callback=lambda: {(host,): state['weight_limit'] for host, state in upstream.scheduler.stats().items()})
+registry.gauge('sse_subscribers', 'Bağlı SSE istemcileri',
+               callback=lambda: broadcaster.stats()['subscribers'])
+
+KLINE_URLS = {
+    'spot': "https://api.binance.com/api/v3/klines",
+    'futures': "https://fapi.binance.com/fapi/v1/klines"
+}
+
+def fetch_klines(market, symbol, interval, limit):
+    """Kline verisini önbellekten veya Binance'ten (status_code, data) olarak getir"""
+    def fetch():
+        params = {
+            'symbol': symbol,
+            'interval': interval,
+            'limit': limit
+        }
+        response = upstream.get(KLINE_URLS[market], params=params,
+                                priority=PRIORITY_CHART, max_wait=CHART_MAX_WAIT)
+        return response.status_code, response.json()
+    
+    return candle_cache.get((market, symbol, interval, str(limit)), interval, fetch)
+
+# Toplu mum isteği: upstream paralelliği ve üst sınırlar
+BATCH_PARALLELISM = 16
+BATCH_MAX_SYMBOLS = 1000
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_PARALLELISM)
+
+def klines_to_columns(data):
+    """Binance kline dizisini t/o/h/l/c/v sütunlarına çevir"""
+    values = np.array([row[1:6] for row in data], dtype=np.float64).reshape(-1, 5)
+    return {
+        't': [row[0] for row in data],
+        'o': values[:, 0], 'h': values[:, 1], 'l': values[:, 2],
+        'c': values[:, 3], 'v': values[:, 4]
+    }
+
+# FinyX LQ / Whale / V1 taraması: sonuçlar mum kapanışına kadar önbellekte tutulur
+finyx_manager = FinyXScannerManager()
+finyx_cache = CandleCache(max_entries=32, max_age=float('inf'))
+FINYX_SCANNERS = ('lq', 'whale', 'v1')
+
+def load_universe_candles(interval, limit):
+    """Tüm perpetual USDT sembollerinin son mumlarını sembol -> sütunlar olarak getir"""
+    symbols = symbol_universe.perpetual_symbols()
+    candles = {}
+    
+    # Tarayıcı aynı zaman diliminde çalışıyorsa güncel canlı mumlar kullanılır; son mumu mevcut veya
+    # bir önceki bara ait olmayan ya da tohumlaması bitmemiş semboller REST'ten tamamlanır
+    if scanner and scanner.scanning and interval in scanner.timeframes:
+        interval_ms = scanner._get_timeframe_seconds(interval) * 1000
+        current_open = int(time.time() * 1000) // interval_ms * interval_ms
+        with scanner.kline_lock:
+            pending = set(scanner.seed_pending)
+            for symbol, klines in scanner.klines_for(interval).items():
+                last_open = klines.last_open_time
+                if symbol in pending or len(klines) < limit or last_open is None or \
+                        current_open - last_open not in (0, interval_ms):
+                    continue
+                candles[symbol] = tuple(np.array(column[-limit:]) for column in klines.columns())
+    
+    def load(symbol):
+        try:
+            status, data = fetch_klines('futures', symbol, interval, limit)
+            if status != 200:
+                return symbol, None
+            columns = klines_to_columns(data)
+            return symbol, (np.asarray(columns['t'], dtype=np.int64), columns['o'], columns['h'],
+                            columns['l'], columns['c'], columns['v'])
+        except Exception as e:
+            logger.debug(f"{symbol} mumları alınamadı: {e}")
+            return symbol, None
+    
+    missing = [symbol for symbol in symbols if symbol not in candles]
+    candles.update((symbol, columns) for symbol, columns in batch_executor.map(load, missing)
+                   if columns is not None)
+    return candles
+
+def table_snapshot():
+    """Paylaşılan tablodaki sinyal ve durumun anlık görüntüsü (tarayıcı servisi yoksa None)"""
+    snapshot = signal_table.get_signal_snapshot()
+    state = signal_table.get_state()
+    if snapshot is None or state is None:
+        return None
+    version, signals = snapshot
+    signal_list = sorted(signals.values(), key=lambda x: x['timestamp'], reverse=True)
+    return {
+        'epoch': signal_table.epoch,
+        'version': version,
+        'signals': signal_list,
+        'status': state['status'],
+        'active_symbols': state['active_symbols']
+    }
+
+def forward_table_events():
+    """Tablodaki değişimleri bu sürecin SSE yayıncısına aktar (worker başına tek iş parçacığı)"""
+    epoch, version, state = None, 0, None
+    while True:
+        time.sleep(TABLE_POLL_INTERVAL)
+        try:
+            changes = signal_table.get_signal_changes(version, epoch)
+            current = signal_table.get_state()
+            if changes is None or current is None:
+                continue
+            
+            if changes['reset']:
+                # Yeni tarayıcı örneği - istemciler tam listeyi yeniden alır
+                if epoch is not None:
+                    broadcaster.publish('snapshot', table_snapshot())
+            else:
+                for payload in changes['signals']:
+                    broadcaster.publish('signal', payload)
+                for symbol in changes['removed']:
+                    broadcaster.publish('signal_expired', {'symbol': symbol})
+                
+                if state is not None and current['status'] != state['status']:
+                    broadcaster.publish('status', current['status'])
+                if state is not None and current['batch'] and \
+                        (current['batch'] != state['batch'] or current['active_symbols'] != state['active_symbols']):
+                    broadcaster.publish('batch', {**current['batch'], 'symbols': current['active_symbols']})
+            
+            epoch, version, state = changes['epoch'], changes['version'], current
+        except Exception as e:
+            logger.error(f"Sinyal tablosu aktarım hatası: {e}")
+
+def ensure_table_forwarder():
+    """Aktarım iş parçacığını ilk SSE aboneliğinde başlat (fork sonrası her worker'da ayrı)"""
+    global table_forwarder
+    with table_forwarder_lock:
+        if table_forwarder is None:
+            table_forwarder = threading.Thread(target=forward_table_events, daemon=True)
+            table_forwarder.start()
+
+def universe_response(view):
+    """Önceden serileştirilmiş sembol görünümünü ETag ile döndür (If-None-Match eşleşirse 304)"""
+    body, etag = symbol_universe.view(view)
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """Ana sayfa"""
@@ -30,9 +256,26 @@ def start_scanner():
     
     try:
         data = request.get_json() or {}
-        timeframe = data.get('timeframe', '5m')
-        # Batch size sabit 10, kullanıcıdan alınmaz
-        batch_size = 10
+        options = scanner_options(data)
+        
+        if signal_table is not None:
+            # Tarayıcı servisi komutu kontrol dosyasından alır
+            status = signal_table.get_scanning_status()
+            if status is None:
+                return jsonify({
+                    'success': False,
+                    'message': 'Tarayıcı servisi çalışmıyor (scanner_service.py)'
+                })
+            if status.get('scanning'):
+                return jsonify({
+                    'success': False,
+                    'message': 'Tarama zaten aktif'
+                })
+            send_command(SIGNAL_TABLE_PATH, 'start', data)
+            return jsonify({
+                'success': True,
+                'message': f'Tarama başlatılıyor - {", ".join(options["timeframes"] or [options["timeframe"]])} timeframe ile'
+            })
         
         if scanner and scanner.scanning:
             return jsonify({
@@ -41,14 +284,15 @@ def start_scanner():
             })
         
         # Yeni scanner oluştur
-        scanner = BinancePerperualScanner(timeframe=timeframe, batch_size=batch_size)
+        scanner = BinancePerperualScanner(**options, universe=symbol_universe, events=broadcaster.publish,
+                                          store=kline_store)
         scanner.start_scanning()
         
-        logger.info(f"Scanner başlatıldı - Timeframe: {timeframe}, Batch: {batch_size}")
+        logger.info(f"Scanner başlatıldı - Timeframe: {', '.join(scanner.timeframes)}, Batch: {options['batch_size']}, Mod: {scanner.scan_mode}")
         
         return jsonify({
             'success': True,
-            'message': f'Tarama başlatıldı - {timeframe} timeframe ile'
+            'message': f'Tarama başlatıldı - {", ".join(scanner.timeframes)} timeframe ile'
         })
         
     except Exception as e:
@@ -64,6 +308,9 @@ def stop_scanner():
     global scanner
     
     try:
+        if signal_table is not None:
+            send_command(SIGNAL_TABLE_PATH, 'stop')
+        
         if scanner:
             scanner.stop_scanning()
             scanner = None
@@ -83,8 +330,29 @@ def stop_scanner():
 
 @app.route('/api/signals')
 def get_signals():
-    """Aktif sinyalleri getir"""
+    """
+    Aktif sinyalleri getir
+    ?since=<version>&epoch=<epoch> verilirse sadece o sürümden sonraki değişimler döner
+    """
     try:
+        since = request.args.get('since', type=int)
+        if signal_table is not None:
+            # Ayrı tarayıcı servisi: sürüm değişmedikçe okuyucu önbelleğinden döner
+            if since is not None:
+                changes = signal_table.get_signal_changes(since, request.args.get('epoch'))
+                if changes is not None:
+                    return jsonify({'success': True, **changes})
+            else:
+                snapshot = table_snapshot()
+                if snapshot is not None:
+                    return jsonify({
+                        'success': True,
+                        'signals': snapshot['signals'],
+                        'count': len(snapshot['signals']),
+                        'epoch': snapshot['epoch'],
+                        'version': snapshot['version']
+                    })
+        
         if not scanner:
             return jsonify({
                 'success': False,
@@ -92,29 +360,14 @@ def get_signals():
                 'message': 'Scanner aktif değil'
             })
         
-        signals = scanner.get_signals()
+        if since is not None:
+            changes = scanner.get_signal_changes(since, request.args.get('epoch'))
+            return jsonify({'success': True, **changes})
+        
+        version, signals = scanner.get_signal_snapshot()
         
         # Sinyalleri JSON formatına çevir
-        signal_list = []
-        for symbol, signal in signals.items():
-            signal_types = []
-            if signal['buy_signal']:
-                signal_types.append('BUY')
-            if signal['pump_signal']:
-                signal_types.append('PUMP')
-            if signal['sell_signal']:
-                signal_types.append('SELL')
-            
-            signal_list.append({
-                'symbol': symbol,
-                'signals': signal_types,
-                'price': round(signal['price'], 6),
-                'rsi': round(signal['rsi'], 1),
-                'trend': signal['trend'],
-                'volume_status': signal['volume_status'],
-                'price_change': round(signal['price_change'], 2),
-                'timestamp': signal['timestamp'].strftime('%H:%M:%S')
-            })
+        signal_list = [format_signal(symbol, signal) for symbol, signal in signals.items()]
         
         # Son sinyalleri önce göster
         signal_list.sort(key=lambda x: x['timestamp'], reverse=True)
@@ -122,7 +375,9 @@ def get_signals():
         return jsonify({
             'success': True,
             'signals': signal_list,
-            'count': len(signal_list)
+            'count': len(signal_list),
+            'epoch': scanner.epoch,
+            'version': version
         })
         
     except Exception as e:
@@ -133,10 +388,52 @@ def get_signals():
             'message': f'Hata: {str(e)}'
         })
 
+@app.route('/api/stream')
+def stream_events():
+    """
+    Sinyal ve durum olaylarını Server-Sent Events olarak yayınla
+    İlk olay 'snapshot' (mevcut sinyaller + durum), ardından signal / signal_expired / batch / status
+    """
+    subscriber = broadcaster.subscribe()
+    snapshot = None
+    
+    if signal_table is not None:
+        # Tablo değişimleri bu sürecin yayıncısına aktarılır
+        ensure_table_forwarder()
+        snapshot = table_snapshot()
+    elif scanner:
+        version, signals = scanner.get_signal_snapshot()
+        signals = [format_signal(symbol, signal) for symbol, signal in signals.items()]
+        signals.sort(key=lambda x: x['timestamp'], reverse=True)
+        snapshot = {
+            'epoch': scanner.epoch,
+            'version': version,
+            'signals': signals,
+            'status': scanner.get_scanning_status(),
+            'active_symbols': scanner.get_active_symbols()
+        }
+    
+    if snapshot is None:
+        snapshot = {'signals': [], 'status': {'scanning': False}, 'active_symbols': []}
+    
+    response = Response(broadcaster.stream(subscriber, EventBroadcaster.format('snapshot', snapshot)),
+                        mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/api/status')
 def get_status():
     """Tarama durumunu getir"""
     try:
+        state = signal_table.get_state() if signal_table is not None else None
+        if state is not None:
+            return jsonify({
+                'success': True,
+                'status': state['status'],
+                'active_symbols': state['active_symbols']
+            })
+        
         if not scanner:
             return jsonify({
                 'success': True,
@@ -146,7 +443,10 @@ def get_status():
                     'active_symbols': 0,
                     'total_symbols': 0,
                     'signals_count': 0,
-                    'timeframe': 'N/A'
+                    'timeframe': 'N/A',
+                    'scan_mode': 'N/A',
+                    'connections': 0,
+                    'rest_calls_per_minute': 0
                 }
             })
         
@@ -167,13 +467,42 @@ def get_status():
             'message': f'Hata: {str(e)}'
         })
 
+@app.route('/api/cache/stats')
+def get_cache_stats():
+    """Kline önbelleği ve sembol evreni durumunu getir"""
+    return jsonify({
+        'success': True,
+        'klines': candle_cache.stats(),
+        'finyx': finyx_cache.stats(),
+        'store': kline_store.stats(),
+        'symbols': symbol_universe.status()
+    })
+
+@app.route('/api/upstream/stats')
+def get_upstream_stats():
+    """Binance ağırlık kullanımı ve istek kuyruğu durumunu getir"""
+    return jsonify({
+        'success': True,
+        'upstream': upstream.stats()
+    })
+
+@app.route('/api/metrics')
+def get_metrics():
+    """Aşama gecikmeleri, mesaj hızları ve upstream hatalarını Prometheus metin formatında getir"""
+    return app.response_class(registry.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/health')
 def health_check():
     """Sistem sağlık kontrolü"""
+    if signal_table is not None:
+        status = signal_table.get_scanning_status()
+        scanning = bool(status and status.get('scanning'))
+    else:
+        scanning = scanner.scanning if scanner else False
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'scanner_status': scanner.scanning if scanner else False
+        'scanner_status': scanning
     })
 
 @app.route('/api/klines')
@@ -185,17 +514,10 @@ def get_klines():
         limit = request.args.get('limit', '100')
         
         # Binance Spot API'den veri çek
-        url = f"https://api.binance.com/api/v3/klines"
-        params = {
-            'symbol': symbol,
-            'interval': interval,
-            'limit': limit
-        }
-        
-        response = requests.get(url, params=params)
+        status_code, data = fetch_klines('spot', symbol, interval, limit)
         
-        if response.status_code == 200:
-            return jsonify(response.json())
+        if status_code == 200:
+            return jsonify(data)
         else:
             return jsonify({'error': 'Binance API hatası'}), 500
             
@@ -212,10 +534,7 @@ def get_futures_klines():
     
     try:
         # Binance Futures API endpoint'i
-        url = f"https://fapi.binance.com/fapi/v1/klines?symbol={symbol}&interval={interval}&limit={limit}"
-        
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        _, data = fetch_klines('futures', symbol, interval, limit)
         
         # Verileri dönüştür
         candles = []
@@ -247,22 +566,8 @@ def get_futures_klines():
 def get_symbols():
     """Tüm Binance sembollerini getir"""
     try:
-        # Binance Futures API'dan sembolleri çek
-        url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
-        
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        
-        # Sadece USDT çiftlerini filtrele
-        symbols = []
-        for item in data.get('symbols', []):
-            if item.get('status') == 'TRADING' and 'USDT' in item.get('symbol', ''):
-                symbols.append(item.get('symbol'))
-        
-        return jsonify({
-            'success': True,
-            'symbols': symbols
-        })
+        # Sadece işlemdeki USDT çiftleri (paylaşılan exchangeInfo'dan)
+        return universe_response('trading_usdt')
         
     except Exception as e:
         logger.error(f"Sembol listesi alma hatası: {e}")
@@ -280,15 +585,7 @@ def get_candles():
     
     try:
         # Binance Futures API endpoint'i
-        url = f"https://fapi.binance.com/fapi/v1/klines"
-        params = {
-            'symbol': symbol,
-            'interval': interval,
-            'limit': limit
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        _, data = fetch_klines('futures', symbol, interval, limit)
         
         # Verileri dönüştür
         candles = []
@@ -316,28 +613,125 @@ def get_candles():
             'message': f'Hata: {str(e)}'
         }), 500
 
+@app.route('/api/candles/batch', methods=['POST'])
+def get_candles_batch():
+    """
+    Çok sembolün mumlarını tek yanıtta sütun formatında getir
+    Gövde: {"symbols": [...], "interval": "5m", "limit": 100, "market": "futures", "format": "json" | "msgpack"}
+    """
+    try:
+        payload = request.get_json(silent=True) or {}
+        symbols = list(dict.fromkeys(s.replace('_PERP', '').upper() for s in payload.get('symbols', [])))
+        interval = payload.get('interval', '5m')
+        limit = min(int(payload.get('limit', 100)), 1500)
+        market = payload.get('market', 'futures')
+        binary = payload.get('format') == 'msgpack' or 'application/x-msgpack' in request.headers.get('Accept', '')
+        
+        if market not in KLINE_URLS:
+            return jsonify({'success': False, 'message': f'Geçersiz market: {market}'}), 400
+        if interval not in INTERVAL_SECONDS:
+            return jsonify({'success': False, 'message': f'Geçersiz interval: {interval}'}), 400
+        if len(symbols) > BATCH_MAX_SYMBOLS:
+            return jsonify({'success': False, 'message': f'En fazla {BATCH_MAX_SYMBOLS} sembol istenebilir'}), 400
+        if binary and msgpack is None:
+            return jsonify({'success': False, 'message': 'msgpack kurulu değil'}), 400
+        
+        def load(symbol):
+            try:
+                status, data = fetch_klines(market, symbol, interval, limit)
+                if status != 200:
+                    return symbol, None, data.get('msg', f'HTTP {status}') if isinstance(data, dict) else f'HTTP {status}'
+                return symbol, klines_to_columns(data), None
+            except Exception as e:
+                return symbol, None, str(e)
+        
+        candles = {}
+        errors = {}
+        for symbol, columns, error in batch_executor.map(load, symbols):
+            if error is not None:
+                errors[symbol] = error
+            else:
+                candles[symbol] = columns
+        
+        if binary:
+            # Fiyat sütunları little-endian float64, zamanlar int64 ham bayt olarak (JS: Float64Array / BigInt64Array)
+            body = msgpack.packb({
+                'success': True,
+                'interval': interval,
+                'candles': {symbol: {key: np.asarray(column, dtype='<i8' if key == 't' else '<f8').tobytes()
+                                     for key, column in columns.items()}
+                            for symbol, columns in candles.items()},
+                'errors': errors
+            })
+            return app.response_class(body, mimetype='application/x-msgpack')
+        
+        return jsonify({
+            'success': True,
+            'interval': interval,
+            'candles': {symbol: {key: column if key == 't' else column.tolist() for key, column in columns.items()}
+                        for symbol, columns in candles.items()},
+            'errors': errors
+        })
+        
+    except Exception as e:
+        logger.error(f"Toplu mum verisi alma hatası: {e}")
+        return jsonify({
+            'success': False,
+            'message': f'Hata: {str(e)}'
+        }), 500
+
+@app.route('/api/finyx/scan')
+def finyx_scan():
+    """
+    FinyX LQ / Whale / V1 tarayıcılarını tüm perpetual evren üzerinde çalıştır
+    Sorgu: ?interval=15m&limit=100&scanners=lq,whale,v1 - sonuç mum kapanışına kadar önbellekte tutulur
+    """
+    try:
+        interval = request.args.get('interval', '15m')
+        limit = min(int(request.args.get('limit', 100)), 1500)
+        scanners = tuple(name for name in FINYX_SCANNERS
+                         if name in request.args.get('scanners', ','.join(FINYX_SCANNERS)).lower().split(','))
+        
+        if not scanners:
+            return jsonify({'success': False, 'message': 'Geçersiz tarayıcı listesi'}), 400
+        
+        def run():
+            started = time.time()
+            candles = load_universe_candles(interval, limit)
+            if not candles:
+                # Boş sonuç önbelleğe alınmaz
+                return 503, {'message': 'Mum verisi alınamadı'}
+            results = finyx_manager.scan_universe(candles, scanners)
+            return 200, {
+                'results': results,
+                'symbols': len(candles),
+                'scanned_at': datetime.now().isoformat(),
+                'duration_ms': round((time.time() - started) * 1000, 1)
+            }
+        
+        status, payload = finyx_cache.get((interval, limit, scanners), interval, run)
+        if status != 200:
+            return jsonify({'success': False, 'message': payload['message']}), status
+        
+        return jsonify({
+            'success': True,
+            'interval': interval,
+            **payload
+        })
+        
+    except Exception as e:
+        logger.error(f"FinyX tarama hatası: {e}")
+        return jsonify({
+            'success': False,
+            'message': f'Hata: {str(e)}'
+        }), 500
+
 @app.route('/api/futures/symbols')
 def get_futures_symbols():
     """Tüm Binance perpetual futures sembollerini getir"""
     try:
-        # Binance Futures API'den tüm sembolleri getir
-        url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
-        response = requests.get(url)
-        
-        if response.status_code == 200:
-            data = response.json()
-            # Sadece aktif semboller
-            symbols = [{
-                'symbol': s['symbol'],
-                'status': s['status'],
-                'baseAsset': s['baseAsset'],
-                'quoteAsset': s['quoteAsset']
-            } for s in data['symbols'] if s['contractType'] == 'PERPETUAL']
-            
-            logger.info(f"{len(symbols)} perpetual futures sembolü alındı")
-            return jsonify(symbols)
-        else:
-            return jsonify({'error': f'Binance Futures API hatası: {response.status_code}'}), 500
+        # Sadece perpetual kontratlar (paylaşılan exchangeInfo'dan)
+        return universe_response('perpetual')
             
     except Exception as e:
         logger.error(f"Futures sembol listesi hatası: {e}")
@@ -350,18 +744,40 @@ def get_console_messages():
     
     try:
         messages = []
-        
-        if scanner and scanner.scanning:
+        scanning = False
+        
+        if signal_table is not None:
+            # Tarayıcı servisi ayrı süreçte - durum paylaşılan tablodan okunur
+            state = signal_table.get_state()
+            if state is not None and state['status'].get('scanning'):
+                scanning = True
+                status = state['status']
+                scan_mode = status.get('scan_mode')
+                current_batch = status.get('current_batch', 0)
+                total_batches = (state['batch'] or {}).get('total_batches', 0)
+                active_symbols = state['active_symbols']
+        elif scanner and scanner.scanning:
+            scanning = True
+            scan_mode = scanner.scan_mode
+            current_batch = scanner.current_batch
+            total_batches = len(scanner.symbol_batches)
+            active_symbols = scanner.active_symbols
+        
+        if scanning:
             # Aktif batch bilgisi
+            if scan_mode == 'full':
+                message = f'Tüm semboller taranıyor ({len(active_symbols)} coin)'
+            else:
+                message = f'Batch {current_batch + 1}/{total_batches} taranıyor'
             messages.append({
                 'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'message': f'Batch {scanner.current_batch + 1}/{len(scanner.symbol_batches)} taranıyor',
+                'message': message,
                 'type': 'scanning'
             })
             
             # Aktif sembol bilgileri
-            if hasattr(scanner, 'active_symbols') and scanner.active_symbols:
-                for symbol in scanner.active_symbols[-3:]:  # Son 3 sembolü göster
+            if active_symbols:
+                for symbol in active_symbols[-3:]:  # Son 3 sembolü göster
                     messages.append({
                         'timestamp': datetime.now().strftime('%H:%M:%S'),
                         'message': f'{symbol} taranıyor...',
@@ -397,8 +813,12 @@ def proxy_binance(endpoint):
         # Tüm query parametrelerini geçir
         params = request.args.to_dict()
         
+        # exchangeInfo paylaşılan servisten sunulur
+        if base_url == "https://fapi.binance.com/" and endpoint == 'v1/exchangeInfo' and not params:
+            return universe_response('exchange_info')
+        
         # API isteğini yap
-        response = requests.get(url, params=params, timeout=10)
+        response = upstream.get(url, params=params, priority=PRIORITY_CHART, max_wait=CHART_MAX_WAIT)
         
         # Yanıtı döndür
         return jsonify(response.json()), response.status_code
@@ -414,13 +834,7 @@ def proxy_binance(endpoint):
 def get_futures_symbols_proxy():
     """Futures sembolleri için proxy endpoint"""
     try:
-        url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        
-        if 'symbols' in data:
-            return jsonify(data['symbols'])
-        return jsonify([])
+        return universe_response('symbols_full')
     except Exception as e:
         logger.error(f"Futures sembol listesi hatası: {e}")
         return jsonify({
@@ -441,11 +855,10 @@ def get_futures_klines_proxy():
         if not symbol:
             return jsonify({'error': 'Symbol parameter required'}), 400
             
-        # Binance API'sine istek yap
-        url = f"https://fapi.binance.com/fapi/v1/klines?symbol={symbol}&interval={interval}&limit={limit}"
-        response = requests.get(url, timeout=10)
+        # Binance API'sine istek yap (önbellekli)
+        status_code, data = fetch_klines('futures', symbol, interval, limit)
         
-        return jsonify(response.json()), response.status_code
+        return jsonify(data), status_code
     except Exception as e:
         logger.error(f"Futures kline verileri hatası: {e}")
         return jsonify({
@@ -0,0 +1,284 @@
+"""
+FinyXAdvancedSignal için vektörel tam geçmiş backtest'i
+
+Sinyal mantığı her sembolün tüm geçmişi üzerinde tek seferde (mum başına motor çalıştırmadan)
+hesaplanır; her mum sadece kendisine kadarki verilerle değerlendirilir (canlı tarama ile aynı).
+
+Kullanım:
+    python backtest.py --store data/klines --interval 5m --horizons 1 3 12 --workers 4
+    python backtest.py --csv BTCUSDT-5m-2024.csv ETHUSDT-5m-2024.csv --interval 5m --out sonuc.json
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from kline_store import KlineStore
+from trading_signals import FinyXAdvancedSignal
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_TYPES = ('buy', 'pump', 'sell')
+# Canlı motorla aynı ısınma: ilk 199 mumda sinyal üretilmez
+MIN_BARS = 200
+
+_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400}
+
+
+def interval_seconds(interval: str) -> int:
+    """'5m', '1h', '1d' gibi aralıkları saniyeye çevir"""
+    return int(interval[:-1]) * _UNIT_SECONDS[interval[-1]]
+
+
+def load_csv(paths: Sequence[str]) -> Tuple[np.ndarray, ...]:
+    """
+    Aynı sembolün Binance kline CSV dosyalarını (open_time, open, high, low, close, volume, ...) oku
+    Başlık satırları atlanır; satırlar open_time'a göre sıralanır, tekrar eden mumlardan biri tutulur.
+    """
+    rows = []
+    for path in paths:
+        with open(path, newline='') as f:
+            rows.extend(row[:6] for row in csv.reader(f) if row and row[0].strip().isdigit())
+    if not rows:
+        raise ValueError(f"{', '.join(paths)} içinde mum bulunamadı")
+
+    data = np.array(rows, dtype=np.float64)
+    open_times, first = np.unique(data[:, 0].astype(np.int64), return_index=True)
+    data = data[first]
+    return (open_times,) + tuple(np.ascontiguousarray(data[:, i]) for i in range(1, 6))
+
+
+def csv_symbol(path: str) -> str:
+    """'BTCUSDT-5m-2024-01.csv' -> 'BTCUSDT'"""
+    return os.path.basename(path).split('.')[0].split('-')[0].upper()
+
+
+def store_symbols(root: str, interval: str) -> List[str]:
+    """KlineStore dizinindeki sembolleri listele"""
+    directory = os.path.join(root, interval)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name[:-4] for name in os.listdir(directory) if name.endswith('.bin'))
+
+
+def _load_source(source: Tuple[str, Any], interval: str) -> Optional[Tuple[np.ndarray, ...]]:
+    """source: ('store', 'kök dizin:sembol') veya ('csv', [dosya yolları])"""
+    kind, location = source
+    if kind == 'csv':
+        return load_csv(location)
+    root, symbol = location.rsplit(':', 1)
+    columns = KlineStore(root).read(symbol, interval)
+    # memmap görünümlerini işlem bitmeden dosyadan ayır
+    return None if columns is None else tuple(np.array(column) for column in columns)
+
+
+def _empty_stats(horizons: Sequence[int]) -> Dict[str, Any]:
+    return {
+        'count': 0,
+        'valid': {h: 0 for h in horizons},
+        'hits': {h: 0 for h in horizons},
+        'return_sum': {h: 0.0 for h in horizons}
+    }
+
+
+def backtest_symbol(symbol: str, columns: Sequence[np.ndarray], timeframe_seconds: int,
+                    horizons: Sequence[int]) -> Dict[str, Any]:
+    """
+    Tek sembolün tüm geçmişini değerlendir
+    columns: (open_time, open, high, low, close, volume) dizileri
+    Dönüş: {'symbol', 'bars', 'signals': [...], 'stats': {grup -> sayaçlar}}
+    """
+    open_times, opens, highs, lows, closes, volumes = (np.asarray(column) for column in columns)
+    stats: Dict[str, Dict[str, Any]] = {}
+    result = {'symbol': symbol, 'bars': int(len(closes)), 'signals': [], 'stats': stats}
+    if len(closes) < MIN_BARS:
+        return result
+
+    signal = FinyXAdvancedSignal(timeframe_seconds)
+    arrays = signal.signal_arrays(np.asarray(opens, dtype=float), np.asarray(highs, dtype=float),
+                                  np.asarray(lows, dtype=float), np.asarray(closes, dtype=float),
+                                  np.asarray(volumes, dtype=float), causal=True)
+
+    warm = np.arange(len(closes)) >= MIN_BARS - 1
+    fired = {kind: arrays[f'is_{kind}_signal'] & warm for kind in SIGNAL_TYPES}
+    any_signal = np.flatnonzero(fired['buy'] | fired['pump'] | fired['sell'])
+    if len(any_signal) == 0:
+        return result
+
+    # İleri getiriler: close[i + h] / close[i] - 1 (geçmişin sonunu aşanlar NaN)
+    forward = {}
+    for h in horizons:
+        future = np.full(len(closes), np.nan)
+        future[:len(closes) - h] = closes[h:]
+        forward[h] = future / closes - 1
+
+    # Sinyal türü ve o türün koşulları için sayaçlar (alım yönlü türlerde getiri > 0 isabettir)
+    for kind in SIGNAL_TYPES:
+        groups = [(kind, fired[kind])] + [
+            (f'{kind}_condition_{n}', fired[kind] & arrays[f'{kind}_condition_{n}']) for n in (1, 2, 3)
+        ]
+        direction = -1.0 if kind == 'sell' else 1.0
+        for name, mask in groups:
+            entry = stats[name] = _empty_stats(horizons)
+            entry['count'] = int(mask.sum())
+            for h in horizons:
+                returns = forward[h][mask]
+                returns = returns[~np.isnan(returns)]
+                entry['valid'][h] = int(len(returns))
+                entry['hits'][h] = int((returns * direction > 0).sum())
+                entry['return_sum'][h] = float(returns.sum())
+
+    conditions = {name: arrays[name][any_signal] for name in
+                  (f'{kind}_condition_{n}' for kind in SIGNAL_TYPES for n in (1, 2, 3))}
+    flags = {kind: fired[kind][any_signal] for kind in SIGNAL_TYPES}
+    rsi = arrays['rsi'][any_signal]
+    for row, index in enumerate(any_signal.tolist()):
+        result['signals'].append({
+            'symbol': symbol,
+            'open_time': int(open_times[index]),
+            'price': float(closes[index]),
+            'rsi': float(rsi[row]),
+            'types': [kind for kind in SIGNAL_TYPES if flags[kind][row]],
+            'conditions': [name for name, values in conditions.items() if values[row]],
+            'returns': {h: (None if np.isnan(forward[h][index]) else float(forward[h][index]))
+                        for h in horizons}
+        })
+    return result
+
+
+def _backtest_source(symbol: str, source: Tuple[str, Any], interval: str,
+                     horizons: Sequence[int]) -> Dict[str, Any]:
+    """Süreç havuzu görevi: veriyi işçide yükle (büyük diziler süreçler arası taşınmaz)"""
+    columns = _load_source(source, interval)
+    if columns is None:
+        return {'symbol': symbol, 'bars': 0, 'signals': [], 'stats': {}}
+    return backtest_symbol(symbol, columns, interval_seconds(interval), horizons)
+
+
+def merge_stats(results: Sequence[Dict[str, Any]], horizons: Sequence[int]) -> Dict[str, Dict[str, Any]]:
+    """Sembol sayaçlarını birleştirip isabet oranı ve ortalama getiri ekle"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for name, entry in result['stats'].items():
+            total = merged.setdefault(name, _empty_stats(horizons))
+            total['count'] += entry['count']
+            for h in horizons:
+                total['valid'][h] += entry['valid'][h]
+                total['hits'][h] += entry['hits'][h]
+                total['return_sum'][h] += entry['return_sum'][h]
+
+    for total in merged.values():
+        total['hit_rate'] = {h: (total['hits'][h] / total['valid'][h] if total['valid'][h] else None)
+                             for h in horizons}
+        total['avg_return'] = {h: (total['return_sum'][h] / total['valid'][h] if total['valid'][h] else None)
+                               for h in horizons}
+    return merged
+
+
+def run_backtest(sources: Dict[str, Tuple[str, Any]], interval: str, horizons: Sequence[int] = (1, 3, 12),
+                 workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    sources: sembol -> ('store', 'kök:sembol') veya ('csv', [dosya yolları])
+    workers: süreç sayısı (None: CPU sayısı, 1: aynı süreçte)
+    """
+    horizons = sorted(set(int(h) for h in horizons))
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    if workers == 1 or len(sources) == 1:
+        results = [_backtest_source(symbol, source, interval, horizons) for symbol, source in sources.items()]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_backtest_source, symbol, source, interval, horizons)
+                       for symbol, source in sources.items()]
+            results = [future.result() for future in futures]
+
+    signals = [signal for result in results for signal in result['signals']]
+    signals.sort(key=lambda s: (s['open_time'], s['symbol']))
+    return {
+        'interval': interval,
+        'horizons': horizons,
+        'symbols': len(results),
+        'bars': sum(result['bars'] for result in results),
+        'signals': signals,
+        'stats': merge_stats(results, horizons),
+        'duration_ms': round((time.perf_counter() - started) * 1000, 1)
+    }
+
+
+def print_stats(report: Dict[str, Any]):
+    """İstatistik tablosunu yazdır"""
+    horizons = report['horizons']
+    print(f"{report['symbols']} sembol, {report['bars']} mum, {len(report['signals'])} sinyal mumu "
+          f"({report['duration_ms'] / 1000:.1f} sn)")
+    header = f"{'grup':<18} {'adet':>7}" + ''.join(f"  {'isabet@' + str(h):>10} {'ort@' + str(h):>9}"
+                                                 for h in horizons)
+    print(header)
+    for kind in SIGNAL_TYPES:
+        for name in (kind,) + tuple(f'{kind}_condition_{n}' for n in (1, 2, 3)):
+            entry = report['stats'].get(name)
+            if entry is None:
+                continue
+            line = f"{name:<18} {entry['count']:>7}"
+            for h in horizons:
+                hit_rate, avg_return = entry['hit_rate'][h], entry['avg_return'][h]
+                line += "  " + (f"{hit_rate * 100:>9.1f}%" if hit_rate is not None else f"{'-':>10}")
+                line += " " + (f"{avg_return * 100:>8.2f}%" if avg_return is not None else f"{'-':>9}")
+            print(line)
+
+
+def write_signals(report: Dict[str, Any], path: str):
+    """Sinyal mumlarını .csv veya .json olarak yaz"""
+    if path.endswith('.csv'):
+        horizons = report['horizons']
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['symbol', 'open_time', 'price', 'rsi', 'types', 'conditions'] +
+                            [f'return_{h}' for h in horizons])
+            for signal in report['signals']:
+                writer.writerow([signal['symbol'], signal['open_time'], signal['price'], signal['rsi'],
+                                 '|'.join(signal['types']), '|'.join(signal['conditions'])] +
+                                [signal['returns'][h] for h in horizons])
+    else:
+        with open(path, 'w') as f:
+            json.dump(report, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FinyX sinyalleri için tam geçmiş backtest'i")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--store', help='KlineStore kök dizini (ör. data/klines)')
+    source.add_argument('--csv', nargs='+', help='Binance kline CSV dosyaları (SEMBOL-aralık-....csv)')
+    parser.add_argument('--interval', default='5m')
+    parser.add_argument('--symbols', nargs='+', help='Sadece bu semboller')
+    parser.add_argument('--horizons', type=int, nargs='+', default=[1, 3, 12], help='İleri getiri ufukları (mum)')
+    parser.add_argument('--workers', type=int, default=None, help='Süreç sayısı (varsayılan: CPU sayısı)')
+    parser.add_argument('--out', help='Sinyal mumlarını yaz (.csv veya .json)')
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.store:
+        sources = {symbol: ('store', f"{args.store}:{symbol}") for symbol in store_symbols(args.store, args.interval)}
+    else:
+        sources = {}
+        for path in args.csv:
+            sources.setdefault(csv_symbol(path), ('csv', []))[1].append(path)
+    if args.symbols:
+        wanted = {symbol.upper() for symbol in args.symbols}
+        sources = {symbol: source for symbol, source in sources.items() if symbol in wanted}
+    if not sources:
+        parser.error('Değerlendirilecek sembol bulunamadı')
+
+    report = run_backtest(sources, args.interval, args.horizons, args.workers)
+    print_stats(report)
+    if args.out:
+        write_signals(report, args.out)
+        print(f"{len(report['signals'])} sinyal mumu {args.out} dosyasına yazıldı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,640 @@
+"""
+Ağ erişimi olmadan çalışan performans ölçümleri
+
+Kullanım:
+    python benchmark.py replay --symbols 10 100 500 --ticks 20
+    python benchmark.py replay --recording kayit.jsonl.gz
+    python benchmark.py sharding --symbols 300 --ticks 20 --workers 1 2 4
+    python benchmark.py upstream --requests 500 --concurrency 8 --connect-delay 20
+    python benchmark.py weights --requests 120 --limit 100 --window 2
+    python benchmark.py warmstart --symbols 300 --latency 50
+    python benchmark.py matrix --symbols 300 --bars 200
+    python benchmark.py decode --recording kayit.jsonl.gz
+    python benchmark.py table --signals 500 --rate 2000 --readers 1 2 4
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing as mp
+import os
+import resource
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+import pandas as pd
+import requests
+from binance_scanner import BinancePerperualScanner
+from kline_store import KlineStore
+from signal_table import SignalTableReader, SignalTableWriter
+from signal_workers import SignalWorkerPool
+from kline_buffer import KlineRingBuffer
+from stream_decode import decode_kline, orjson
+from stream_replay import ReplayDriver, load_recording
+from trading_signals import FinyXAdvancedSignal
+from upstream import (UpstreamClient, WeightScheduler, request_weight,
+                      PRIORITY_CHART, PRIORITY_SCANNER)
+
+TIMEFRAME_MS = 300_000
+
+
+def generate_stream(symbol_count: int, ticks_per_symbol: int, history: int = 200,
+                    seed: int = 42) -> Tuple[Dict[str, List[tuple]], List[str]]:
+    """
+    Sentetik geçmiş ve combined-stream mesajları üret
+    Dönüş: (sembol -> [(open_time, o, h, l, c, v, is_closed)], ham mesaj listesi)
+    """
+    rng = np.random.default_rng(seed)
+    start = (int(time.time() * 1000) // TIMEFRAME_MS - history) * TIMEFRAME_MS
+    symbols = [f"SYM{i:04d}USDT" for i in range(symbol_count)]
+    seeds: Dict[str, List[tuple]] = {}
+    last_close: Dict[str, float] = {}
+
+    for symbol in symbols:
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, history)))
+        opens = np.r_[closes[0], closes[:-1]]
+        highs = np.maximum(opens, closes) * (1 + np.abs(rng.normal(0, 0.003, history)))
+        lows = np.minimum(opens, closes) * (1 - np.abs(rng.normal(0, 0.003, history)))
+        volumes = rng.lognormal(5, 1, history)
+        seeds[symbol] = [(start + i * TIMEFRAME_MS, opens[i], highs[i], lows[i], closes[i], volumes[i], True)
+                         for i in range(history)]
+        last_close[symbol] = closes[-1]
+
+    # Her sembol için açık mum güncellemeleri, son tick mumu kapatır
+    open_time = start + history * TIMEFRAME_MS
+    messages = []
+    for tick in range(ticks_per_symbol):
+        for symbol in symbols:
+            price = last_close[symbol] * (1 + rng.normal(0, 0.002))
+            messages.append(json.dumps({
+                'stream': f"{symbol.lower()}@kline_5m",
+                'data': {'e': 'kline', 'k': {
+                    's': symbol, 't': open_time, 'o': f"{last_close[symbol]:.6f}",
+                    'h': f"{max(price, last_close[symbol]) * 1.001:.6f}",
+                    'l': f"{min(price, last_close[symbol]) * 0.999:.6f}",
+                    'c': f"{price:.6f}", 'v': f"{rng.lognormal(5, 1):.3f}",
+                    'x': tick == ticks_per_symbol - 1
+                }}
+            }, separators=(',', ':')))
+
+    return seeds, messages
+
+
+def synthetic_recording(symbol_count: int, ticks_per_symbol: int) -> List[Dict[str, Any]]:
+    """generate_stream çıktısını stream_replay kayıt formatına çevir"""
+    seeds, messages = generate_stream(symbol_count, ticks_per_symbol)
+    first_open = next(iter(seeds.values()))[-1][0] + TIMEFRAME_MS
+    records = []
+
+    for symbol, rows in seeds.items():
+        body = [[t, f"{o:.6f}", f"{h:.6f}", f"{l:.6f}", f"{c:.6f}", f"{v:.3f}", t + TIMEFRAME_MS - 1,
+                 "0", 0, "0", "0", "0"] for t, o, h, l, c, v, _ in rows]
+        records.append({'t': first_open, 'k': 'rest', 'u': "https://fapi.binance.com/fapi/v1/klines",
+                        'p': {'symbol': symbol, 'interval': '5m', 'limit': len(rows)}, 'b': body})
+
+    # Mesajlar mum süresine yayılır
+    step = max(1, (TIMEFRAME_MS - 1000) // max(1, len(messages)))
+    for index, message in enumerate(messages):
+        records.append({'t': first_open + 1000 + index * step, 'k': 'ws', 'm': message})
+    return records
+
+
+def _replay_once(records: List[Dict[str, Any]], results) -> None:
+    """Kaydı ayrı süreçte oynat (tepe RSS ölçümü sürece özeldir)"""
+    logging.getLogger().setLevel(logging.WARNING)
+    driver = ReplayDriver(records, pace='fast')
+    scanner = BinancePerperualScanner(symbols=driver.symbols)
+    stats = driver.run(scanner)
+
+    latencies = np.array(driver.publish_latencies) * 1000
+    stats['publish_p50_ms'] = float(np.percentile(latencies, 50)) if len(latencies) else 0.0
+    stats['publish_p99_ms'] = float(np.percentile(latencies, 99)) if len(latencies) else 0.0
+    stats['rebuild_avg_ms'] = stats['rebuild_seconds'] / stats['rebuilds'] * 1000 if stats['rebuilds'] else 0.0
+    stats['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    stats['symbols'] = len(driver.symbols)
+    results.put(stats)
+
+
+def run_replay(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Kaydı yeni bir süreçte oynatıp istatistikleri döndür"""
+    context = mp.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_replay_once, args=(records, results))
+    process.start()
+    stats = results.get()
+    process.join()
+    return stats
+
+
+def bench_replay(args):
+    """Kayıt oynatma: tick/sn, mesaj alımından sinyal yayınına gecikme (p50/p99), motor kurulum maliyeti ve tepe RSS"""
+    if args.recording:
+        suites = [(args.recording, list(load_recording(args.recording)))]
+    else:
+        suites = [(f"{count} sembol", synthetic_recording(count, args.ticks)) for count in args.symbols]
+
+    report = []
+    for name, records in suites:
+        stats = run_replay(records)
+        stats['name'] = name
+        report.append(stats)
+        print(f"{name:>12}: {stats['ticks_per_second']:8.0f} tick/sn | "
+              f"mesaj->yayın p50 {stats['publish_p50_ms']:.3f} ms p99 {stats['publish_p99_ms']:.3f} ms | "
+              f"motor kurulumu {stats['rebuilds']} x {stats['rebuild_avg_ms']:.2f} ms | "
+              f"tepe RSS {stats['peak_rss_mb']:.0f} MB")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+
+def _seed_scanner(scanner: BinancePerperualScanner, seeds: Dict[str, List[tuple]]):
+    """Tek süreç tarayıcısının deposunu sentetik geçmişle doldur"""
+    for symbol, rows in seeds.items():
+        for row in rows:
+            scanner._store_kline(symbol, *row)
+
+
+def bench_sharding(args):
+    """
+    Tek süreç ile N worker süreci arasında tick/sn ölçeklenmesini ölç
+    Kullanılabilir çekirdekten fazla worker ölçülmez - süreçler aynı çekirdeği paylaşır, sonuç ölçeklenme değildir.
+    """
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    seeds, messages = generate_stream(args.symbols, args.ticks)
+    print(f"{args.symbols} sembol, {len(messages)} mesaj, {cores} çekirdek")
+
+    scanner = BinancePerperualScanner(symbols=list(seeds))
+    _seed_scanner(scanner, seeds)
+    started = time.perf_counter()
+    for message in messages:
+        scanner._on_kline_message(None, message)
+    elapsed = time.perf_counter() - started
+    baseline = len(messages) / elapsed
+    print(f"tek süreç      : {baseline:10.0f} tick/sn")
+
+    for workers in args.workers:
+        if workers > cores:
+            print(f"{workers:2d} worker      : atlandı ({cores} çekirdekte ölçeklenme ölçülemez)")
+            continue
+        pool = SignalWorkerPool(workers, 300)
+        try:
+            for symbol, rows in seeds.items():
+                pool.seed(symbol, rows)
+            pool.flush()
+
+            started = time.perf_counter()
+            for i in range(0, len(messages), 1000):
+                pool.submit(messages[i:i + 1000])
+            processed = pool.flush()
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.stop()
+
+        rate = sum(processed.values()) / elapsed
+        print(f"{workers:2d} worker      : {rate:10.0f} tick/sn  (x{rate / baseline:.2f})")
+
+
+def start_stub_server(body: bytes, connect_delay: float = 0.0,
+                      responder: Optional[Callable[[str], Tuple[int, Dict[str, str]]]] = None) -> ThreadingHTTPServer:
+    """
+    Sabit JSON döndüren keep-alive destekli yerel sunucu
+    connect_delay: her yeni bağlantıda beklenen süre (TCP+TLS el sıkışmasını taklit eder)
+    responder: istek yoluna göre (status, ek başlıklar) döndürür - 200 dışında gövde boş JSON'dur
+    """
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Başlık ve gövde tek pakette gitsin (Nagle + gecikmeli ACK keep-alive'da 40 ms ekler)
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            if connect_delay:
+                time.sleep(connect_delay)
+            super().setup()
+
+        def do_GET(self):
+            status, headers = responder(self.path) if responder else (200, {})
+            payload = body if status == 200 else b'{}'
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def _measure_http(get, url: str, count: int, concurrency: int) -> Dict[str, float]:
+    """count isteği concurrency thread ile gönder, istek/sn ve gecikme yüzdeliklerini döndür"""
+    def timed(_):
+        started = time.perf_counter()
+        get(url, params={'symbol': 'BTCUSDT', 'interval': '5m', 'limit': 200}).json()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        latencies = np.array(list(executor.map(timed, range(count)))) * 1000
+    elapsed = time.perf_counter() - started
+    return {
+        'requests_per_second': count / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99))
+    }
+
+
+def bench_upstream(args):
+    """İstek başına yeni bağlantı (requests.get) ile havuzlu istemciyi yerel sunucuda karşılaştır"""
+    seeds, _ = generate_stream(1, 0)
+    rows = next(iter(seeds.values()))
+    body = json.dumps([[t, f"{o:.6f}", f"{h:.6f}", f"{l:.6f}", f"{c:.6f}", f"{v:.3f}", t + TIMEFRAME_MS - 1,
+                        "0", 0, "0", "0", "0"] for t, o, h, l, c, v, _ in rows]).encode()
+    server = start_stub_server(body, args.connect_delay / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}/fapi/v1/klines"
+    print(f"{args.requests} istek, {args.concurrency} eşzamanlı, bağlantı gecikmesi {args.connect_delay} ms, "
+          f"yanıt {len(body) / 1024:.0f} KB")
+
+    client = UpstreamClient(pool_size=args.concurrency, http2=False)
+    try:
+        suites = [
+            ('requests.get', lambda url, params: requests.get(url, params=params, timeout=10)),
+            ('UpstreamClient', client.get)
+        ]
+        for name, get in suites:
+            stats = _measure_http(get, url, args.requests, args.concurrency)
+            print(f"{name:>15}: {stats['requests_per_second']:8.0f} istek/sn | "
+                  f"p50 {stats['p50_ms']:.2f} ms | p99 {stats['p99_ms']:.2f} ms")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+class WeightLimitedStub:
+    """Binance ağırlık başlıklarını ve 429 + Retry-After davranışını taklit eden sayaç"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.window_start = 0.0
+        self.used = 0
+        self.served = 0
+        self.rejected = 0
+        self.peak = 0
+
+    def __call__(self, path: str) -> Tuple[int, Dict[str, str]]:
+        parts = urlsplit(path)
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        weight = request_weight(parts.path, params)
+
+        with self.lock:
+            now = time.time()
+            window_start = now - now % self.window
+            if window_start != self.window_start:
+                self.window_start, self.used = window_start, 0
+
+            if self.used + weight > self.limit:
+                self.rejected += 1
+                retry_after = max(1, int(np.ceil(self.window_start + self.window - now)))
+                return 429, {'Retry-After': str(retry_after), 'X-MBX-USED-WEIGHT-1M': str(self.used)}
+
+            self.used += weight
+            self.served += 1
+            self.peak = max(self.peak, self.used)
+            return 200, {'X-MBX-USED-WEIGHT-1M': str(self.used)}
+
+
+def bench_weights(args):
+    """Ağırlık limitli yerel sunucuda zamanlayıcısız ve zamanlayıcılı istemciyi karşılaştır"""
+    body = b'[]'
+    params = {'symbol': 'BTCUSDT', 'interval': '5m', 'limit': 200}
+    weight = request_weight('/fapi/v1/klines', params)
+    print(f"{args.requests} istek (ağırlık {weight}), limit {args.limit} / {args.window:g} sn, "
+          f"{args.concurrency} eşzamanlı")
+
+    # Zamanlayıcısız: istekler doğrudan gönderilir
+    stub = WeightLimitedStub(args.limit, args.window)
+    server = start_stub_server(body, responder=stub)
+    url = f"http://127.0.0.1:{server.server_address[1]}/fapi/v1/klines"
+    session = requests.Session()
+    session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=args.concurrency))
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as executor:
+            list(executor.map(lambda _: session.get(url, params=params, timeout=10), range(args.requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        session.close()
+        server.shutdown()
+    print(f"{'zamanlayıcısız':>15}: {stub.served:4d} başarılı | {stub.rejected:4d} x 429 | {elapsed:.2f} sn")
+
+    # Zamanlayıcılı: yarısı tarayıcı, yarısı grafik önceliğinde
+    stub = WeightLimitedStub(args.limit, args.window)
+    server = start_stub_server(body, responder=stub)
+    url = f"http://127.0.0.1:{server.server_address[1]}/fapi/v1/klines"
+    host = urlsplit(url).netloc
+    scheduler = WeightScheduler(limits={host: args.limit}, window=args.window)
+    client = UpstreamClient(pool_size=args.concurrency, http2=False, scheduler=scheduler)
+    latencies: Dict[int, List[float]] = {PRIORITY_SCANNER: [], PRIORITY_CHART: []}
+
+    def send(index):
+        priority = PRIORITY_SCANNER if index % 2 == 0 else PRIORITY_CHART
+        request_started = time.perf_counter()
+        client.get(url, params=params, priority=priority)
+        latencies[priority].append(time.perf_counter() - request_started)
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as executor:
+            list(executor.map(send, range(args.requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        client.close()
+        server.shutdown()
+
+    print(f"{'zamanlayıcılı':>15}: {stub.served:4d} başarılı | {stub.rejected:4d} x 429 | {elapsed:.2f} sn | "
+          f"tepe kullanım %{stub.peak / args.limit * 100:.0f}")
+    print(f"{'':>15}  ortalama gecikme: tarayıcı {np.mean(latencies[PRIORITY_SCANNER]) * 1000:.0f} ms, "
+          f"grafik {np.mean(latencies[PRIORITY_CHART]) * 1000:.0f} ms")
+
+
+def _start_with_rest_stub(seeds: Dict[str, List[tuple]], latency: float,
+                          store: Optional[KlineStore]) -> Dict[str, float]:
+    """Tarayıcıyı taklit REST ile tohumla ve ilk sinyal değerlendirmesine kadar geçen süreyi ölç"""
+    counters = {'calls': 0, 'weight': 0}
+    lock = threading.Lock()
+
+    def rest_get(url, params=None):
+        time.sleep(latency)
+        with lock:
+            counters['calls'] += 1
+            counters['weight'] += request_weight(urlsplit(url).path, params)
+        rows = seeds[params['symbol']][-params['limit']:]
+        return [[row[0], str(row[1]), str(row[2]), str(row[3]), str(row[4]), str(row[5]),
+                 row[0] + TIMEFRAME_MS - 1, '0', 0, '0', '0', '0'] for row in rows]
+
+    started = time.perf_counter()
+    scanner = BinancePerperualScanner(symbols=list(seeds), store=store)
+    scanner._rest_get = rest_get
+    asyncio.run(scanner._seed_symbols(scanner.perpetual_symbols))
+    for symbol in scanner.perpetual_symbols:
+        scanner._analyze_signals(symbol)
+    counters['seconds'] = time.perf_counter() - started
+    return counters
+
+
+def bench_warmstart(args):
+    """Disk deposu olmadan ve depoyla yeniden başlatmada ilk sinyale kadar geçen süre ve REST ağırlığı"""
+    seeds, _ = generate_stream(args.symbols, 0)
+    print(f"{args.symbols} sembol, 200 mum geçmiş, REST gecikmesi {args.latency:g} ms")
+
+    with tempfile.TemporaryDirectory() as root:
+        cold = _start_with_rest_stub(seeds, args.latency / 1000, None)
+        # İlk çalıştırma depoyu doldurur; ikinci çalıştırma yeniden başlatmadır
+        _start_with_rest_stub(seeds, args.latency / 1000, KlineStore(root))
+        warm = _start_with_rest_stub(seeds, args.latency / 1000, KlineStore(root))
+
+    for name, stats in (('REST tohumlama', cold), ('disk deposu', warm)):
+        print(f"{name:>15}: {stats['seconds']:6.2f} sn | {stats['calls']:5d} REST çağrısı | "
+              f"ağırlık {stats['weight']}")
+
+
+def bench_matrix(args):
+    """Evren değerlendirmesi: sembol başına calculate_signals döngüsü ve tek matris geçişi"""
+    seeds, _ = generate_stream(args.symbols, 0, history=args.bars)
+    matrices = [np.array([[row[column] for row in rows] for rows in seeds.values()]) for column in range(1, 6)]
+    frames = [pd.DataFrame(dict(zip(('open', 'high', 'low', 'close', 'volume'), (m[i] for m in matrices))))
+              for i in range(args.symbols)]
+    detector = FinyXAdvancedSignal(TIMEFRAME_MS // 1000)
+    print(f"{args.symbols} sembol x {args.bars} mum, en iyi {args.repeat} ölçüm")
+
+    def best(run):
+        durations = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = run()
+            durations.append(time.perf_counter() - started)
+        return min(durations), result
+
+    loop_time, loop_results = best(lambda: [detector.calculate_signals(frame) for frame in frames])
+    batch_time, batch_results = best(lambda: detector.calculate_signals_batch(*matrices))
+    mismatches = sum(a != b for a, b in zip(loop_results, batch_results))
+
+    for name, seconds in (('sembol döngüsü', loop_time), ('matris geçişi', batch_time)):
+        print(f"{name:>15}: {seconds * 1000:8.1f} ms | sembol başına {seconds / args.symbols * 1e6:8.1f} µs")
+    print(f"{'hızlanma':>15}: {loop_time / batch_time:.1f}x | farklı sonuç: {mismatches}")
+
+
+def _decode_baseline(message: str) -> Tuple[str, Dict[str, Any]]:
+    """Önceki yol: json.loads + Timestamp + mum başına sözlük"""
+    data = json.loads(message)
+    data = data.get('data', data)
+    kline = data['k']
+    return kline['s'], {
+        'timestamp': pd.to_datetime(kline['t'], unit='ms'),
+        'open': float(kline['o']),
+        'high': float(kline['h']),
+        'low': float(kline['l']),
+        'close': float(kline['c']),
+        'volume': float(kline['v']),
+        'is_closed': kline['x']
+    }
+
+
+def _binance_payload(message: str) -> str:
+    """Sentetik mesajı Binance combined-stream payload'unun tüm alanlarıyla yeniden yaz"""
+    data = json.loads(message)
+    kline = data['data']['k']
+    full = {
+        't': kline['t'], 'T': kline['t'] + TIMEFRAME_MS - 1, 's': kline['s'], 'i': '5m',
+        'f': 100, 'L': 200, 'o': kline['o'], 'c': kline['c'], 'h': kline['h'], 'l': kline['l'],
+        'v': kline['v'], 'n': 100, 'x': kline['x'], 'q': '1000.0000', 'V': '500.000', 'Q': '500.0000', 'B': '0'
+    }
+    data['data'] = {'e': 'kline', 'E': kline['t'] + 1000, 's': kline['s'], 'k': full}
+    return json.dumps(data, separators=(',', ':'))
+
+
+def bench_decode(args):
+    """Stream mesajı çözme: mesaj/sn (sadece çözme ve depoya yazma dahil)"""
+    if args.recording:
+        messages = [record['m'] for record in load_recording(args.recording) if record['k'] == 'ws']
+    else:
+        _, messages = generate_stream(args.symbols, args.ticks)
+        messages = [_binance_payload(message) for message in messages]
+    messages = [message for message in messages if '"k":' in message]
+    print(f"{len(messages)} kline mesajı, orjson {'kurulu' if orjson is not None else 'kurulu değil'}")
+
+    def baseline():
+        for message in messages:
+            _decode_baseline(message)
+
+    def make_fast(parser):
+        buffers: Dict[str, KlineRingBuffer] = {}
+
+        def run():
+            for message in messages:
+                row = decode_kline(message, parser)
+                klines = buffers.get(row[0])
+                if klines is None:
+                    klines = buffers[row[0]] = KlineRingBuffer(200)
+                klines.append(*row[1:8])
+        return run
+
+    cases = [('önceki (json + Timestamp + dict)', baseline),
+             ('json -> tuple -> depo', make_fast(json.loads))]
+    if orjson is not None:
+        cases.append(('orjson -> tuple -> depo', make_fast(orjson.loads)))
+
+    baseline_rate = None
+    for name, run in cases:
+        seconds = min(_timed(run) for _ in range(args.repeat))
+        rate = len(messages) / seconds
+        baseline_rate = baseline_rate or rate
+        print(f"{name:>34}: {rate:10.0f} mesaj/sn | mesaj başına {seconds / len(messages) * 1e6:6.2f} µs | "
+              f"{rate / baseline_rate:.1f}x")
+
+
+def _timed(run: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def _table_writer(path: str, keys: int, rate: float, ready, stop) -> None:
+    """Tarayıcı servisi gibi tabloya sabit hızda sinyal yaz"""
+    writer = SignalTableWriter(path)
+    writer.reset('benchmark')
+    writer.set_state(status={'scanning': True, 'signals_count': keys}, active_symbols=[f"S{i}" for i in range(keys)])
+    index = 0
+    ready.set()
+    while not stop.is_set():
+        writer.heartbeat()
+        for _ in range(50):
+            index += 1
+            symbol = f"S{index % keys}"
+            writer.publish(symbol, {'symbol': symbol, 'signals': ['BUY'], 'price': float(index), 'rsi': 35.0,
+                                    'trend': 'Yatay', 'volume_status': 'Yüksek', 'price_change': 1.0,
+                                    'timestamp': '00:00:00'})
+        time.sleep(50 / rate)
+    writer.close()
+
+
+def _table_reader(path: str, seconds: float, results) -> None:
+    """/api/signals + /api/status ile aynı okuma ve serileştirme işini tekrarla"""
+    reader = SignalTableReader(path)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        version, signals = reader.get_signal_snapshot()
+        json.dumps({'signals': sorted(signals.values(), key=lambda x: x['timestamp'], reverse=True),
+                    'version': version})
+        json.dumps(reader.get_state())
+        count += 1
+    results.put(count)
+
+
+def bench_table(args):
+    """Paylaşılan sinyal tablosu: yazar sürecine karşı okuyucu süreç sayısıyla okuma/sn"""
+    context = mp.get_context('spawn')
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/signal_table.bin"
+        ready, stop = context.Event(), context.Event()
+        writer = context.Process(target=_table_writer, args=(path, args.signals, args.rate, ready, stop))
+        writer.start()
+        ready.wait()
+        print(f"{args.signals} sinyal, yazar {args.rate:.0f} güncelleme/sn")
+
+        base = None
+        for count in args.readers:
+            results = context.Queue()
+            readers = [context.Process(target=_table_reader, args=(path, args.seconds, results))
+                       for _ in range(count)]
+            for process in readers:
+                process.start()
+            total = sum(results.get() for _ in readers) / args.seconds
+            for process in readers:
+                process.join()
+            base = base or total / count
+            print(f"{count:2d} okuyucu: {total:10.0f} okuma/sn  (x{total / base:.2f})")
+
+        stop.set()
+        writer.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binance Trading Signals performans ölçümleri")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    replay = subparsers.add_parser('replay', help='Kayıt oynatma ölçümleri')
+    replay.add_argument('--symbols', type=int, nargs='+', default=[10, 100, 500])
+    replay.add_argument('--ticks', type=int, default=20)
+    replay.add_argument('--recording', help='Gerçek kayıt dosyası (stream_replay.py record)')
+    replay.add_argument('--json', action='store_true', help='Sonuçları JSON olarak da yazdır')
+    replay.set_defaults(func=bench_replay)
+
+    sharding = subparsers.add_parser('sharding', help='Süreç havuzu ölçeklenmesi')
+    sharding.add_argument('--symbols', type=int, default=300)
+    sharding.add_argument('--ticks', type=int, default=20)
+    sharding.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    sharding.set_defaults(func=bench_sharding)
+
+    upstream = subparsers.add_parser('upstream', help='Havuzlu HTTP istemcisi ölçümü (yerel sunucu)')
+    upstream.add_argument('--requests', type=int, default=500)
+    upstream.add_argument('--concurrency', type=int, default=8)
+    upstream.add_argument('--connect-delay', type=float, default=20.0,
+                          help='Yeni bağlantı başına gecikme (ms) - TLS el sıkışmasını taklit eder')
+    upstream.set_defaults(func=bench_upstream)
+
+    weights = subparsers.add_parser('weights', help='Ağırlık zamanlayıcısı (429 taklitli yerel sunucu)')
+    weights.add_argument('--requests', type=int, default=120)
+    weights.add_argument('--concurrency', type=int, default=32)
+    weights.add_argument('--limit', type=int, default=100, help='Pencere başına ağırlık limiti')
+    weights.add_argument('--window', type=float, default=2.0, help='Ağırlık penceresi (sn)')
+    weights.set_defaults(func=bench_weights)
+
+    warmstart = subparsers.add_parser('warmstart', help='Disk deposuyla yeniden başlatma süresi')
+    warmstart.add_argument('--symbols', type=int, default=300)
+    warmstart.add_argument('--latency', type=float, default=50.0, help='REST çağrısı başına gecikme (ms)')
+    warmstart.set_defaults(func=bench_warmstart)
+
+    matrix = subparsers.add_parser('matrix', help='Evren değerlendirmesi: sembol döngüsü ve matris geçişi')
+    matrix.add_argument('--symbols', type=int, default=300)
+    matrix.add_argument('--bars', type=int, default=200)
+    matrix.add_argument('--repeat', type=int, default=3)
+    matrix.set_defaults(func=bench_matrix)
+
+    decode = subparsers.add_parser('decode', help='Stream mesajı çözme hızı (önceki / json / orjson)')
+    decode.add_argument('--recording', help='Gerçek kayıt dosyası (stream_replay.py record)')
+    decode.add_argument('--symbols', type=int, default=300)
+    decode.add_argument('--ticks', type=int, default=50)
+    decode.add_argument('--repeat', type=int, default=3)
+    decode.set_defaults(func=bench_decode)
+
+    table = subparsers.add_parser('table', help='Paylaşılan sinyal tablosu okuma ölçeklenmesi')
+    table.add_argument('--signals', type=int, default=500)
+    table.add_argument('--rate', type=float, default=2000.0, help='Yazarın saniyedeki sinyal güncellemesi')
+    table.add_argument('--readers', type=int, nargs='+', default=[1, 2, 4])
+    table.add_argument('--seconds', type=float, default=2.0)
+    table.set_defaults(func=bench_table)
+
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,245 @@
 import asyncio
-import websocket
-import json
+import heapq
+import itertools
+import websockets
+import queue
+import random
 import threading
 import time
-from typing import Dict, List, Any, Optional
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import requests
-from trading_signals import FinyXAdvancedSignal
+from trading_signals import FinyXAdvancedSignal, FinyXStreamingSignal
+from signal_workers import SignalWorkerPool
+from kline_buffer import KlineRingBuffer
+from timeframe_aggregator import TimeframeAggregator
+from tick_scheduler import TickScheduler
+from stream_decode import decode_kline
+from metrics import STAGE_SECONDS, EVENT_TO_SIGNAL_SECONDS, STREAM_MESSAGES, STREAM_RECONNECTS
+from symbol_universe import EXCHANGE_INFO_URL, PRIORITY_COINS
+from upstream import shared_client as upstream, PRIORITY_SCANNER
 import logging
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Taban stream'inden üretilebilen zaman dilimleri (UTC'ye hizalı kovalar)
+AGGREGATABLE_TIMEFRAMES = ('1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d')
+
+def format_signal(symbol: str, signal: Dict[str, Any]) -> Dict[str, Any]:
+    """Sinyali API / olay formatına çevir"""
+    signal_types = []
+    if signal['buy_signal']:
+        signal_types.append('BUY')
+    if signal['pump_signal']:
+        signal_types.append('PUMP')
+    if signal['sell_signal']:
+        signal_types.append('SELL')
+    
+    return {
+        'symbol': symbol,
+        'signals': signal_types,
+        'price': round(signal['price'], 6),
+        'rsi': round(signal['rsi'], 1),
+        'trend': signal['trend'],
+        'volume_status': signal['volume_status'],
+        'price_change': round(signal['price_change'], 2),
+        'timestamp': signal['timestamp'].strftime('%H:%M:%S'),
+        **({'timeframe': signal['timeframe']} if 'timeframe' in signal else {})
+    }
+
+def scanner_options(data: Dict[str, Any]) -> Dict[str, Any]:
+    """start_scanner gövdesini (veya servis komutunu) tarayıcı parametrelerine çevir"""
+    return {
+        'timeframe': data.get('timeframe', '5m'),
+        # Çoklu zaman dilimi: timeframe taban stream olur, bu liste bellekte üretilir (ör. ["1m", "5m", "15m", "1h"])
+        'timeframes': data.get('timeframes') or None,
+        # Batch size sabit 10, kullanıcıdan alınmaz
+        'batch_size': 10,
+        # 'rotation' (varsayılan) veya 'full' - tüm semboller sürekli
+        'scan_mode': data.get('scan_mode', 'rotation'),
+        # 'tick' (varsayılan) veya 'close' - sadece mum kapanışlarında tüm evren tek geçişte
+        'evaluation': data.get('evaluation', 'tick'),
+        # Açık mum tick'leri sembol başına bu aralıkta (sn) en fazla bir kez değerlendirilir (0: her tick)
+        'coalesce_interval': float(data.get('coalesce_interval', 0.25))
+    }
+
+
 class BinancePerperualScanner:
     """
     Binance Perpetual Future coinlerini WebSocket ile tarayan sistem
     Pine Script sinyallerini tespit eder
     """
     
-    def __init__(self, timeframe: str = "5m", batch_size: int = 10):
+    # Binance USDⓈ-M futures: bağlantı başına en fazla 200 stream
+    MAX_STREAMS_PER_CONNECTION = 200
+    STREAM_BASE_URL = "wss://fstream.binance.com/stream"
+    
+    def __init__(self, timeframe: str = "5m", batch_size: int = 10, scan_mode: str = "rotation",
+                 workers: int = 0, symbols: Optional[List[str]] = None, recorder=None,
+                 universe=None, events: Optional[Callable[[str, Any], None]] = None,
+                 timeframes: Optional[List[str]] = None, store=None, evaluation: str = "tick",
+                 coalesce_interval: float = 0.25):
+        """
+        scan_mode: 'rotation' - batch'ler 10 saniyede bir değişir (düşük kaynak)
+                   'full'     - tüm semboller sabit bağlantı havuzu ile sürekli dinlenir
+        workers: > 1 ise sinyal değerlendirmesi bu kadar sürece tutarlı hash ile bölünür (deneysel, varsayılan kapalı)
+        symbols: verilirse exchangeInfo yerine bu sembol listesi taranır
+        recorder: stream_replay.StreamRecorder - ham stream ve REST yanıtlarını kaydeder
+        universe: symbol_universe.SymbolUniverse - verilirse sembol listesi paylaşılan servisten alınır
+        events: events(event, data) - signal / signal_expired / batch / status olaylarını alır (SSE yayıncısı)
+        timeframes: verilirse timeframe taban aralık olarak dinlenir, bu zaman dilimlerinin mumları
+                    bellekte üretilir ve her biri ayrı değerlendirilir (sinyal anahtarı 'BTCUSDT@15m')
+        store: kline_store.KlineStore - kapanmış mumlar diske eklenir, başlangıçta geçmiş buradan
+               yüklenir ve REST'ten sadece son mumdan bu yana eksik kalanlar çekilir
+        evaluation: 'tick'  - her tick sembolün artımlı motoruyla değerlendirilir
+                    'close' - sadece mum kapanışlarında, kapanan tüm semboller tek matris geçişinde
+                              değerlendirilir (büyük evrende düşük CPU, açık mum sinyali yok)
+        coalesce_interval: açık mum tick'leri sembol başına bu aralıkta (sn) en fazla bir kez,
+                           en güncel durumla değerlendirilir; kapanışlar beklemeden işlenir (0: her tick)
+        """
         self.timeframe = timeframe
         self.batch_size = batch_size
+        self.scan_mode = scan_mode if scan_mode in ("rotation", "full") else "rotation"
+        self.workers = workers if workers > 1 else 0
+        self.evaluation = evaluation if evaluation in ("tick", "close") else "tick"
         self.timeframe_seconds = self._get_timeframe_seconds(timeframe)
         
         # Logger
         self.logger = logger
         
+        # Çoklu zaman dilimi: tek taban stream'inden üretilen üst zaman dilimleri
+        self.timeframes = list(dict.fromkeys(timeframes)) if timeframes else [timeframe]
+        self.multi_timeframe = self.timeframes != [timeframe]
+        unsupported = [tf for tf in self.timeframes if tf not in AGGREGATABLE_TIMEFRAMES]
+        if self.multi_timeframe and unsupported:
+            raise ValueError(f"Desteklenmeyen zaman dilimi: {', '.join(unsupported)}")
+        self.aggregators: Dict[str, TimeframeAggregator] = {
+            tf: TimeframeAggregator(self.timeframe_seconds, self._get_timeframe_seconds(tf))
+            for tf in self.timeframes if tf != timeframe
+        }
+        if self.multi_timeframe and self.workers:
+            self.logger.warning("Çoklu zaman dilimi modunda sinyaller süreç havuzu olmadan değerlendirilir")
+            self.workers = 0
+        if self.evaluation == "close" and self.workers:
+            self.logger.warning("Kapanış değerlendirmesi süreç havuzu olmadan yapılır")
+            self.workers = 0
+        
         # Sinyal tespit sistemi
         self.signal_detector = FinyXAdvancedSignal(self.timeframe_seconds)
         
+        # Sembol başına artımlı sinyal motorları
+        self.signal_engines: Dict[str, FinyXStreamingSignal] = {}
+        
+        # Kapanış değerlendirmesi: taban mum open_time -> kapanışı gelen semboller.
+        # Tüm aktif semboller kapanınca veya close_sweep_delay dolunca tek geçişte değerlendirilir.
+        self.close_pending: Dict[int, set] = {}
+        self.close_handles: Dict[int, asyncio.TimerHandle] = {}
+        self.close_sweep_delay = 2.0
+        self.close_sweeps = 0
+        self.last_close_sweep: Optional[Dict[str, Any]] = None
+        
+        # Açık mum tick birleştirme - event loop'ta _tick_evaluator görevi işler
+        self.tick_scheduler = TickScheduler(coalesce_interval) \
+            if coalesce_interval > 0 and self.evaluation == "tick" else None
+        self.tick_wakeup: Optional[asyncio.Event] = None
+        
+        # Süreç havuzu (workers > 1) - her worker kendi kline ve gösterge durumunu tutar
+        self.worker_pool: Optional[SignalWorkerPool] = None
+        self.delta_thread: Optional[threading.Thread] = None
+        self.last_kline_times: Dict[str, int] = {}
+        
         # Veri depolama
-        self.kline_data: Dict[str, List[Dict]] = {}
+        self.kline_data: Dict[str, KlineRingBuffer] = {}
+        # Taban depo en büyük kovanın tamamını tutabilmeli (Binance kline limiti 1500)
+        self.max_klines = min(1500, max([200] + [a.bars_per_bucket for a in self.aggregators.values()]))
+        self.kline_lock = threading.Lock()
         self.signals: Dict[str, Dict] = {}
+        self.signals_lock = threading.Lock()
+        
+        # Sürümlü sinyal günlüğü: (version, symbol, sinyal | None) - ?since= istekleri buradan cevaplanır
+        self.epoch = uuid.uuid4().hex[:12]
+        self.signal_version = 0
+        self.signal_log: List[tuple] = []
+        self.signal_log_size = 5000
+        self.signal_recorded: Dict[str, float] = {}
+        self.signal_refresh_seconds = 30.0
+        
+        # Zamanlayıcılı sinyal süresi: (expires_at, symbol) min-heap, sembol başına tek kayıt
+        self.signal_ttl = 300.0
+        self.signal_expiry: Dict[str, float] = {}
+        self.expiry_heap: List[tuple] = []
+        self.expiry_scheduled = set()
         self.active_symbols = []
-        self.ws_connections: Dict[str, websocket.WebSocketApp] = {}
+        
+        # asyncio ingestion çekirdeği - tüm stream bağlantıları tek event loop'ta
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self.ingestion_task: Optional[asyncio.Task] = None
+        self.message_queue: Optional[asyncio.Queue] = None
+        self.queue_size = 10000
+        self.ws_connections: Dict[str, asyncio.Task] = {}
+        self.connected_streams = set()
+        self.reconnect_min_delay = 1.0
+        self.reconnect_max_delay = 60.0
+        
+        # Aşama ölçümleri - sıcak yolda histogram alt serileri doğrudan kullanılır
+        self.stage_metrics = {stage: STAGE_SECONDS.labels(stage) for stage in
+                              ('receive', 'decode', 'store', 'indicators', 'conditions', 'publish')}
+        self.event_lag = EVENT_TO_SIGNAL_SECONDS.labels()
+        self.event_times: Dict[str, int] = {}
         
         # Kontrol değişkenleri
         self.scanning = False
         self.current_batch = 0
         
-        # Binance Perpetual sembollerini al
-        self.perpetual_symbols = self._get_perpetual_symbols()
+        # REST çağrı sayacı (son 60 saniye)
+        self.rest_call_times = deque()
+        
+        # Saat ve kayıt - replay sırasında kaydedilmiş zaman ve yanıtlar kullanılır
+        self.clock = time.time
+        self.recorder = recorder
+        self.universe = universe
+        self.store = store
+        
+        # Olay yayını (signal, signal_expired, batch, status)
+        self.events = events
+        self.status_interval = 2.0
+        
+        # Geçmiş tohumlama: sınırlı paralellik, önce abone olunan semboller önce yüklenir.
+        # Tohumlanmayı bekleyen sembollerin stream mumları bekletilir, tohum bitince işlenir.
+        self.seed_parallelism = 8
+        self.seed_executor: Optional[ThreadPoolExecutor] = None
+        self.seed_queue: Optional[asyncio.PriorityQueue] = None
+        self.seed_tasks: List[asyncio.Task] = []
+        self.seed_sequence = itertools.count()
+        self.seed_pending: Dict[str, List[tuple]] = {}
+        self.seed_futures: Dict[str, asyncio.Future] = {}
+        self.seeded_symbols = set()
+        self.seed_in_flight = 0
+        self.seed_failed = 0
+        
+        # Sembol listesi verilmediyse exchangeInfo event loop'ta (start_scanning'i bekletmeden) alınır
+        self.perpetual_symbols: List[str] = []
+        self.symbol_batches: List[List[str]] = []
+        self.symbols_ready = False
+        if symbols:
+            self._set_symbols(list(symbols))
+    
+    def _set_symbols(self, symbols: List[str]):
+        """Taranacak sembolleri ve batch'leri ayarla"""
+        self.perpetual_symbols = symbols
         self.logger.info(f"Toplam {len(self.perpetual_symbols)} perpetual sembol bulundu")
         
         # Symbol batch'lerini oluştur
         self.symbol_batches = self._create_symbol_batches()
         self.logger.info(f"{len(self.symbol_batches)} batch oluşturuldu")
+        self.symbols_ready = True
         
     def _get_timeframe_seconds(self, timeframe: str) -> int:
         """Timeframe'i saniyeye çevir"""
@@ -71,9 +262,11 @@ class BinancePerperualScanner:
     def _get_perpetual_symbols(self) -> List[str]:
         """Binance Perpetual Future sembollerini al"""
         try:
-            url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
-            response = requests.get(url, timeout=10)
-            data = response.json()
+            if self.universe is not None:
+                return self.universe.perpetual_symbols()
+            
+            url = EXCHANGE_INFO_URL
+            data = self._rest_get(url)
             
             symbols = []
             for symbol_info in data['symbols']:
@@ -83,8 +276,7 @@ class BinancePerperualScanner:
                     symbols.append(symbol_info['symbol'])
             
             # Popüler coinleri öncelikle al
-            priority_symbols = [s for s in symbols if any(coin in s for coin in 
-                              ['BTC', 'ETH', 'BNB', 'ADA', 'DOT', 'LINK', 'SOL', 'MATIC', 'AVAX', 'ATOM'])]
+            priority_symbols = [s for s in symbols if any(coin in s for coin in PRIORITY_COINS)]
             
             other_symbols = [s for s in symbols if s not in priority_symbols]
             
@@ -107,18 +299,40 @@ class BinancePerperualScanner:
             batches.append(batch)
         return batches
     
-    def _get_historical_klines(self, symbol: str, limit: int = 200) -> Optional[pd.DataFrame]:
-        """Geçmiş kline verilerini al"""
+    def _record_rest_call(self):
+        """REST çağrısını sayaca işle"""
+        self.rest_call_times.append(time.time())
+    
+    def _rest_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """REST isteği yap, sayaca işle ve kayıt açıksa yanıtı kaydet"""
+        self._record_rest_call()
+        # Tarayıcı tohumlaması grafik isteklerinden önce gönderilir
+        response = upstream.get(url, params=params, priority=PRIORITY_SCANNER)
+        data = response.json()
+        
+        if self.recorder:
+            self.recorder.record_rest(url, params, data)
+        return data
+    
+    def get_rest_calls_per_minute(self) -> int:
+        """Son 60 saniyedeki REST çağrı sayısını döndür"""
+        cutoff = time.time() - 60
+        while self.rest_call_times and self.rest_call_times[0] < cutoff:
+            self.rest_call_times.popleft()
+        return len(self.rest_call_times)
+    
+    def _get_historical_klines(self, symbol: str, limit: int = 200,
+                               interval: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Geçmiş kline verilerini al (interval verilmezse taban zaman dilimi)"""
         try:
             url = "https://fapi.binance.com/fapi/v1/klines"
             params = {
                 'symbol': symbol,
-                'interval': self.timeframe,
+                'interval': interval or self.timeframe,
                 'limit': limit
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            data = self._rest_get(url, params)
             
             if not data:
                 return None
@@ -133,58 +347,208 @@ class BinancePerperualScanner:
             # Veri tiplerini düzelt
             for col in ['open', 'high', 'low', 'close', 'volume']:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
-                
+            
+            # Kapanış zamanı geçmemiş mum hâlâ açıktır
+            df['is_closed'] = df['close_time'].astype('int64') < int(self.clock() * 1000)
+            df['open_time'] = df['timestamp'].astype('int64')
             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
             
-            return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            return df[['timestamp', 'open_time', 'open', 'high', 'low', 'close', 'volume', 'is_closed']]
             
         except Exception as e:
             self.logger.error(f"{symbol} için geçmiş veri alınamadı: {e}")
             return None
     
+    def _missing_bar_count(self, symbol: str) -> int:
+        """Depodaki son mumdan bu yana eksik mum sayısını döndür"""
+        last_time = self.last_kline_times.get(symbol)
+        if last_time is None:
+            return self.max_klines
+        
+        last_open = last_time / 1000
+        elapsed_bars = int((self.clock() - last_open) // self.timeframe_seconds)
+        return min(elapsed_bars, self.max_klines)
+    
+    def _seed_history(self, symbol: str):
+        """
+        Sembol geçmişini bir kez yükle (önce diskteki depodan, yoksa REST'ten)
+        Depo güncelse çağrı yapılmaz, boşluk varsa sadece eksik mumlar çekilir
+        """
+        if self.store is not None and symbol not in self.last_kline_times:
+            self._load_from_store(symbol)
+        
+        missing = self._missing_bar_count(symbol)
+        
+        # Üst zaman dilimleri sadece ilk yüklemede veya taban depoyu aşan boşlukta REST'ten alınır;
+        # sonrasında taban mumlarından üretilir
+        for timeframe, aggregator in self.aggregators.items():
+            if missing >= self.max_klines or symbol not in aggregator.buffers:
+                historical_df = self._get_historical_klines(symbol, aggregator.capacity + 1, timeframe)
+                if historical_df is not None:
+                    with self.kline_lock:
+                        aggregator.seed(symbol, self._kline_rows(historical_df))
+        
+        if missing == 0:
+            return
+        
+        # Son kapanmış mum depoda, eksik olan sadece açık mum - stream ilk mesajda getirir
+        klines = self.kline_data.get(symbol)
+        if missing == 1 and klines is not None and not klines.has_open:
+            return
+        
+        # Son depolanan mum da güncellensin diye bir mum fazla iste
+        limit = self.max_klines if missing >= self.max_klines else missing + 1
+        historical_df = self._get_historical_klines(symbol, limit)
+        if historical_df is None:
+            return
+        
+        rows = self._kline_rows(historical_df)
+        if self.worker_pool:
+            # Geçmiş, sembolün sahibi olan worker'da tutulur
+            self.worker_pool.seed(symbol, rows)
+            self.last_kline_times[symbol] = rows[-1][0]
+            if self.store is not None:
+                closed = [row for row in rows if row[6]]
+                if closed:
+                    self.store.append(symbol, self.timeframe, *(np.array(column) for column in list(zip(*closed))[:6]))
+            return
+        
+        for row in rows:
+            self._store_kline(symbol, *row, persist=False)
+        
+        if self.store is not None:
+            self._persist_closed(symbol)
+    
+    def _load_from_store(self, symbol: str):
+        """Kapanmış mumları diskteki depodan yükle - REST'e sadece aradaki boşluk kalır"""
+        columns = self.store.read(symbol, self.timeframe, self.max_klines)
+        if columns is None:
+            return
+        
+        if self.worker_pool:
+            rows = [row + (True,) for row in zip(*(column.tolist() for column in columns))]
+            self.worker_pool.seed(symbol, rows)
+            self.last_kline_times[symbol] = rows[-1][0]
+            return
+        
+        with self.kline_lock:
+            klines = self.kline_data[symbol] = KlineRingBuffer(self.max_klines)
+            klines.load(*columns)
+            self.last_kline_times[symbol] = klines.last_open_time
+            first_open_time = int(klines.open_times[klines.start])
+            
+            for timeframe, aggregator in self.aggregators.items():
+                stored = self.store.read(symbol, timeframe, aggregator.capacity)
+                # Sonraki kovalar taban depodan üretilebiliyorsa diskteki seri kullanılır
+                if stored is not None and int(stored[0][-1]) + aggregator.period_ms >= first_open_time:
+                    aggregator.load(symbol, stored)
+    
+    def _unpersisted_rows(self, symbol: str) -> List[Tuple[str, Tuple[np.ndarray, ...]]]:
+        """
+        Sembolün depoda olmayan kapanmış mumlarının kopyası: [(aralık, sütunlar)]
+        kline_lock altında çağrılır; sadece depodaki son mumdan yeni satırlar kopyalanır
+        """
+        series = [(self.timeframe, self.kline_data.get(symbol))] + \
+            [(timeframe, aggregator.buffers.get(symbol)) for timeframe, aggregator in self.aggregators.items()]
+        pending = []
+        for interval, klines in series:
+            if klines is None or not klines.closed_count:
+                continue
+            open_times = klines.column('open_time', include_open=False)
+            last = self.store.last_open_time(symbol, interval)
+            first = 0 if last is None else int(np.searchsorted(open_times, last, side='right'))
+            if first < len(open_times):
+                pending.append((interval, tuple(np.array(column[first:])
+                                                for column in klines.columns(include_open=False))))
+        return pending
+    
+    def _write_closed(self, symbol: str, pending: List[Tuple[str, Tuple[np.ndarray, ...]]]):
+        """_unpersisted_rows çıktısını diske ekle (kline_lock dışında çağrılır)"""
+        for interval, columns in pending:
+            self.store.append(symbol, interval, *columns)
+    
+    def _persist_closed(self, symbol: str):
+        """Sembolün yeni kapanmış mumlarını diskteki depoya ekle"""
+        with self.kline_lock:
+            pending = self._unpersisted_rows(symbol)
+        self._write_closed(symbol, pending)
+    
+    def _kline_rows(self, historical_df: pd.DataFrame) -> List[tuple]:
+        """DataFrame'i (open_time, o, h, l, c, v, is_closed) satırlarına çevir"""
+        return list(zip(historical_df['open_time'].tolist(), historical_df['open'].tolist(),
+                        historical_df['high'].tolist(), historical_df['low'].tolist(),
+                        historical_df['close'].tolist(), historical_df['volume'].tolist(),
+                        historical_df['is_closed'].tolist()))
+    
+    def _store_kline(self, symbol: str, open_time: int, open_price: float, high: float,
+                     low: float, close: float, volume: float, is_closed: bool, persist: bool = True):
+        """
+        Mumu sembol deposuna yaz (aynı açılış zamanı varsa güncellenir, eski mumlar yok sayılır)
+        Mum kapandıysa ve disk deposu varsa yeni kapanmış mumlar diske eklenir (lock dışında)
+        """
+        pending = None
+        with self.kline_lock:
+            klines = self.kline_data.get(symbol)
+            if klines is None:
+                klines = self.kline_data[symbol] = KlineRingBuffer(self.max_klines)
+            
+            if klines.append(open_time, open_price, high, low, close, volume, is_closed):
+                self.last_kline_times[symbol] = klines.last_open_time
+                
+                # Üst zaman dilimi kovalarını güncelle
+                for aggregator in self.aggregators.values():
+                    aggregator.update(symbol, open_time, open_price, high, low, close, volume, is_closed, klines)
+                
+                if persist and is_closed and self.store is not None:
+                    pending = self._unpersisted_rows(symbol)
+        
+        if pending:
+            self._write_closed(symbol, pending)
+    
     def _on_kline_message(self, ws, message):
         """WebSocket kline mesajını işle"""
         try:
-            data = json.loads(message)
+            # Combined stream mesajı tek tuple'a çözülür (ara sözlük ve Timestamp yok)
+            started = time.perf_counter()
+            row = decode_kline(message)
+            decoded = time.perf_counter()
+            self.stage_metrics['decode'].observe(decoded - started)
+            if row is None:
+                return
+            symbol, open_time, is_closed = row[0], row[1], row[7]
+            if row[8]:
+                self.event_times[symbol] = row[8]
             
-            if 'k' in data:
-                kline = data['k']
-                symbol = kline['s']
-                
-                # Hem kapalı hem de mevcut açık mumu işle
-                kline_data = {
-                    'timestamp': pd.to_datetime(kline['t'], unit='ms'),
-                    'open': float(kline['o']),
-                    'high': float(kline['h']),
-                    'low': float(kline['l']),
-                    'close': float(kline['c']),
-                    'volume': float(kline['v']),
-                    'is_closed': kline['x']  # Kapanmış mı?
-                }
-                
-                # Veriyi sakla
-                if symbol not in self.kline_data:
-                    self.kline_data[symbol] = []
-                
-                # Eğer kapalı mum ise listeye ekle
-                if kline['x']:  # is_closed
-                    self.kline_data[symbol].append(kline_data)
-                    
-                    # Maksimum 200 mum tut
-                    if len(self.kline_data[symbol]) > 200:
-                        self.kline_data[symbol] = self.kline_data[symbol][-200:]
-                
-                # Mevcut açık mum için son elemanı güncelle
+            held = self.seed_pending.get(symbol)
+            if held is not None:
+                # Geçmiş henüz yüklenmedi - mum tohumlama bitince işlenir
+                if held and held[-1][0] == open_time:
+                    held[-1] = row[1:8]
                 else:
-                    # Eğer liste boş değilse ve son eleman açık bir mum ise güncelle
-                    if self.kline_data[symbol] and not self.kline_data[symbol][-1].get('is_closed', True):
-                        self.kline_data[symbol][-1] = kline_data
-                    else:
-                        # Yeni açık mum ekle
-                        self.kline_data[symbol].append(kline_data)
-                
-                # Her durumda sinyal analizi yap (gerçek zamanlı)
-                self._analyze_signals(symbol)
+                    held.append(row[1:8])
+                return
+            
+            # Veriyi sakla - hem kapalı hem de mevcut açık mum işlenir,
+            # açık mum aynı açılış zamanlı kaydın üzerine yazılır
+            self._store_kline(*row[:8])
+            self.stage_metrics['store'].observe(time.perf_counter() - decoded)
+            
+            if self.evaluation == "close":
+                # Kapanan mumlar evren taramasında toplu değerlendirilir
+                if is_closed:
+                    self._on_candle_close(symbol, open_time)
+                return
+            
+            if self.tick_wakeup is not None and not is_closed:
+                # Açık mum: sembol kirli işaretlenir, değerlendirme zamanlayıcıya kalır
+                if self.tick_scheduler.mark(symbol):
+                    self.tick_wakeup.set()
+                return
+            
+            # Kapanan mum sırayı beklemeden değerlendirilir (motor kapanışı işlemeli)
+            self._analyze_signals(symbol)
+            if self.tick_scheduler is not None:
+                self.tick_scheduler.ran(symbol)
                     
         except Exception as e:
             self.logger.error(f"Kline mesajı işlenirken hata: {e}")
@@ -197,83 +561,481 @@ class BinancePerperualScanner:
         """WebSocket kapatıldığında"""
         self.logger.info("WebSocket bağlantısı kapatıldı")
     
+    def _signal_key(self, symbol: str, timeframe: str) -> str:
+        """Sinyal anahtarı - çoklu zaman diliminde 'BTCUSDT@15m'"""
+        return f"{symbol}@{timeframe}" if self.multi_timeframe else symbol
+    
+    def klines_for(self, timeframe: str) -> Dict[str, KlineRingBuffer]:
+        """Zaman diliminin sembol -> mum deposu sözlüğünü döndür"""
+        if timeframe == self.timeframe:
+            return self.kline_data
+        return self.aggregators[timeframe].buffers
+    
+    def _get_signal_engine(self, key: str, klines: KlineRingBuffer,
+                           timeframe_seconds: int) -> FinyXStreamingSignal:
+        """
+        Anahtarın artımlı motorunu döndür
+        Motor yoksa veya depoda boşluk oluştuysa yeniden kurulur (kural: FinyXStreamingSignal.for_buffer)
+        """
+        engine = FinyXStreamingSignal.for_buffer(self.signal_engines.get(key), klines, timeframe_seconds)
+        self.signal_engines[key] = engine
+        return engine
+    
     def _analyze_signals(self, symbol: str):
-        """Belirtilen sembol için sinyal analizi yap"""
-        try:
-            if symbol not in self.kline_data or len(self.kline_data[symbol]) < 100:
-                return
-            
-            # DataFrame oluştur
-            df = pd.DataFrame(self.kline_data[symbol])
-            
-            # Geçmiş verilerle birleştir
-            historical_df = self._get_historical_klines(symbol, 100)
-            if historical_df is not None:
-                # Son 100 kayıtla birleştir
-                recent_data = df.tail(50)  # Son 50 real-time veri
-                combined_df = pd.concat([historical_df.tail(150), recent_data], ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['timestamp'], keep='last')
-            else:
-                combined_df = df
-            
-            # Sinyal tespiti
-            signals = self.signal_detector.calculate_signals(combined_df)
-            
-            # Sinyal durumunu kontrol et ve kaydet
-            signals['symbol'] = symbol
-            signals['timestamp'] = datetime.now()
-            
-            if any([signals['buy_signal'], signals['pump_signal'], signals['sell_signal']]):
-                # Sinyal VAR - kaydet
-                self.signals[symbol] = signals
+        """Belirtilen sembol için her zaman diliminde sinyal analizi yap"""
+        for timeframe in self.timeframes:
+            try:
+                klines = self.klines_for(timeframe).get(symbol)
+                if klines is None or len(klines) < 100:
+                    continue
                 
-                # Sinyal logla
-                signal_type = []
-                if signals['buy_signal']:
-                    signal_type.append("BUY 🛒")
-                if signals['pump_signal']:
-                    signal_type.append("PUMP 💥")
-                if signals['sell_signal']:
-                    signal_type.append("SELL 🚨")
+                # Sinyal tespiti - artımlı motor sadece son mumu işler
+                key = self._signal_key(symbol, timeframe)
+                timeframe_seconds = self._get_timeframe_seconds(timeframe)
+                with self.kline_lock:
+                    engine = self._get_signal_engine(key, klines, timeframe_seconds)
+                    signals = dict(engine.update(*klines.last()))
+                self._observe_evaluation(engine.last_timing)
                 
-                self.logger.info(f"🎯 {symbol}: {' + '.join(signal_type)} | "
-                          f"Fiyat: ${signals['price']:.4f} | "
-                          f"RSI: {signals['rsi']:.1f} | "
-                          f"Trend: {signals['trend']}")
-            else:
-                # Sinyal YOK - ancak durumu kaydet
-                if symbol in self.signals:
-                    # Eski sinyali sil
-                    del self.signals[symbol]
+                if self.multi_timeframe:
+                    signals['timeframe'] = timeframe
+                self._publish_signal(key, signals)
                 
-        except Exception as e:
-            self.logger.error(f"{symbol} sinyal analizi hatası: {e}")
+            except Exception as e:
+                self.logger.error(f"{symbol} {timeframe} sinyal analizi hatası: {e}")
+        
+        self._observe_event_lag(symbol)
+    
+    def _observe_evaluation(self, timing: tuple):
+        """Son değerlendirmenin gösterge / koşul sürelerini kaydet"""
+        self.stage_metrics['indicators'].observe(timing[0])
+        self.stage_metrics['conditions'].observe(timing[1])
+    
+    def _observe_event_lag(self, symbol: str):
+        """Sembolün son borsa olay zamanından sinyal değerlendirmesine geçen süreyi kaydet"""
+        event_time = self.event_times.get(symbol)
+        if event_time:
+            self.event_lag.observe(max(0.0, self.clock() - event_time / 1000))
+    
+    def _on_candle_close(self, symbol: str, open_time: int):
+        """
+        Kapanan taban mumunu evren taramasına ekle
+        Tüm aktif semboller kapanınca hemen, aksi halde ilk kapanıştan close_sweep_delay sonra taranır.
+        Event loop dışında (replay) bekleyen eski taramalar daha yeni bir kapanış gelince çalıştırılır.
+        """
+        pending = self.close_pending.get(open_time)
+        if pending is None:
+            pending = self.close_pending[open_time] = set()
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                self.close_handles[open_time] = loop.call_later(self.close_sweep_delay,
+                                                                self._close_sweep, open_time)
+            else:
+                for older in [t for t in self.close_pending if t < open_time]:
+                    self._close_sweep(older)
+        pending.add(symbol)
+        
+        expected = len(self.active_symbols) or len(self.kline_data)
+        if len(pending) >= expected:
+            self._close_sweep(open_time)
     
-    def _start_websocket_for_symbols(self, symbols: List[str]):
-        """Belirtilen semboller için WebSocket başlat"""
+    def _close_sweep(self, open_time: int):
+        """open_time'lı taban mumu kapanan sembolleri her zaman diliminde tek matris geçişinde değerlendir"""
+        symbols = self.close_pending.pop(open_time, None)
+        handle = self.close_handles.pop(open_time, None)
+        if handle is not None:
+            handle.cancel()
         if not symbols:
             return
+        
+        started = time.perf_counter()
+        close_ms = open_time + self.timeframe_seconds * 1000
+        evaluated = 0
+        
+        for timeframe in self.timeframes:
+            period_ms = self._get_timeframe_seconds(timeframe) * 1000
+            if close_ms % period_ms:
+                # Bu zaman diliminin mumu henüz kapanmadı
+                continue
+            bar_open_time = close_ms - period_ms
+            
+            try:
+                # Aynı uzunluktaki geçmişler tek matriste (kopya lock altında alınır)
+                groups: Dict[int, List[str]] = {}
+                matrices = {}
+                with self.kline_lock:
+                    buffers = self.klines_for(timeframe)
+                    for symbol in symbols:
+                        klines = buffers.get(symbol)
+                        if klines is None or klines.closed_count < 100 or \
+                                klines.column('open_time', include_open=False)[-1] != bar_open_time:
+                            continue
+                        groups.setdefault(klines.closed_count, []).append(symbol)
+                    for length, members in groups.items():
+                        matrices[length] = [
+                            np.vstack([buffers[symbol].column(column, include_open=False) for symbol in members])
+                            for column in KlineRingBuffer.COLUMNS
+                        ]
+                
+                detector = self.signal_detector if timeframe == self.timeframe else \
+                    FinyXAdvancedSignal(period_ms // 1000)
+                for length, members in groups.items():
+                    results = detector.calculate_signals_batch(*matrices[length])
+                    self._observe_evaluation(detector.last_timing)
+                    for symbol, signals in zip(members, results):
+                        if self.multi_timeframe:
+                            signals['timeframe'] = timeframe
+                        self._publish_signal(self._signal_key(symbol, timeframe), signals)
+                    evaluated += len(members)
+                    
+            except Exception as e:
+                self.logger.error(f"{timeframe} kapanış taraması hatası: {e}")
+        
+        for symbol in symbols:
+            self._observe_event_lag(symbol)
+        
+        self.close_sweeps += 1
+        self.last_close_sweep = {
+            'open_time': open_time,
+            'symbols': len(symbols),
+            'evaluated': evaluated,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+    
+    def _emit(self, event: str, data: Any):
+        """Olayı yayıncıya ilet (yayıncı hatası taramayı durdurmaz)"""
+        if self.events is None:
+            return
+        try:
+            self.events(event, data)
+        except Exception as e:
+            self.logger.error(f"Olay yayınlanamadı ({event}): {e}")
+    
+    def _publish_signal(self, symbol: str, signals: Dict[str, Any]):
+        """Sinyali yayınla (publish aşaması süresi ölçülür)"""
+        started = time.perf_counter()
+        try:
+            self._apply_signal(symbol, signals)
+        finally:
+            self.stage_metrics['publish'].observe(time.perf_counter() - started)
+    
+    def _apply_signal(self, symbol: str, signals: Dict[str, Any]):
+        """Sinyal sonucunu aktif sinyallere yaz veya sinyal kalktıysa sil"""
+        # Sinyal durumunu kontrol et ve kaydet
+        signals['symbol'] = symbol
+        signals['timestamp'] = datetime.now()
+        
+        if any([signals['buy_signal'], signals['pump_signal'], signals['sell_signal']]):
+            # Sinyal VAR - kaydet, süresini uzat
+            now = self.clock()
+            flags = (signals['buy_signal'], signals['pump_signal'], signals['sell_signal'])
+            with self.signals_lock:
+                previous = self.signals.get(symbol)
+                self.signals[symbol] = signals
+                self.signal_expiry[symbol] = now + self.signal_ttl
+                if symbol not in self.expiry_scheduled:
+                    self.expiry_scheduled.add(symbol)
+                    heapq.heappush(self.expiry_heap, (now + self.signal_ttl, symbol))
+                
+                # Yeni sinyal, tip değişimi veya periyodik tazeleme günlüğe yazılır
+                changed = previous is None or \
+                    flags != (previous['buy_signal'], previous['pump_signal'], previous['sell_signal']) or \
+                    now - self.signal_recorded.get(symbol, now) >= self.signal_refresh_seconds
+                if changed:
+                    payload = format_signal(symbol, signals)
+                    self._record_signal_change(symbol, payload, now)
+            
+            if not changed:
+                return
+            self._emit('signal', payload)
             
+            # Sinyal logla
+            signal_type = []
+            if signals['buy_signal']:
+                signal_type.append("BUY 🛒")
+            if signals['pump_signal']:
+                signal_type.append("PUMP 💥")
+            if signals['sell_signal']:
+                signal_type.append("SELL 🚨")
+            
+            self.logger.info(f"🎯 {symbol}: {' + '.join(signal_type)} | "
+                      f"Fiyat: ${signals['price']:.4f} | "
+                      f"RSI: {signals['rsi']:.1f} | "
+                      f"Trend: {signals['trend']}")
+        else:
+            # Sinyal YOK - eski sinyali sil
+            self._remove_signal(symbol)
+    
+    def _record_signal_change(self, symbol: str, payload: Optional[Dict[str, Any]], now: float):
+        """Değişimi sürümlü günlüğe ekle (signals_lock altında çağrılır)"""
+        self.signal_version += 1
+        self.signal_log.append((self.signal_version, symbol, payload))
+        if payload is None:
+            self.signal_recorded.pop(symbol, None)
+        else:
+            self.signal_recorded[symbol] = now
+        
+        # Günlüğü amortize O(1) kırp
+        if len(self.signal_log) > 2 * self.signal_log_size:
+            del self.signal_log[:-self.signal_log_size]
+    
+    def _remove_signal(self, symbol: str):
+        """Aktif sinyali sil ve kalktığını yayınla"""
+        with self.signals_lock:
+            removed = self.signals.pop(symbol, None)
+            if removed is not None:
+                self.signal_expiry.pop(symbol, None)
+                self._record_signal_change(symbol, None, self.clock())
+        if removed is not None:
+            self._emit('signal_expired', {'symbol': symbol})
+    
+    def _expire_due(self) -> int:
+        """Süresi dolan sinyalleri heap'ten sil - sadece vadesi gelen kayıtlara dokunur"""
+        now = self.clock()
+        expired = []
+        
+        with self.signals_lock:
+            while self.expiry_heap and self.expiry_heap[0][0] <= now:
+                _, symbol = heapq.heappop(self.expiry_heap)
+                expires_at = self.signal_expiry.get(symbol)
+                
+                if expires_at is None:
+                    # Sinyal bu arada kalkmış
+                    self.expiry_scheduled.discard(symbol)
+                elif expires_at > now:
+                    # Sinyal güncellenmiş - yeni vadeyle tekrar sıraya koy
+                    heapq.heappush(self.expiry_heap, (expires_at, symbol))
+                else:
+                    self.expiry_scheduled.discard(symbol)
+                    del self.signal_expiry[symbol]
+                    self.signals.pop(symbol, None)
+                    self._record_signal_change(symbol, None, now)
+                    expired.append(symbol)
+        
+        for symbol in expired:
+            self._emit('signal_expired', {'symbol': symbol})
+        return len(expired)
+    
+    async def _expiry_timer(self):
+        """En yakın vadeye kadar uyuyup süresi dolan sinyalleri temizle"""
+        while True:
+            self._expire_due()
+            with self.signals_lock:
+                delay = self.expiry_heap[0][0] - self.clock() if self.expiry_heap else 1.0
+            await asyncio.sleep(min(max(delay, 0.05), 1.0))
+    
+    def _start_websocket_for_symbols(self, symbols: List[str], key: str = 'current') -> Optional[asyncio.Task]:
+        """Belirtilen semboller için stream bağlantı görevini başlat (event loop içinden çağrılır)"""
+        if not symbols:
+            return None
+        
+        task = asyncio.create_task(self._stream_connection(key, symbols))
+        self.ws_connections[key] = task
+        return task
+    
+    async def _stream_connection(self, key: str, symbols: List[str]):
+        """Combined stream bağlantısını sürdür, koparsa artan bekleme ile yeniden bağlan"""
         # Stream adlarını oluştur
         streams = [f"{symbol.lower()}@kline_{self.timeframe}" for symbol in symbols]
-        stream_url = f"wss://fstream.binance.com/stream?streams={'/'.join(streams)}"
+        stream_url = f"{self.STREAM_BASE_URL}?streams={'/'.join(streams)}"
+        delay = self.reconnect_min_delay
+        received = STREAM_MESSAGES.labels(key)
         
-        self.logger.info(f"WebSocket başlatılıyor: {len(symbols)} sembol")
-        
-        ws = websocket.WebSocketApp(
-            stream_url,
-            on_message=self._on_kline_message,
-            on_error=self._on_websocket_error,
-            on_close=self._on_websocket_close
-        )
+        while True:
+            try:
+                self.logger.info(f"WebSocket başlatılıyor: {len(symbols)} sembol")
+                async with websockets.connect(stream_url, ping_interval=20, ping_timeout=20) as ws:
+                    self.connected_streams.add(key)
+                    delay = self.reconnect_min_delay
+                    
+                    # Kuyruk doluysa bekle - analiz aşaması geri basınç uygular
+                    # Kuyruğa alınma zamanı receive aşaması (kuyrukta bekleme) için mesajla taşınır
+                    async for message in ws:
+                        received.inc()
+                        if self.recorder:
+                            self.recorder.record_message(message)
+                        await self.message_queue.put((time.perf_counter(), message))
+                        
+                self._on_websocket_close(ws, ws.close_code, ws.close_reason)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_websocket_error(None, e)
+            finally:
+                self.connected_streams.discard(key)
+            
+            # Jitter'lı üstel geri çekilme
+            STREAM_RECONNECTS.labels(key).inc()
+            wait = delay * (1 + random.random() * 0.25)
+            self.logger.warning(f"{key} bağlantısı {wait:.1f} sn sonra yeniden kurulacak")
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, self.reconnect_max_delay)
+    
+    async def _analysis_worker(self):
+        """Kuyruktaki mesajları sırayla işle - paylaşılan durum sadece bu görevden yazılır"""
+        receive = self.stage_metrics['receive']
+        while True:
+            received, message = await self.message_queue.get()
+            receive.observe(time.perf_counter() - received)
+            
+            if self.worker_pool:
+                # Bekleyen mesajları toplayıp worker'lara parti halinde yönlendir
+                messages = [message]
+                while not self.message_queue.empty() and len(messages) < 1000:
+                    received, message = self.message_queue.get_nowait()
+                    receive.observe(time.perf_counter() - received)
+                    messages.append(message)
+                self.worker_pool.submit(messages)
+                continue
+            
+            self._on_kline_message(None, message)
+    
+    async def _tick_evaluator(self):
+        """Kirli sembolleri zamanları gelince en güncel mumlarıyla değerlendir"""
+        scheduler = self.tick_scheduler
+        while True:
+            for index, symbol in enumerate(scheduler.pop_due()):
+                self._analyze_signals(symbol)
+                if index % 50 == 49:
+                    # Uzun listede mesaj işleyicisine sıra ver
+                    await asyncio.sleep(0)
+            
+            self.tick_wakeup.clear()
+            due = scheduler.next_due()
+            timeout = None if due is None else max(0.0, due - scheduler.clock())
+            try:
+                await asyncio.wait_for(self.tick_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _collect_worker_deltas(self):
+        """Worker'lardan gelen sinyal değişimlerini tek sinyal görünümünde birleştir"""
+        while self.scanning and self.worker_pool:
+            try:
+                deltas = self.worker_pool.get_deltas(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            
+            for symbol, result in deltas:
+                if result is None:
+                    self._remove_signal(symbol)
+                else:
+                    self._publish_signal(symbol, result)
+    
+    def _request_seed(self, symbols: List[str], priority: int = 0) -> List[asyncio.Future]:
+        """
+        Sembolleri tohumlama kuyruğuna ekle (küçük öncelik ve önce eklenen önce yüklenir)
+        Tohumlama bitene kadar sembolün stream mumları bekletilir. Tamamlanma future'ları döner.
+        """
+        if self.seed_queue is None:
+            self.seed_queue = asyncio.PriorityQueue()
+            self.seed_executor = ThreadPoolExecutor(max_workers=self.seed_parallelism,
+                                                    thread_name_prefix='seed')
+            self.seed_tasks = [asyncio.create_task(self._seed_worker()) for _ in range(self.seed_parallelism)]
         
-        # WebSocket'i thread'de çalıştır
-        wst = threading.Thread(target=ws.run_forever)
-        wst.daemon = True
-        wst.start()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for symbol in symbols:
+            future = self.seed_futures.get(symbol)
+            if future is None:
+                future = self.seed_futures[symbol] = loop.create_future()
+                self.seed_pending[symbol] = []
+                self.seed_queue.put_nowait((priority, next(self.seed_sequence), symbol))
+            futures.append(future)
+        return futures
+    
+    async def _seed_worker(self):
+        """Kuyruktaki sembolleri sırayla tohumla - REST çağrıları upstream ağırlık bütçesinden geçer"""
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, symbol = await self.seed_queue.get()
+            self.seed_in_flight += 1
+            try:
+                await loop.run_in_executor(self.seed_executor, self._seed_history, symbol)
+                self.seeded_symbols.add(symbol)
+            except Exception as e:
+                self.seed_failed += 1
+                self.logger.error(f"{symbol} geçmişi yüklenemedi: {e}")
+            finally:
+                self.seed_in_flight -= 1
+            self._go_live(symbol)
+    
+    def _go_live(self, symbol: str):
+        """Tohumlaması biten sembolün bekletilen mumlarını işle ve canlıya al"""
+        held = self.seed_pending.pop(symbol, [])
+        for row in held:
+            self._store_kline(symbol, *row)
+            if self.evaluation == "close" and row[6]:
+                self._on_candle_close(symbol, row[0])
+        if held and self.evaluation == "tick":
+            self._analyze_signals(symbol)
         
-        return ws
+        future = self.seed_futures.pop(symbol, None)
+        if future is not None and not future.done():
+            future.set_result(symbol)
+    
+    async def _seed_symbols(self, symbols: List[str], priority: int = 0):
+        """Sembol geçmişlerini tohumlama kuyruğu üzerinden yükle ve hepsinin bitmesini bekle"""
+        await asyncio.gather(*self._request_seed(symbols, priority))
     
+    async def _resolve_symbols(self):
+        """Sembol listesi verilmediyse exchangeInfo'dan executor üzerinde al"""
+        if not self.symbols_ready:
+            loop = asyncio.get_running_loop()
+            self._set_symbols(await loop.run_in_executor(None, self._get_perpetual_symbols))
+    
+    async def _status_reporter(self):
+        """Durum değiştikçe yayınla"""
+        last_status = None
+        while True:
+            status = self.get_scanning_status()
+            if status != last_status:
+                self._emit('status', status)
+                last_status = status
+            await asyncio.sleep(self.status_interval)
+    
+    async def _ingestion_main(self):
+        """Ingestion çekirdeği: bağlantılar, analiz kuyruğu ve batch döngüsü"""
+        self.message_queue = asyncio.Queue(maxsize=self.queue_size)
+        worker = asyncio.create_task(self._analysis_worker())
+        expiry = asyncio.create_task(self._expiry_timer())
+        reporter = asyncio.create_task(self._status_reporter()) if self.events is not None else None
+        evaluator = None
+        if self.tick_scheduler is not None and not self.worker_pool:
+            self.tick_wakeup = asyncio.Event()
+            evaluator = asyncio.create_task(self._tick_evaluator())
+        
+        try:
+            await self._resolve_symbols()
+            if self.scan_mode == "full":
+                await self._run_full_universe()
+            else:
+                await self._run_batch_rotation()
+        finally:
+            tasks = list(self.ws_connections.values()) + [worker, expiry] + ([reporter] if reporter else []) + \
+                ([evaluator] if evaluator else []) + self.seed_tasks
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.ws_connections.clear()
+            self.tick_wakeup = None
+            if self.seed_executor:
+                self.seed_executor.shutdown(wait=False, cancel_futures=True)
+            # Kuyruk ve future'lar bu döngüye bağlı - yeniden başlatmada tohumlama baştan kurulur
+            for future in self.seed_futures.values():
+                future.cancel()
+            self.seed_queue = None
+            self.seed_executor = None
+            self.seed_tasks = []
+            self.seed_futures.clear()
+            self.seed_pending.clear()
+            self.seed_in_flight = 0
+
     def start_scanning(self):
         """Taramayı başlat"""
         if self.scanning:
@@ -283,27 +1045,95 @@ class BinancePerperualScanner:
         self.scanning = True
         self.logger.info(f"Binance Perpetual taraması başlatılıyor...")
         self.logger.info(f"Timeframe: {self.timeframe}")
-        self.logger.info(f"Batch boyutu: {self.batch_size}")
+        if self.multi_timeframe:
+            self.logger.info(f"Üretilen zaman dilimleri: {', '.join(self.timeframes)}")
+        self.logger.info(f"Tarama modu: {self.scan_mode}")
+        if self.evaluation == "close":
+            self.logger.info("Sinyaller mum kapanışlarında evren taraması ile değerlendiriliyor")
+        if self.scan_mode == "rotation":
+            self.logger.info(f"Batch boyutu: {self.batch_size}")
+        
+        if self.workers:
+            self.logger.info(f"Sinyal değerlendirmesi {self.workers} sürece bölünüyor")
+            self.worker_pool = SignalWorkerPool(self.workers, self.timeframe_seconds)
+            self.delta_thread = threading.Thread(target=self._collect_worker_deltas)
+            self.delta_thread.daemon = True
+            self.delta_thread.start()
+        
+        self._start_event_loop()
+    
+    def _start_event_loop(self):
+        """Event loop'u tek bir arka plan thread'inde çalıştır"""
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
         
-        # İlk batch'i başlat
-        self.start_current_batch()
+        def run_loop():
+            asyncio.set_event_loop(self.loop)
+            self.ingestion_task = self.loop.create_task(self._ingestion_main())
+            ready.set()
+            try:
+                self.loop.run_until_complete(self.ingestion_task)
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                self.logger.error(f"Ingestion döngüsü hatası: {e}")
+            finally:
+                self.loop.run_until_complete(self.loop.shutdown_default_executor())
+                self.loop.close()
+        
+        self.loop_thread = threading.Thread(target=run_loop)
+        self.loop_thread.daemon = True
+        self.loop_thread.start()
+        ready.wait()
+    
+    def _create_connection_groups(self) -> List[List[str]]:
+        """Tüm sembolleri bağlantı başına stream limitine göre eşit gruplara böl"""
+        if not self.perpetual_symbols:
+            return []
         
-        # Batch döngüsünü başlat
-        self._start_batch_rotation()
+        limit = self.MAX_STREAMS_PER_CONNECTION
+        group_count = -(-len(self.perpetual_symbols) // limit)
+        group_size = -(-len(self.perpetual_symbols) // group_count)
+        return [self.perpetual_symbols[i:i + group_size]
+                for i in range(0, len(self.perpetual_symbols), group_size)]
     
-    def _start_next_batch(self):
-        """Sonraki batch'e geç"""
-        # Mevcut batch'i kapat
-        self._close_current_batch()
+    async def _run_full_universe(self):
+        """Tüm sembolleri sabit bağlantı havuzu ile dinle"""
+        groups = self._create_connection_groups()
+        self.active_symbols = list(self.perpetual_symbols)
+        self.logger.info(f"Tam evren modu: {len(self.active_symbols)} sembol, {len(groups)} bağlantı")
+        self._emit('batch', {
+            'current_batch': 0,
+            'total_batches': 1,
+            'symbols': self.active_symbols
+        })
         
-        # Sonraki batch'e geç
-        self.current_batch = (self.current_batch + 1) % len(self.symbol_batches)
-        self.logger.info(f"Batch değişti: {self.current_batch + 1}/{len(self.symbol_batches)} - Hızlı tarama aktif")
+        # Tüm semboller abonelik sırasıyla kuyruğa girer; her sembol tohumu bitince canlıya geçer
+        self._request_seed(self.perpetual_symbols)
+        for index, symbols in enumerate(groups):
+            if self.worker_pool:
+                # Worker'lar mesajı kendileri çözer - geçmiş bağlantıdan önce yüklenmeli
+                await self._seed_symbols(symbols)
+            self._start_websocket_for_symbols(symbols, key=f'pool_{index}')
         
-        # Yeni batch'i başlat
-        self.start_current_batch()
+        # Bağlantılar iptal edilene kadar açık kalır
+        await asyncio.gather(*self.ws_connections.values())
+    
+    async def _run_batch_rotation(self):
+        """Batch döngüsü - her 10 saniyede bir sonraki batch'e geç"""
+        if not self.symbol_batches:
+            return
         
-    def start_current_batch(self):
+        while True:
+            await self._start_current_batch()
+            await asyncio.sleep(10)  # 10 saniye bekle (hızlı tarama)
+            await self._close_current_batch()
+            
+            # Sonraki batch'e geç
+            self.current_batch = (self.current_batch + 1) % len(self.symbol_batches)
+            self.logger.info(f"Batch değişti: {self.current_batch + 1}/{len(self.symbol_batches)} - Hızlı tarama aktif")
+    
+    async def _start_current_batch(self):
         """Mevcut batch'i başlat"""
         if not self.symbol_batches or self.current_batch >= len(self.symbol_batches):
             return
@@ -313,51 +1143,97 @@ class BinancePerperualScanner:
         
         self.logger.info(f"Batch {self.current_batch + 1}: {len(current_symbols)} sembol taranıyor")
         self.logger.info(f"Semboller: {', '.join(current_symbols)}")
+        self._emit('batch', {
+            'current_batch': self.current_batch,
+            'total_batches': len(self.symbol_batches),
+            'symbols': current_symbols
+        })
+        
+        # Geçmiş öncelikle yüklenir (güncel semboller için REST çağrısı yapılmaz);
+        # bağlantı hemen açılır, semboller tohumları bitince canlıya geçer
+        if self.worker_pool:
+            await self._seed_symbols(current_symbols)
+        else:
+            self._request_seed(current_symbols)
         
         # WebSocket'i başlat
-        ws = self._start_websocket_for_symbols(current_symbols)
-        if ws:
-            self.ws_connections['current'] = ws
+        self._start_websocket_for_symbols(current_symbols)
     
-    def _close_current_batch(self):
+    async def _close_current_batch(self):
         """Mevcut batch'i kapat"""
-        if 'current' in self.ws_connections:
-            try:
-                self.ws_connections['current'].close()
-                del self.ws_connections['current']
-            except:
-                pass
-    
-    def _start_batch_rotation(self):
-        """Batch döngüsünü başlat"""
-        def rotation_loop():
-            while self.scanning:
-                time.sleep(10)  # 10 saniye bekle (hızlı tarama)
-                if self.scanning:
-                    self._start_next_batch()
+        task = self.ws_connections.pop('current', None)
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
         
-        rotation_thread = threading.Thread(target=rotation_loop)
-        rotation_thread.daemon = True
-        rotation_thread.start()
+        # Batch dışına çıkan sembollerin bekleyen tick'leri bırakılır
+        if self.tick_scheduler is not None and self.symbol_batches:
+            self.tick_scheduler.discard(self.symbol_batches[self.current_batch])
     
     def stop_scanning(self):
-        """Taramayı durdur"""
+        """Taramayı durdur - tüm görevler iptal edilir ve event loop kapanır"""
         self.scanning = False
-        self._close_current_batch()
+        
+        if self.loop and self.ingestion_task and not self.loop.is_closed():
+            try:
+                self.loop.call_soon_threadsafe(self.ingestion_task.cancel)
+            except RuntimeError:
+                # Döngü bu arada kapanmış olabilir
+                pass
+        if self.loop_thread:
+            self.loop_thread.join(timeout=10)
+        
+        if self.worker_pool:
+            self.worker_pool.stop()
+            if self.delta_thread:
+                self.delta_thread.join(timeout=5)
+            self.worker_pool = None
+        
+        self._emit('status', self.get_scanning_status())
         self.logger.info("Tarama durduruldu")
     
     def get_signals(self) -> Dict[str, Dict]:
         """Aktif sinyalleri döndür"""
-        # 5 dakikadan eski sinyalleri temizle
-        current_time = datetime.now()
-        valid_signals = {}
-        
-        for symbol, signal in self.signals.items():
-            if (current_time - signal['timestamp']).total_seconds() <= 300:  # 5 dakika
-                valid_signals[symbol] = signal
+        return self.get_signal_snapshot()[1]
+    
+    def get_signal_snapshot(self) -> tuple:
+        """(sürüm, aktif sinyaller) çiftini tutarlı olarak döndür"""
+        # Süresi dolanlar zamanlayıcıdan önce istenirse burada da temizlenir (sadece vadesi gelenler)
+        self._expire_due()
+        with self.signals_lock:
+            return self.signal_version, dict(self.signals)
+    
+    def get_signal_changes(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        since sürümünden sonraki eklenen/güncellenen ve kalkan sinyalleri döndür
+        İmleç geçersizse (başka tarayıcı örneği, kırpılmış günlük) tam liste ile reset döner
+        """
+        self._expire_due()
+        with self.signals_lock:
+            first = self.signal_log[0][0] if self.signal_log else self.signal_version + 1
+            
+            if (epoch is not None and epoch != self.epoch) or since > self.signal_version or since < first - 1:
+                return {
+                    'reset': True,
+                    'epoch': self.epoch,
+                    'version': self.signal_version,
+                    'signals': [format_signal(symbol, signal) for symbol, signal in self.signals.items()],
+                    'removed': []
+                }
+            
+            # Sürümler ardışık: imlecin günlükteki yeri doğrudan hesaplanır
+            changes = {}
+            for _, symbol, payload in self.signal_log[since - first + 1:]:
+                changes[symbol] = payload
+            version = self.signal_version
         
-        self.signals = valid_signals
-        return valid_signals
+        return {
+            'reset': False,
+            'epoch': self.epoch,
+            'version': version,
+            'signals': [payload for payload in changes.values() if payload is not None],
+            'removed': [symbol for symbol, payload in changes.items() if payload is None]
+        }
     
     def get_active_symbols(self) -> List[str]:
         """Aktif taranan sembolleri döndür"""
@@ -370,8 +1246,26 @@ class BinancePerperualScanner:
             'current_batch': self.current_batch,
             'active_symbols': len(self.active_symbols),
             'total_symbols': len(self.perpetual_symbols),
-            'signals_count': len(self.get_signals()),
-            'timeframe': self.timeframe
+            'signals_count': len(self.signals),
+            'timeframe': self.timeframe,
+            'timeframes': self.timeframes,
+            'scan_mode': self.scan_mode,
+            'evaluation': self.evaluation,
+            'workers': self.workers,
+            'connections': len(self.connected_streams),
+            'streams': sorted(self.connected_streams),
+            'queue_depth': self.message_queue.qsize() if self.message_queue else 0,
+            'phase': 'symbols' if not self.symbols_ready else ('seeding' if self.seed_pending else 'live'),
+            'seeding': {
+                'seeded': len(self.seeded_symbols),
+                'total': len(self.perpetual_symbols),
+                'pending': len(self.seed_pending),
+                'in_flight': self.seed_in_flight,
+                'failed': self.seed_failed
+            },
+            'close_sweep': self.last_close_sweep,
+            'scheduler': self.tick_scheduler.stats() if self.tick_scheduler is not None else None,
+            'rest_calls_per_minute': self.get_rest_calls_per_minute()
         }
     
     def get_console_messages(self) -> List[Dict[str, str]]:
@@ -379,17 +1273,23 @@ class BinancePerperualScanner:
         messages = []
         
         if self.scanning and self.active_symbols:
+            recent_signals = self.get_signals()
+            
             # Mevcut batch bilgisi
+            if self.scan_mode == "full":
+                message = f'Tüm semboller taranıyor: {len(self.active_symbols)} coin, {len(self.connected_streams)} bağlantı - GERÇEK ZAMANLI'
+            else:
+                message = f'Batch {self.current_batch + 1}/{len(self.symbol_batches)} taranıyor: {len(self.active_symbols)} coin - GERÇEK ZAMANLI'
             messages.append({
-                'message': f'Batch {self.current_batch + 1}/{len(self.symbol_batches)} taranıyor: {len(self.active_symbols)} coin - GERÇEK ZAMANLI',
+                'message': message,
                 'type': 'info'
             })
             
             # Aktif semboller - sinyal durumu ile
             for symbol in self.active_symbols[:5]:  # İlk 5 sembolü göster
                 # Bu sembol için sinyal var mı kontrol et
-                if symbol in self.signals:
-                    signal = self.signals[symbol]
+                if symbol in recent_signals:
+                    signal = recent_signals[symbol]
                     signal_types = []
                     if signal.get('buy_signal'):
                         signal_types.append('BUY')
@@ -415,7 +1315,6 @@ class BinancePerperualScanner:
                     })
             
             # Son sinyaller
-            recent_signals = self.get_signals()
             for symbol, signal in list(recent_signals.items())[:3]:  # Son 3 sinyal
                 signal_types = []
                 if signal.get('buy_signal'):
@@ -0,0 +1,96 @@
+import itertools
+import json
+import logging
+import queue
+import threading
+from typing import Any, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventBroadcaster:
+    """
+    Tarayıcı olaylarını tüm SSE istemcilerine dağıtan yayıncı
+    Her olay bir kez serileştirilir, aynı bayt dizisi tüm abonelerin kuyruğuna konur.
+    Kuyruğu dolan (yavaş) istemcinin bağlantısı kapatılır; tarayıcı EventSource yeniden bağlanır.
+    """
+
+    def __init__(self, queue_size: int = 1000, heartbeat: float = 15.0):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.subscribers: List[queue.Queue] = []
+        self.lock = threading.Lock()
+        self.sequence = itertools.count(1)
+
+        # Sayaçlar
+        self.published = 0
+        self.dropped = 0
+
+    def publish(self, event: str, data: Any):
+        """Olayı serileştir ve tüm abonelere gönder"""
+        with self.lock:
+            if not self.subscribers:
+                return
+            payload = self.format(event, data, next(self.sequence))
+            self.published += 1
+
+            for subscriber in list(self.subscribers):
+                try:
+                    subscriber.put_nowait(payload)
+                except queue.Full:
+                    # Yavaş istemci - bağlantısını kapat
+                    self.subscribers.remove(subscriber)
+                    self._close(subscriber)
+                    self.dropped += 1
+
+    @staticmethod
+    def format(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+        """SSE çerçevesi oluştur"""
+        lines = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{lines}event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode('utf-8')
+
+    def _close(self, subscriber: queue.Queue):
+        # Kuyruğu boşaltıp kapanış işaretini koy
+        try:
+            while True:
+                subscriber.get_nowait()
+        except queue.Empty:
+            pass
+        subscriber.put_nowait(None)
+
+    def subscribe(self) -> queue.Queue:
+        """Yeni abone kuyruğu oluştur"""
+        subscriber: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        with self.lock:
+            self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        with self.lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+
+    def stream(self, subscriber: queue.Queue, initial: Optional[bytes] = None) -> Iterator[bytes]:
+        """Abonenin olaylarını SSE akışı olarak üret (boşta kalınca heartbeat yorumu gönderir)"""
+        try:
+            if initial:
+                yield initial
+            while True:
+                try:
+                    payload = subscriber.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    yield b": ping\n\n"
+                    continue
+                if payload is None:
+                    break
+                yield payload
+        finally:
+            self.unsubscribe(subscriber)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'subscribers': len(self.subscribers),
+                'published': self.published,
+                'dropped': self.dropped
+            }
@@ -0,0 +1,205 @@
+"""
+FinyX LQ / Whale / V1 tarayıcılarının sunucu tarafı portu (static/finyx_scanners.js ile aynı mantık)
+
+Her tarayıcı (semboller x mumlar) boyutlu 2B dizilerle çalışır; aynı uzunluktaki tüm semboller
+tek NumPy işlemiyle değerlendirilir.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+
+def _js_round(values: np.ndarray, decimals: int = 8) -> np.ndarray:
+    """JavaScript Math.round(x * 10^d) / 10^d (yarımlar yukarı yuvarlanır)"""
+    scale = 10.0 ** decimals
+    return np.floor(values * scale + 0.5) / scale
+
+
+def _last_true_index(mask: np.ndarray) -> np.ndarray:
+    """Her satırdaki son True'nun indeksi, yoksa -1"""
+    reversed_index = np.argmax(mask[:, ::-1], axis=1)
+    index = mask.shape[1] - 1 - reversed_index
+    return np.where(mask.any(axis=1), index, -1)
+
+
+def _iso_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+class FinyXLQScanner:
+    """Temas edilmemiş en güncel dip mumunun 0.786 Fibonacci seviyesi"""
+
+    def __init__(self):
+        self.lookback_period = 60
+        self.min_price_movement = 0.02
+
+    def scan(self, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+             closes: np.ndarray) -> List[Optional[Dict[str, Any]]]:
+        """get786Level: satır başına {'levelName', 'price'} veya None"""
+        count = opens.shape[1]
+        if count <= 2:
+            return [None] * opens.shape[0]
+
+        # Dip: önceki ve sonraki mumdan düşük low + kırmızı mum (indeks 1..n-2)
+        inner = slice(1, count - 1)
+        is_dip = (lows[:, inner] < lows[:, :-2]) & (lows[:, inner] < lows[:, 2:]) & \
+                 (closes[:, inner] < opens[:, inner])
+
+        fib = _js_round(highs[:, inner] - (highs[:, inner] - lows[:, inner]) * 0.786)
+
+        # Dipten sonraki mumların en düşük low'u (sondan kümülatif minimum)
+        suffix_min = np.minimum.accumulate(lows[:, ::-1], axis=1)[:, ::-1]
+        touched = suffix_min[:, 2:] <= fib
+
+        index = _last_true_index(is_dip & ~touched)
+        rows = np.arange(opens.shape[0])
+        prices = fib[rows, np.maximum(index, 0)]
+        return [{'levelName': 'fib786', 'price': float(price)} if i >= 0 else None
+                for i, price in zip(index, prices)]
+
+
+class FinyXWhaleScanner:
+    """Son mumda yüksek göreli hacim + aşırı alım olmayan yeşil mum"""
+
+    def __init__(self, lookback_period: int = 10, rv_threshold_strong: float = 2.0,
+                 rv_threshold_very_strong: float = 4.0, rsi_period: int = 14, rsi_overbought: float = 70.0):
+        self.lookback_period = lookback_period
+        self.rv_threshold_strong = rv_threshold_strong
+        self.rv_threshold_very_strong = rv_threshold_very_strong
+        self.rsi_period = rsi_period
+        self.rsi_overbought = rsi_overbought
+
+    def _rsi(self, closes: np.ndarray) -> np.ndarray:
+        """Son mum için basit (Wilder olmayan) RSI - JS calculateRSI"""
+        count = closes.shape[1]
+        period = self.rsi_period
+        if count - 1 < period:
+            return np.full(closes.shape[0], 50.0)
+
+        changes = np.diff(closes[:, -(period + 1):], axis=1)
+        gains = np.where(changes > 0, changes, 0.0).sum(axis=1)
+        losses = np.where(changes > 0, 0.0, np.abs(changes)).sum(axis=1)
+        avg_gain = gains / period
+        avg_loss = losses / period
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        return np.where(avg_loss == 0, 100.0, rsi)
+
+    def _relative_volume(self, volumes: np.ndarray) -> np.ndarray:
+        """Son mum hacminin önceki lookback mum ortalamasına oranı - JS calculateRV"""
+        count = volumes.shape[1]
+        lookback = self.lookback_period
+        if count - 1 < lookback:
+            return np.ones(volumes.shape[0])
+
+        avg_volume = volumes[:, -(lookback + 1):-1].sum(axis=1) / lookback
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rv = volumes[:, -1] / avg_volume
+        return np.where(avg_volume == 0, 1.0, rv)
+
+    def scan(self, opens: np.ndarray, closes: np.ndarray, volumes: np.ndarray) -> List[Optional[Dict[str, Any]]]:
+        """processData: satır başına whale sinyali veya None"""
+        if closes.shape[1] == 0:
+            return [None] * closes.shape[0]
+
+        rsi = self._rsi(closes)
+        rv = self._relative_volume(volumes)
+        last_open, last_close = opens[:, -1], closes[:, -1]
+        hit = (last_close > last_open) & (rv >= self.rv_threshold_strong) & (rsi < self.rsi_overbought)
+
+        timestamp = _iso_now()
+        return [{
+            'type': 'WHALE',
+            'strength': 'VERY_STRONG' if rv[i] >= self.rv_threshold_very_strong else 'STRONG',
+            'price': float(last_close[i]),
+            'rsi': float(rsi[i]),
+            'rv': float(rv[i]),
+            'timestamp': timestamp
+        } if hit[i] else None for i in range(closes.shape[0])]
+
+
+class FinyXV1Scanner:
+    """Son tepe mumundan -1.618 / -1.75 / -2.0 Fibonacci alım seviyeleri"""
+
+    def __init__(self, lookback_bars: int = 50):
+        self.lookback_bars = lookback_bars
+
+    def scan(self, open_times: np.ndarray, highs: np.ndarray, lows: np.ndarray) -> List[Optional[Dict[str, Any]]]:
+        """
+        findLatestPeak: satır başına sinyal veya None
+        JS'ten farkı: peakTime yerel saat metni değil tepe mumunun açılış zamanıdır (ms); metne
+        istemcide çevrilir (scanner_integration.js fetchServerScan)
+        """
+        window = min(self.lookback_bars, highs.shape[1], 80)
+        if window < 20:
+            return [None] * highs.shape[0]
+
+        highs, lows, open_times = highs[:, -window:], lows[:, -window:], open_times[:, -window:]
+        is_peak = (highs[:, 1:-1] > highs[:, :-2]) & (highs[:, 1:-1] > highs[:, 2:])
+        index = _last_true_index(is_peak) + 1  # iç indeksten pencere indeksine
+
+        timestamp = _iso_now()
+        results = []
+        for row, peak in enumerate(index):
+            if peak == 0:
+                results.append(None)
+                continue
+            peak_high, peak_low = float(highs[row, peak]), float(lows[row, peak])
+            price_range = peak_high - peak_low
+            results.append({
+                'type': 'entry',
+                'peakPrice': peak_high,
+                'peakTime': int(open_times[row, peak]),
+                'lowBuy': peak_low - price_range * 1.618,
+                'mediumBuy': peak_low - price_range * 1.75,
+                'highBuy': peak_low - price_range * 2.0,
+                'peakDistance': int(window - 1 - peak),
+                'timestamp': timestamp
+            })
+        return results
+
+
+class FinyXScannerManager:
+    """Üç tarayıcıyı tüm sembol evreni üzerinde çalıştırır"""
+
+    def __init__(self):
+        self.lq_scanner = FinyXLQScanner()
+        self.whale_scanner = FinyXWhaleScanner()
+        self.v1_scanner = FinyXV1Scanner()
+
+    def scan_universe(self, candles: Dict[str, Sequence[np.ndarray]],
+                      scanners: Sequence[str] = ('lq', 'whale', 'v1')) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        candles: sembol -> (open_time, open, high, low, close, volume) dizileri
+        Aynı uzunluktaki semboller tek 2B diziye yığılarak birlikte değerlendirilir
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {name: [] for name in scanners}
+
+        groups: Dict[int, List[str]] = {}
+        for symbol, columns in candles.items():
+            groups.setdefault(len(columns[0]), []).append(symbol)
+
+        for symbols in groups.values():
+            open_times, opens, highs, lows, closes, volumes = (
+                np.vstack([np.asarray(candles[symbol][column], dtype=np.int64 if column == 0 else np.float64)
+                           for symbol in symbols])
+                for column in range(6)
+            )
+
+            if 'lq' in results:
+                lq_timestamp = _iso_now()
+                for symbol, hit in zip(symbols, self.lq_scanner.scan(opens, highs, lows, closes)):
+                    if hit:
+                        results['lq'].append({'symbol': symbol, 'price': hit['price'], 'levelName': hit['levelName'],
+                                              'timestamp': lq_timestamp, 'type': 'LQ'})
+            if 'whale' in results:
+                for symbol, hit in zip(symbols, self.whale_scanner.scan(opens, closes, volumes)):
+                    if hit:
+                        results['whale'].append(dict(hit, symbol=symbol))
+            if 'v1' in results:
+                for symbol, hit in zip(symbols, self.v1_scanner.scan(open_times, highs, lows)):
+                    if hit:
+                        results['v1'].append(dict(hit, symbol=symbol))
+
+        return results
@@ -0,0 +1,134 @@
+from typing import Optional, Tuple
+import numpy as np
+
+
+class KlineRingBuffer:
+    """
+    Sembol başına sabit boyutlu OHLCV deposu
+    Kapanmış mumlar ve tek bir açık mum yuvası önceden ayrılmış float64/int64 dizilerde tutulur.
+    Sütunlar her zaman bitişik olduğundan kopyasız görünüm (view) olarak döndürülür.
+    """
+
+    COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, capacity: int = 200, headroom: Optional[int] = None):
+        self.capacity = capacity
+        # Sıkıştırma (başa kaydırma) headroom kadar mumda bir yapılır: mum başına amortize O(1)
+        self.headroom = max(1, headroom if headroom is not None else capacity // 4)
+        size = capacity + self.headroom + 1
+
+        self.open_times = np.zeros(size, dtype=np.int64)
+        self.values = np.zeros((len(self.COLUMNS), size), dtype=np.float64)
+        self.start = 0
+        self.end = 0  # Kapanmış mumlar [start, end) aralığında, açık mum yuvası end indeksinde
+        self.has_open = False
+
+    def __len__(self) -> int:
+        return self.end - self.start + (1 if self.has_open else 0)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Açık mum dahil sütun görünümü (calculate_signals ile uyumlu)"""
+        return self.column(column)
+
+    @property
+    def closed_count(self) -> int:
+        return self.end - self.start
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        """Son mumun (açık veya kapalı) açılış zamanı (ms)"""
+        if self.has_open:
+            return int(self.open_times[self.end])
+        if self.end > self.start:
+            return int(self.open_times[self.end - 1])
+        return None
+
+    def column(self, column: str, include_open: bool = True) -> np.ndarray:
+        """Sütunun kopyasız görünümünü döndür"""
+        stop = self.end + (1 if include_open and self.has_open else 0)
+        if column == 'open_time':
+            return self.open_times[self.start:stop]
+        return self.values[self.COLUMNS.index(column), self.start:stop]
+
+    def columns(self, include_open: bool = True) -> Tuple[np.ndarray, ...]:
+        """(open_time, open, high, low, close, volume) görünümlerini döndür"""
+        stop = self.end + (1 if include_open and self.has_open else 0)
+        return (self.open_times[self.start:stop],) + tuple(self.values[:, self.start:stop])
+
+    def last(self) -> Optional[Tuple[int, float, float, float, float, float, bool]]:
+        """Son mumu (open_time, o, h, l, c, v, is_closed) olarak döndür"""
+        if self.has_open:
+            index, is_closed = self.end, False
+        elif self.end > self.start:
+            index, is_closed = self.end - 1, True
+        else:
+            return None
+        return (int(self.open_times[index]),) + tuple(float(x) for x in self.values[:, index]) + (is_closed,)
+
+    def load(self, open_times: np.ndarray, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+             closes: np.ndarray, volumes: np.ndarray):
+        """Depoyu kapanmış mum dizileriyle tek kopyada doldur (mevcut içerik silinir)"""
+        count = min(len(open_times), self.capacity)
+        self.open_times[:count] = open_times[len(open_times) - count:]
+        for row, column in enumerate((opens, highs, lows, closes, volumes)):
+            self.values[row, :count] = column[len(column) - count:]
+        self.start, self.end = 0, count
+        self.has_open = False
+
+    def append(self, open_time: int, open_price: float, high: float, low: float,
+               close: float, volume: float, is_closed: bool) -> bool:
+        """
+        Mumu depoya yaz
+        Aynı açılış zamanlı mum güncellenir, daha eski mumlar yok sayılır.
+        Yeni bir mum gelirse bekleyen açık mum kapanmış kabul edilir.
+        Mum yazıldıysa True döner.
+        """
+        last_closed = int(self.open_times[self.end - 1]) if self.end > self.start else None
+
+        if self.has_open:
+            slot_time = int(self.open_times[self.end])
+            if open_time < slot_time:
+                return False
+            if open_time > slot_time:
+                self._commit_open_slot()
+        elif last_closed is not None:
+            if open_time < last_closed:
+                return False
+            if open_time == last_closed:
+                # Kapanmış mumun geç gelen güncellemesi
+                self._write(self.end - 1, open_time, open_price, high, low, close, volume)
+                return True
+
+        self._write(self.end, open_time, open_price, high, low, close, volume)
+        self.has_open = True
+        if is_closed:
+            self._commit_open_slot()
+        return True
+
+    def _write(self, index: int, open_time: int, open_price: float, high: float,
+               low: float, close: float, volume: float):
+        self.open_times[index] = open_time
+        values = self.values
+        values[0, index] = open_price
+        values[1, index] = high
+        values[2, index] = low
+        values[3, index] = close
+        values[4, index] = volume
+
+    def _commit_open_slot(self):
+        """Açık mum yuvasını kapanmış mumlara ekle"""
+        self.has_open = False
+        self.end += 1
+        if self.end - self.start > self.capacity:
+            self.start += 1
+
+        # Açık mum yuvası için yer kalmadıysa son mumları başa taşı
+        if self.end >= len(self.open_times):
+            count = self.end - self.start
+            self.open_times[:count] = self.open_times[self.start:self.end]
+            self.values[:, :count] = self.values[:, self.start:self.end]
+            self.start, self.end = 0, count
+
+    @property
+    def nbytes(self) -> int:
+        return self.open_times.nbytes + self.values.nbytes
@@ -0,0 +1,156 @@
+import errno
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Diskteki kayıt düzeni: open_time int64 + OHLCV float64 (little-endian, 48 bayt)
+KLINE_DTYPE = np.dtype([
+    ('open_time', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8')
+])
+
+
+class KlineStore:
+    """
+    Sembol ve zaman dilimi başına tek dosyalı, sadece-ekleme yapılan kapanmış mum deposu
+    Dosyalar np.memmap ile açılır; sütunlar kopyasız int64/float64 görünümler olarak okunur.
+    Dosya max_bars'ın iki katına ulaşınca son max_bars mum ile atomik olarak yeniden yazılır.
+    Yazma hataları (salt okunur disk vb.) loglanır, taramayı durdurmaz.
+    """
+
+    def __init__(self, root: str, max_bars: int = 10000):
+        self.root = root
+        self.max_bars = max_bars
+        self.lock = threading.Lock()
+        # (sembol, aralık) -> (son open_time, kayıt sayısı)
+        self.index: Dict[Tuple[str, str], Tuple[Optional[int], int]] = {}
+        self.disabled = False
+
+        # Sayaçlar
+        self.appended = 0
+        self.compactions = 0
+        self.errors = 0
+
+    def path(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, interval, f"{symbol}.bin")
+
+    def _open(self, symbol: str, interval: str) -> Optional[np.memmap]:
+        """Dosyayı salt okunur eşle (yarım yazılmış son kayıt yok sayılır)"""
+        path = self.path(symbol, interval)
+        try:
+            count = os.path.getsize(path) // KLINE_DTYPE.itemsize
+        except OSError:
+            return None
+        if count == 0:
+            return None
+        return np.memmap(path, dtype=KLINE_DTYPE, mode='r', shape=(count,))
+
+    def _state(self, symbol: str, interval: str) -> Tuple[Optional[int], int]:
+        """Son open_time ve kayıt sayısını döndür (ilk erişimde dosyadan okunur)"""
+        key = (symbol, interval)
+        state = self.index.get(key)
+        if state is None:
+            records = self._open(symbol, interval)
+            state = (None, 0) if records is None else (int(records['open_time'][-1]), len(records))
+            self.index[key] = state
+        return state
+
+    def last_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        """Depodaki son kapanmış mumun açılış zamanı (ms)"""
+        with self.lock:
+            return self._state(symbol, interval)[0]
+
+    def read(self, symbol: str, interval: str,
+             limit: Optional[int] = None) -> Optional[Tuple[np.ndarray, ...]]:
+        """Son limit mumu (open_time, open, high, low, close, volume) görünümleri olarak döndür"""
+        with self.lock:
+            records = self._open(symbol, interval)
+        if records is None:
+            return None
+        if limit is not None:
+            records = records[-limit:]
+        return tuple(records[name] for name in KLINE_DTYPE.names)
+
+    def append(self, symbol: str, interval: str, open_times: np.ndarray, opens: np.ndarray,
+               highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray) -> int:
+        """
+        Kapanmış mumları dosyanın sonuna ekle
+        Depodaki son mumdan eski veya ona eşit mumlar atlanır; yazılan kayıt sayısı döner.
+        """
+        if self.disabled or len(open_times) == 0:
+            return 0
+
+        with self.lock:
+            last, count = self._state(symbol, interval)
+            first = 0 if last is None else int(np.searchsorted(open_times, last, side='right'))
+            if first >= len(open_times):
+                return 0
+
+            records = np.empty(len(open_times) - first, dtype=KLINE_DTYPE)
+            for name, column in zip(KLINE_DTYPE.names, (open_times, opens, highs, lows, closes, volumes)):
+                records[name] = column[first:]
+
+            path = self.path(symbol, interval)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if os.path.exists(path) and os.path.getsize(path) % KLINE_DTYPE.itemsize:
+                    # Yarım kalmış son kaydı at (dosyada tek kayıt bile tamamlanmamışsa count 0'dır)
+                    os.truncate(path, count * KLINE_DTYPE.itemsize)
+                with open(path, 'ab') as f:
+                    f.write(records.tobytes())
+            except OSError as e:
+                self.errors += 1
+                if e.errno in (errno.EROFS, errno.EACCES):
+                    # Yazılamayan diskte tekrar denenmez
+                    self.disabled = True
+                logger.error(f"{symbol} {interval} mumları diske yazılamadı: {e}")
+                return 0
+
+            count += len(records)
+            self.index[(symbol, interval)] = (int(records['open_time'][-1]), count)
+            self.appended += len(records)
+
+            if count >= 2 * self.max_bars:
+                self._compact(symbol, interval)
+            return len(records)
+
+    def _compact(self, symbol: str, interval: str):
+        """Son max_bars mumu yeni dosyaya yazıp eskisinin yerine koy (lock altında çağrılır)"""
+        path = self.path(symbol, interval)
+        records = self._open(symbol, interval)
+        if records is None:
+            return
+        tail = np.array(records[-self.max_bars:])
+        del records
+
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(tail.tobytes())
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.errors += 1
+            logger.error(f"{symbol} {interval} deposu sıkıştırılamadı: {e}")
+            return
+
+        self.index[(symbol, interval)] = (int(tail['open_time'][-1]), len(tail))
+        self.compactions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'root': self.root,
+                'series': len(self.index),
+                'appended': self.appended,
+                'compactions': self.compactions,
+                'errors': self.errors,
+                'disabled': self.disabled
+            }
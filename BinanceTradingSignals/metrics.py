@@ -0,0 +1,234 @@
+"""
+Düşük maliyetli sayaç / histogram kaydı ve Prometheus metin formatı
+
+Histogramlar sabit kovalıdır: gözlem tek bisect ve birkaç toplama ile kaydedilir.
+Etiketli metriklerde labels(...) ile alınan alt seri sıcak yolda saklanıp tekrar kullanılır.
+"""
+import bisect
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Aşama süreleri (sn): 10 µs - 10 sn
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Borsa olayından sinyale gecikme (sn)
+LAG_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# HTTP ve upstream istekleri (sn)
+REQUEST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _CounterChild:
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self.lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ('buckets', 'counts', 'total', 'lock')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # son eleman +Inf kovası
+        self.total = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.total += value
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.children: Dict[Tuple[str, ...], object] = {}
+        self.lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values) -> object:
+        """Etiket değerlerinin alt serisini döndür (yoksa oluştur)"""
+        key = tuple(str(value) for value in values)
+        child = self.children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: {len(self.labelnames)} etiket bekleniyor")
+            with self.lock:
+                child = self.children.setdefault(key, self._new_child())
+        return child
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Sadece artan sayaç"""
+    kind = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for values, child in list(self.children.items()):
+            lines.append(f"{self.name}{_label_text(self.labelnames, values)} {_format_value(child.value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Sabit kovalı histogram (Prometheus kümülatif kova formatında yazılır)"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for values, child in list(self.children.items()):
+            with child.lock:
+                counts, total = list(child.counts), child.total
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_label_text(self.labelnames, values, le)} {cumulative}")
+            labels = _label_text(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Değeri okuma anında callback'ten alınan gösterge"""
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], Union[float, Dict[Tuple[str, ...], float], None]]] = None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def labels(self, *values) -> object:
+        """Callback göstergesinin alt serisi yoktur - etiketli değerler callback'ten sözlük olarak döner"""
+        raise TypeError(f"{self.name}: callback göstergesinin alt serisi yok")
+
+    def render(self) -> List[str]:
+        try:
+            value = self.callback() if self.callback else None
+        except Exception:
+            value = None
+        if value is None:
+            return []
+        series = value if isinstance(value, dict) else {(): value}
+        lines = self.header()
+        for values, number in series.items():
+            lines.append(f"{self.name}{_label_text(self.labelnames, values)} {_format_value(float(number))}")
+        return lines
+
+
+class MetricsRegistry:
+    """Uygulama genelindeki metrikler; aynı adla tekrar istenen metrik aynı nesnedir"""
+
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+        self.lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self.lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              callback: Optional[Callable] = None) -> Gauge:
+        """callback tek sayı veya {etiket değerleri tuple'ı: sayı} döndürür; None ise seri yazılmaz"""
+        gauge = self._register(Gauge(name, documentation, labelnames, callback))
+        if callback is not None:
+            gauge.callback = callback
+        return gauge
+
+    def render(self) -> str:
+        """Tüm metrikleri Prometheus metin formatında (0.0.4) döndür"""
+        lines: List[str] = []
+        for metric in list(self.metrics.values()):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# Uygulama, tarayıcı ve upstream istemcisinin paylaştığı kayıt
+registry = MetricsRegistry()
+
+# Tarayıcı aşamaları
+STAGE_SECONDS = registry.histogram(
+    'scanner_stage_seconds', 'Stream işleme aşamalarının süresi (receive: kuyrukta bekleme)', ('stage',))
+EVENT_TO_SIGNAL_SECONDS = registry.histogram(
+    'scanner_event_to_signal_seconds', 'Borsa olay zamanından (E) sinyal değerlendirmesine gecikme',
+    buckets=LAG_BUCKETS)
+STREAM_MESSAGES = registry.counter(
+    'scanner_stream_messages_total', 'Bağlantı başına alınan stream mesajları', ('connection',))
+STREAM_RECONNECTS = registry.counter(
+    'scanner_stream_reconnects_total', 'Bağlantı başına yeniden bağlanma sayısı', ('connection',))
+
+# HTTP ve upstream
+HTTP_SECONDS = registry.histogram(
+    'http_request_duration_seconds', 'Flask route süreleri', ('route', 'method'), REQUEST_BUCKETS)
+HTTP_REQUESTS = registry.counter(
+    'http_requests_total', 'Flask istekleri', ('route', 'method', 'status'))
+UPSTREAM_SECONDS = registry.histogram(
+    'upstream_request_duration_seconds', 'Binance REST çağrı süreleri (ağırlık beklemesi hariç)',
+    ('host',), REQUEST_BUCKETS)
+UPSTREAM_REQUESTS = registry.counter(
+    'upstream_requests_total', 'Binance REST çağrıları', ('host', 'status'))
+UPSTREAM_ERRORS = registry.counter(
+    'upstream_errors_total', 'Binance REST hataları (bağlantı hatası veya 4xx/5xx)', ('host', 'reason'))
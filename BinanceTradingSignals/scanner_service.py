@@ -0,0 +1,139 @@
+"""
+Tarayıcıyı web sürecinden ayrı çalıştıran servis
+
+Sinyaller ve durum paylaşılan sinyal tablosuna (signal_table.py) yazılır. SIGNAL_TABLE ortam
+değişkeni aynı dosyayı gösteren her web worker'ı tabloyu kilitsiz okur; start/stop istekleri
+servise kontrol dosyası üzerinden iletilir. Böylece app.py çok worker'lı sunucu arkasında
+çalışabilir ve istek işleme tarayıcı ile yarışmaz.
+
+Kullanım:
+    python scanner_service.py --table data/signal_table.bin --timeframe 5m --scan-mode full
+    SIGNAL_TABLE=data/signal_table.bin gunicorn -w 4 -b 0.0.0.0:5000 app:app
+"""
+import argparse
+import logging
+import os
+import signal
+import threading
+from typing import Any, Dict, Optional
+from binance_scanner import BinancePerperualScanner, scanner_options
+from kline_store import KlineStore
+from signal_table import SignalTableWriter, read_command
+from symbol_universe import SymbolUniverse
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TABLE = os.path.join(BASE_DIR, 'data', 'signal_table.bin')
+# Kalp atışı aralığı (sn) - okuyucular STALE_SECONDS'tan eski kalp atışını servis yok sayar
+HEARTBEAT_INTERVAL = 1.0
+
+
+class ScannerService:
+    """Tarayıcı yaşam döngüsü: komutları uygular, olayları tabloya yazar, kalp atışını sürdürür"""
+
+    def __init__(self, table: SignalTableWriter, store: Optional[KlineStore] = None,
+                 universe: Optional[SymbolUniverse] = None, workers: int = 0, poll_interval: float = 0.5,
+                 heartbeat_interval: float = HEARTBEAT_INTERVAL):
+        self.table = table
+        self.store = store
+        self.universe = universe
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.scanner: Optional[BinancePerperualScanner] = None
+        self.stopped = threading.Event()
+        # Servis başlamadan önce yazılmış komut tekrar uygulanmaz
+        previous = read_command(table.path)
+        self.last_command = previous['id'] if previous else None
+
+    def start_scanner(self, data: Dict[str, Any]):
+        """Yeni tarayıcı başlat (çalışan varsa önce durdurulur)"""
+        self.stop_scanner()
+        scanner = BinancePerperualScanner(**scanner_options(data), universe=self.universe,
+                                          events=self.table.on_event, store=self.store,
+                                          workers=int(data.get('workers', self.workers)))
+        self.table.reset(scanner.epoch)
+        self.scanner = scanner
+        scanner.start_scanning()
+        self.table.set_state(status=scanner.get_scanning_status())
+        logger.info(f"Tarayıcı başlatıldı - Timeframe: {', '.join(scanner.timeframes)}, Mod: {scanner.scan_mode}")
+
+    def stop_scanner(self):
+        if self.scanner is None:
+            return
+        self.scanner.stop_scanning()
+        self.scanner = None
+        logger.info("Tarayıcı durduruldu")
+
+    def _apply_command(self):
+        command = read_command(self.table.path)
+        if not command or command.get('id') == self.last_command:
+            return
+        self.last_command = command['id']
+        try:
+            if command.get('command') == 'start':
+                self.start_scanner(command.get('options') or {})
+            elif command.get('command') == 'stop':
+                self.stop_scanner()
+        except Exception as e:
+            logger.error(f"Komut uygulanamadı ({command.get('command')}): {e}")
+
+    def _heartbeat_loop(self):
+        """Kalp atışını komutlardan ayrı yaz (tarayıcıyı durdurmak STALE_SECONDS'tan uzun sürebilir)"""
+        while not self.stopped.is_set():
+            self.table.heartbeat()
+            self.stopped.wait(self.heartbeat_interval)
+
+    def run(self, initial: Optional[Dict[str, Any]] = None):
+        """stop() çağrılana kadar komutları işle; initial verilirse önce bu ayarlarla tarama başlatılır"""
+        heartbeat = threading.Thread(target=self._heartbeat_loop, name='signal-table-heartbeat', daemon=True)
+        heartbeat.start()
+        if initial is not None:
+            self.start_scanner(initial)
+        while not self.stopped.is_set():
+            self._apply_command()
+            self.stopped.wait(self.poll_interval)
+        heartbeat.join()
+        self.stop_scanner()
+        self.table.close()
+
+    def stop(self, *_):
+        self.stopped.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--table', default=os.environ.get('SIGNAL_TABLE', DEFAULT_TABLE),
+                        help="paylaşılan sinyal tablosu dosyası")
+    parser.add_argument('--timeframe', default='5m')
+    parser.add_argument('--timeframes', nargs='+', help="taban stream'den üretilecek zaman dilimleri")
+    parser.add_argument('--scan-mode', default='rotation', choices=('rotation', 'full'))
+    parser.add_argument('--evaluation', default='tick', choices=('tick', 'close'))
+    parser.add_argument('--coalesce-interval', type=float, default=0.25)
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--idle', action='store_true', help="start komutu gelene kadar tarama başlatma")
+    args = parser.parse_args()
+
+    store = KlineStore(os.environ.get('KLINE_STORE_DIR', os.path.join(BASE_DIR, 'data', 'klines')))
+    service = ScannerService(SignalTableWriter(args.table), store=store, universe=SymbolUniverse(),
+                             workers=args.workers)
+    signal.signal(signal.SIGINT, service.stop)
+    signal.signal(signal.SIGTERM, service.stop)
+
+    initial = None
+    if not args.idle:
+        initial = {
+            'timeframe': args.timeframe,
+            'timeframes': args.timeframes,
+            'scan_mode': args.scan_mode,
+            'evaluation': args.evaluation,
+            'coalesce_interval': args.coalesce_interval
+        }
+    logger.info(f"Sinyal tablosu: {args.table}")
+    service.run(initial)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,442 @@
+"""
+Tarayıcı süreci ile web worker'ları arasında paylaşılan sabit düzenli sinyal tablosu (mmap dosyası)
+
+Tek yazar (scanner_service.py) her anahtarın son sinyalini kendi satırına seqlock ile yazar:
+satır sırası yazmadan önce tek, yazdıktan sonra çift sayıya çıkar. Okuyucular kilit almadan
+sırayı önce ve sonra okur; değiştiyse satırı yeniden okur. Durum bloğu (JSON) ve epoch aynı
+şemayla başlıktaki sıra ile korunur. Kalkan sinyaller satırda pasif olarak kalır, böylece
+since/epoch değişim sorguları günlük tutmadan cevaplanır.
+
+Kontrol komutları (start/stop) tablonun yanındaki .control dosyasına atomik olarak yazılır.
+"""
+import itertools
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'FINYXSIG'
+LAYOUT_VERSION = 1
+DEFAULT_CAPACITY = 8192
+STATUS_SIZE = 256 * 1024
+HEADER_SIZE = 256
+# Yazarın kalp atışı bu süreden eskiyse tarayıcı servisi çalışmıyor sayılır (sn)
+STALE_SECONDS = 5.0
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('layout', '<u4'),
+    ('capacity', '<u4'),
+    ('seq', '<u8'),            # epoch + durum bloğu seqlock'u
+    ('epoch', 'S40'),
+    ('version', '<u8'),        # son yazılan satırın sürümü
+    ('rows', '<u4'),           # kullanılan satır sayısı
+    ('status_length', '<u4'),
+    ('heartbeat', '<f8'),
+    ('pid', '<u4'),
+])
+
+ROW_DTYPE = np.dtype([
+    ('seq', '<u8'),
+    ('version', '<u8'),
+    ('symbol', 'S24'),         # sinyal anahtarı (çoklu zaman diliminde 'BTCUSDT@15m')
+    ('timeframe', 'S8'),
+    ('timestamp', 'S8'),       # 'HH:MM:SS'
+    ('flags', 'u1'),
+    ('trend', 'u1'),
+    ('volume_status', 'u1'),
+    ('reserved', 'S5'),
+    ('price', '<f8'),
+    ('rsi', '<f8'),
+    ('price_change', '<f8'),
+])
+
+FLAG_ACTIVE = 1
+FLAG_TIMEFRAME = 2
+SIGNAL_FLAGS = (('BUY', 4), ('PUMP', 8), ('SELL', 16))
+
+# Metin alanları sabit tablolardaki sıra numarası olarak saklanır
+TRENDS = ('Yatay', 'Güçlü Yükseliş', 'Güçlü Düşüş', 'Zayıf Yükseliş', 'Zayıf Düşüş')
+VOLUME_STATUSES = ('Normal', 'Yüksek', 'Düşük')
+
+STATUS_OFFSET = HEADER_SIZE
+ROWS_OFFSET = STATUS_OFFSET + STATUS_SIZE
+
+
+def table_size(capacity: int) -> int:
+    return ROWS_OFFSET + capacity * ROW_DTYPE.itemsize
+
+
+def control_path(path: str) -> str:
+    return path + '.control'
+
+
+def _encode_row(payload: Dict[str, Any]) -> Tuple[int, int, int]:
+    """format_signal çıktısının (bayraklar, trend, hacim durumu) kodları"""
+    flags = FLAG_ACTIVE
+    for name, flag in SIGNAL_FLAGS:
+        if name in payload['signals']:
+            flags |= flag
+    if 'timeframe' in payload:
+        flags |= FLAG_TIMEFRAME
+    trend = TRENDS.index(payload['trend']) if payload['trend'] in TRENDS else 0
+    volume = VOLUME_STATUSES.index(payload['volume_status']) if payload['volume_status'] in VOLUME_STATUSES else 0
+    return flags, trend, volume
+
+
+def _backoff(attempt: int):
+    """Yazar satırı güncellerken bekle - birkaç denemeden sonra CPU yazara bırakılır"""
+    time.sleep(0 if attempt < 8 else 0.00005)
+
+
+def _decode_row(row) -> Dict[str, Any]:
+    """Satırı format_signal çıktısıyla aynı sözlüğe çevir"""
+    flags = int(row['flags'])
+    payload = {
+        'symbol': row['symbol'].decode(),
+        'signals': [name for name, flag in SIGNAL_FLAGS if flags & flag],
+        'price': float(row['price']),
+        'rsi': float(row['rsi']),
+        'trend': TRENDS[row['trend']],
+        'volume_status': VOLUME_STATUSES[row['volume_status']],
+        'price_change': float(row['price_change']),
+        'timestamp': row['timestamp'].decode()
+    }
+    if flags & FLAG_TIMEFRAME:
+        payload['timeframe'] = row['timeframe'].decode()
+    return payload
+
+
+class SignalTableWriter:
+    """
+    Tablonun tek yazarı - tarayıcının events callback'i on_event'e bağlanır
+    Aynı düzendeki mevcut dosya yeniden kullanılır (okuyucuların eşlemesi geçerli kalır).
+    """
+
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.slots: Dict[str, int] = {}
+        self.state: Dict[str, Any] = {'status': {'scanning': False}, 'active_symbols': [], 'batch': None}
+        self.full_warned = False
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        size = table_size(capacity)
+        if not self._reusable(size):
+            # Farklı düzen: yeni dosya atomik olarak yerine konur (eski eşlemeler eski dosyayı görür)
+            temp = f"{path}.{os.getpid()}.tmp"
+            with open(temp, 'wb') as f:
+                f.truncate(size)
+            os.replace(temp, path)
+
+        self.file = open(path, 'r+b')
+        self.map = mmap.mmap(self.file.fileno(), size)
+        self.header = np.ndarray((), HEADER_DTYPE, buffer=self.map)
+        self.status_area = np.ndarray((STATUS_SIZE,), np.uint8, buffer=self.map, offset=STATUS_OFFSET)
+        self.rows = np.ndarray((capacity,), ROW_DTYPE, buffer=self.map, offset=ROWS_OFFSET)
+
+        self.header['magic'] = MAGIC
+        self.header['layout'] = LAYOUT_VERSION
+        self.header['capacity'] = capacity
+        self.header['pid'] = os.getpid()
+        self.reset('')
+
+    def _reusable(self, size: int) -> bool:
+        try:
+            if os.path.getsize(self.path) != size:
+                return False
+            with open(self.path, 'rb') as f:
+                header = np.frombuffer(f.read(HEADER_DTYPE.itemsize), HEADER_DTYPE)[0]
+            return header['magic'] == MAGIC and header['layout'] == LAYOUT_VERSION and \
+                header['capacity'] == self.capacity
+        except OSError:
+            return False
+
+    def _begin_state(self) -> int:
+        """Başlık seqlock'unu tek sayıya çıkar (yazım bitince seq + 1 yazılır)"""
+        seq = int(self.header['seq']) | 1
+        self.header['seq'] = seq
+        return seq
+
+    def reset(self, epoch: str):
+        """Yeni tarayıcı örneği: tüm satırları boşalt ve epoch'u değiştir"""
+        with self.lock:
+            seq = self._begin_state()
+            # Satır sıraları sonraki çift sayıya ilerletilir - okuma sırasındaki satırlar yeniden okunur,
+            # önceki yazar satır ortasında kapandıysa tek kalan sıra da düzelir
+            sequences = (self.rows['seq'] | 1) + 1
+            self.rows[:] = np.zeros(1, ROW_DTYPE)
+            self.rows['seq'] = sequences
+            self.slots = {}
+            self.header['rows'] = 0
+            self.header['version'] = 0
+            self.header['epoch'] = epoch.encode()
+            self.state = {'status': {'scanning': False}, 'active_symbols': [], 'batch': None}
+            self._write_state()
+            self.header['seq'] = seq + 1
+
+    def heartbeat(self):
+        self.header['heartbeat'] = time.time()
+
+    def publish(self, key: str, payload: Optional[Dict[str, Any]]):
+        """Anahtarın son sinyalini yaz; payload None ise sinyal kalktı (satır pasif kalır)"""
+        with self.lock:
+            slot = self.slots.get(key)
+            if slot is None:
+                if payload is None:
+                    return
+                slot = len(self.slots)
+                if slot >= self.capacity:
+                    if not self.full_warned:
+                        logger.warning(f"Sinyal tablosu dolu ({self.capacity} satır), yeni anahtarlar yazılmıyor")
+                        self.full_warned = True
+                    return
+                self.slots[key] = slot
+
+            version = int(self.header['version']) + 1
+            record = np.zeros((), ROW_DTYPE)
+            record['version'] = version
+            record['symbol'] = key.encode()
+            if payload is not None:
+                record['flags'], record['trend'], record['volume_status'] = _encode_row(payload)
+                record['timeframe'] = payload.get('timeframe', '').encode()
+                record['timestamp'] = payload['timestamp'].encode()
+                record['price'] = payload['price']
+                record['rsi'] = payload['rsi']
+                record['price_change'] = payload['price_change']
+
+            seq = int(self.rows['seq'][slot]) + 1
+            self.rows['seq'][slot] = seq
+            record['seq'] = seq
+            self.rows[slot] = record
+            self.rows['seq'][slot] = seq + 1
+            if slot >= int(self.header['rows']):
+                self.header['rows'] = slot + 1
+            self.header['version'] = version
+
+    def _write_state(self):
+        body = json.dumps(self.state, default=str).encode()
+        if len(body) > STATUS_SIZE:
+            # Sembol listesi sığmazsa sadece durum yazılır
+            body = json.dumps({**self.state, 'active_symbols': []}, default=str).encode()[:STATUS_SIZE]
+        self.status_area[:len(body)] = np.frombuffer(body, np.uint8)
+        self.header['status_length'] = len(body)
+
+    def set_state(self, **changes):
+        """Durum bloğunu (status, active_symbols, batch) güncelle"""
+        with self.lock:
+            self.state.update(changes)
+            seq = self._begin_state()
+            self._write_state()
+            self.header['seq'] = seq + 1
+
+    def on_event(self, event: str, data: Any):
+        """Tarayıcı olayını tabloya işle (BinancePerperualScanner events callback'i)"""
+        if event == 'signal':
+            self.publish(data['symbol'], data)
+        elif event == 'signal_expired':
+            self.publish(data['symbol'], None)
+        elif event == 'status':
+            self.set_state(status=data)
+        elif event == 'batch':
+            self.set_state(active_symbols=data['symbols'],
+                           batch={key: value for key, value in data.items() if key != 'symbols'})
+
+    def close(self):
+        self.header['heartbeat'] = 0.0
+        self.map.close()
+        self.file.close()
+
+
+class SignalTableReader:
+    """
+    Tablonun kilitsiz okuyucusu - web worker başına bir örnek
+    Dosya yoksa veya yazarın kalp atışı eskiyse tarayıcı yok sayılır. Anlık görüntü ve durum
+    sürüm / sıra değişmedikçe önbellekten döner.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.map: Optional[mmap.mmap] = None
+        # Eşlenen dosyanın (inode, boyut) bilgisi - değişirse yeniden eşlenir
+        self.identity: Optional[Tuple[int, int]] = None
+        self.state_cache: Tuple[int, str, Optional[Dict[str, Any]]] = (-1, '', None)
+        self.snapshot_cache: Tuple[Any, Optional[Tuple[int, Dict[str, Dict[str, Any]]]]] = (None, None)
+        # (epoch, satır) -> (satır sürümü, çözülmüş satır) - sadece değişen satırlar yeniden çözülür
+        self.decoded: Dict[Tuple[str, int], Tuple[int, Dict[str, Any]]] = {}
+
+    def _open(self) -> bool:
+        """Dosyayı eşle; yazar dosyayı değiştirdiyse (inode veya boyut) yeniden eşle"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        if self.map is not None and (stat.st_ino, stat.st_size) == self.identity:
+            return True
+        with self.lock:
+            try:
+                with open(self.path, 'rb') as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return False
+            header = np.ndarray((), HEADER_DTYPE, buffer=mapped)
+            capacity = int(header['capacity'])
+            if header['magic'] != MAGIC or header['layout'] != LAYOUT_VERSION or \
+                    len(mapped) < table_size(capacity):
+                mapped.close()
+                return False
+            self.header = header
+            self.status_area = np.ndarray((STATUS_SIZE,), np.uint8, buffer=mapped, offset=STATUS_OFFSET)
+            self.rows = np.ndarray((capacity,), ROW_DTYPE, buffer=mapped, offset=ROWS_OFFSET)
+            self.map, self.identity = mapped, (stat.st_ino, stat.st_size)
+            self.state_cache = (-1, '', None)
+            self.snapshot_cache = (None, None)
+            self.decoded = {}
+        return True
+
+    def alive(self) -> bool:
+        """Tarayıcı servisi tabloya yazıyor mu"""
+        # Yeniden başlayan servisin yeni dosyası _open'da inode/boyut değişiminden yakalanır;
+        # aynı dosya kaldıkça eski kalp atışı her istekte yeniden eşlemeye yol açmaz
+        if not self._open():
+            return False
+        return time.time() - float(self.header['heartbeat']) < STALE_SECONDS
+
+    def _read_state(self) -> Tuple[int, str, Optional[Dict[str, Any]]]:
+        """(sıra, epoch, durum bloğu) - yazar bloğu güncellerken okunduysa yeniden okunur"""
+        for attempt in itertools.count():
+            seq = int(self.header['seq'])
+            if seq == self.state_cache[0]:
+                return self.state_cache
+            if seq & 1:
+                _backoff(attempt)
+                continue
+            epoch = self.header['epoch'].item().decode()
+            body = self.status_area[:int(self.header['status_length'])].tobytes()
+            if int(self.header['seq']) == seq:
+                break
+        self.state_cache = (seq, epoch, json.loads(body) if body else None)
+        return self.state_cache
+
+    def _read_rows(self, count: int) -> np.ndarray:
+        """İlk count satırın tutarlı kopyası (yazım sırasında okunan satırlar tek tek yeniden okunur)"""
+        rows = self.rows[:count]
+        before = rows['seq'].copy()
+        data = rows.copy()
+        after = rows['seq'].copy()
+        for index in np.flatnonzero((before != after) | (before & 1) | (data['seq'] != before)):
+            for attempt in itertools.count():
+                seq = int(self.rows['seq'][index])
+                if seq & 1:
+                    _backoff(attempt)
+                    continue
+                row = self.rows[index].copy()
+                if int(self.rows['seq'][index]) == seq:
+                    data[index] = row
+                    break
+        return data
+
+    def _snapshot(self) -> Optional[Tuple[str, int, np.ndarray]]:
+        """(epoch, sürüm, satırlar) - satırlar okunurken epoch değiştiyse yeniden okunur"""
+        while True:
+            seq, epoch, _ = self._read_state()
+            version = int(self.header['version'])
+            rows = self._read_rows(int(self.header['rows']))
+            if int(self.header['seq']) == seq:
+                return epoch, version, rows
+
+    @property
+    def epoch(self) -> Optional[str]:
+        return self._read_state()[1] if self.alive() else None
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """{'status', 'active_symbols', 'batch'} veya tarayıcı yoksa None"""
+        if not self.alive():
+            return None
+        return self._read_state()[2]
+
+    def get_scanning_status(self) -> Optional[Dict[str, Any]]:
+        state = self.get_state()
+        return state['status'] if state else None
+
+    def get_active_symbols(self) -> List[str]:
+        state = self.get_state()
+        return state['active_symbols'] if state else []
+
+    def get_signal_snapshot(self) -> Optional[Tuple[int, Dict[str, Dict[str, Any]]]]:
+        """(sürüm, anahtar -> format_signal çıktısı) veya tarayıcı yoksa None"""
+        if not self.alive():
+            return None
+        key = (int(self.header['seq']), int(self.header['version']), self.identity)
+        if self.snapshot_cache[0] == key:
+            return self.snapshot_cache[1]
+        epoch, version, rows = self._snapshot()
+        result = (version, {payload['symbol']: payload for payload in self._active_payloads(epoch, rows)})
+        self.snapshot_cache = (key, result)
+        return result
+
+    def _active_payloads(self, epoch: str, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Aktif satırların çözülmüş hali (döndürülen sözlükler paylaşılır, değiştirilmemeli)"""
+        if self.decoded and next(iter(self.decoded))[0] != epoch:
+            self.decoded = {}
+        payloads = []
+        for slot in np.flatnonzero(rows['flags'] & FLAG_ACTIVE).tolist():
+            version = int(rows['version'][slot])
+            cached = self.decoded.get((epoch, slot))
+            if cached is None or cached[0] != version:
+                cached = self.decoded[(epoch, slot)] = (version, _decode_row(rows[slot]))
+            payloads.append(cached[1])
+        return payloads
+
+    def get_signal_changes(self, since: int, epoch: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """BinancePerperualScanner.get_signal_changes ile aynı format (tarayıcı yoksa None)"""
+        if not self.alive():
+            return None
+        current, version, rows = self._snapshot()
+        if (epoch is not None and epoch != current) or since > version:
+            return {
+                'reset': True,
+                'epoch': current,
+                'version': version,
+                'signals': self._active_payloads(current, rows),
+                'removed': []
+            }
+
+        changed = rows[rows['version'] > since]
+        active = (changed['flags'] & FLAG_ACTIVE) != 0
+        return {
+            'reset': False,
+            'epoch': current,
+            'version': version,
+            'signals': [_decode_row(row) for row in changed[active]],
+            'removed': [row['symbol'].decode() for row in changed[~active]]
+        }
+
+
+def send_command(path: str, command: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Tarayıcı servisine komut gönder (son yazılan komut geçerlidir); komut kimliğini döndür"""
+    command_id = uuid.uuid4().hex
+    target = control_path(path)
+    temp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, 'w') as f:
+        json.dump({'id': command_id, 'command': command, 'options': options or {}}, f)
+    os.replace(temp, target)
+    return command_id
+
+
+def read_command(path: str) -> Optional[Dict[str, Any]]:
+    """Bekleyen son komutu oku (yoksa None)"""
+    try:
+        with open(control_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,201 @@
+import bisect
+import logging
+import multiprocessing as mp
+import time
+import zlib
+from typing import Dict, List, Any, Optional, Tuple
+from kline_buffer import KlineRingBuffer
+from stream_decode import decode_kline
+from trading_signals import FinyXStreamingSignal
+
+logger = logging.getLogger(__name__)
+
+# Kanal formatı (kompakt tuple'lar):
+#   Ana süreç -> worker : ('m', raw_message) | ('s', symbol, [(open_time, o, h, l, c, v, is_closed), ...]) | ('f',)
+#   Worker -> ana süreç : ('d', [(symbol, result_tuple | None), ...]) | ('f', worker_id, processed)
+RESULT_FIELDS = ('buy_signal', 'pump_signal', 'sell_signal', 'rsi', 'trend', 'volume_status', 'price', 'price_change')
+
+
+class ConsistentHashRing:
+    """
+    Sembolleri worker'lara tutarlı hash ile dağıtan halka
+    Süreçler arası kararlı olması için Python hash() yerine crc32 kullanılır
+    """
+
+    def __init__(self, nodes: int, replicas: int = 64):
+        self.ring: List[Tuple[int, int]] = sorted(
+            (zlib.crc32(f"worker-{node}-{replica}".encode()), node)
+            for node in range(nodes) for replica in range(replicas)
+        )
+        self.keys = [key for key, _ in self.ring]
+
+    def node_for(self, symbol: str) -> int:
+        """Sembolün sahibi olan worker indeksini döndür"""
+        index = bisect.bisect(self.keys, zlib.crc32(symbol.encode())) % len(self.ring)
+        return self.ring[index][1]
+
+
+class SymbolSignalState:
+    """Tek sembolün kline geçmişi ve artımlı sinyal motoru (worker içinde tutulur)"""
+
+    def __init__(self, timeframe_seconds: int, max_klines: int = 200):
+        self.timeframe_seconds = timeframe_seconds
+        self.klines = KlineRingBuffer(max_klines)
+        self.engine: Optional[FinyXStreamingSignal] = None
+
+    def store(self, open_time: int, open_price: float, high: float, low: float,
+              close: float, volume: float, is_closed: bool):
+        """Mumu geçmişe yaz (aynı açılış zamanı varsa güncelle)"""
+        self.klines.append(open_time, open_price, high, low, close, volume, is_closed)
+
+    def evaluate(self) -> Dict[str, Any]:
+        """Son mum için sinyali hesapla, boşluk varsa motoru geçmişten yeniden kur"""
+        self.engine = FinyXStreamingSignal.for_buffer(self.engine, self.klines, self.timeframe_seconds)
+        return self.engine.update(*self.klines.last())
+
+
+def _worker_main(worker_id: int, timeframe_seconds: int, inbox, outbox, refresh_seconds: float):
+    """Worker süreci: kendi sembollerinin durumunu tutar, sadece sinyal değişimlerini gönderir"""
+    states: Dict[str, SymbolSignalState] = {}
+    emitted: Dict[str, Tuple[Tuple[bool, bool, bool], float]] = {}
+    processed = 0
+
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+
+        deltas = []
+        for item in batch:
+            kind = item[0]
+
+            if kind == 'f':
+                if deltas:
+                    outbox.put(('d', deltas))
+                    deltas = []
+                outbox.put(('f', worker_id, processed))
+                continue
+
+            if kind == 's':
+                _, symbol, rows = item
+                state = states.setdefault(symbol, SymbolSignalState(timeframe_seconds))
+                for row in rows:
+                    state.store(*row)
+                continue
+
+            try:
+                row = decode_kline(item[1])
+                if row is None:
+                    continue
+                symbol = row[0]
+                state = states.setdefault(symbol, SymbolSignalState(timeframe_seconds))
+                state.store(*row[1:8])
+                processed += 1
+
+                if len(state.klines) < 100:
+                    continue
+                result = state.evaluate()
+            except Exception as e:
+                logger.error(f"Worker {worker_id} mesaj işleme hatası: {e}")
+                continue
+
+            # Sadece değişimleri gönder; aktif sinyaller refresh_seconds'ta bir tazelenir
+            flags = (result['buy_signal'], result['pump_signal'], result['sell_signal'])
+            now = time.monotonic()
+            previous = emitted.get(symbol)
+            if any(flags):
+                if previous is None or previous[0] != flags or now - previous[1] >= refresh_seconds:
+                    emitted[symbol] = (flags, now)
+                    deltas.append((symbol, tuple(result[field] for field in RESULT_FIELDS)))
+            elif previous is not None:
+                del emitted[symbol]
+                deltas.append((symbol, None))
+
+        if deltas:
+            outbox.put(('d', deltas))
+
+
+class SignalWorkerPool:
+    """
+    Sinyal değerlendirmesini N sürece bölen havuz (deneysel)
+    Ham stream mesajları sembole göre tutarlı hash ile worker'lara yönlendirilir.
+    Çok çekirdekli ölçüm yapılmadığı için tarayıcıda varsayılan kapalıdır (workers=0);
+    açmadan önce hedef makinede `benchmark.py sharding` ile tek süreçten hızlı olduğu doğrulanmalı.
+    """
+
+    def __init__(self, workers: int, timeframe_seconds: int, refresh_seconds: float = 30.0):
+        self.workers = workers
+        self.ring = ConsistentHashRing(workers)
+        self.routes: Dict[str, int] = {}
+
+        # Worker'lar thread'li ana süreçten fork edilmemeli
+        context = mp.get_context('spawn')
+        self.inboxes = [context.Queue() for _ in range(workers)]
+        self.outbox = context.Queue()
+        self.processes = [
+            context.Process(target=_worker_main,
+                            args=(index, timeframe_seconds, self.inboxes[index], self.outbox, refresh_seconds),
+                            daemon=True)
+            for index in range(workers)
+        ]
+        for process in self.processes:
+            process.start()
+
+    def worker_for(self, symbol: str) -> int:
+        """Sembolün worker indeksini döndür (önbellekli)"""
+        index = self.routes.get(symbol)
+        if index is None:
+            index = self.routes[symbol] = self.ring.node_for(symbol)
+        return index
+
+    def seed(self, symbol: str, rows: List[tuple]):
+        """Sembol geçmişini sahibi olan worker'a gönder"""
+        self.inboxes[self.worker_for(symbol)].put([('s', symbol, rows)])
+
+    def submit(self, messages: List[str]):
+        """Ham mesajları worker başına tek parti halinde yönlendir"""
+        batches: Dict[int, List[tuple]] = {}
+        for message in messages:
+            # Sembolü JSON çözmeden bul - çözme işi worker'da yapılır
+            start = message.find('"s":')
+            if start < 0:
+                continue
+            start = message.find('"', start + 4) + 1
+            symbol = message[start:message.find('"', start)]
+            batches.setdefault(self.worker_for(symbol), []).append(('m', message))
+
+        for index, batch in batches.items():
+            self.inboxes[index].put(batch)
+
+    def get_deltas(self, timeout: Optional[float] = None) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Worker'lardan gelen bir parti sinyal değişimini döndür"""
+        message = self.outbox.get(timeout=timeout)
+        if message[0] != 'd':
+            return []
+        return [(symbol, dict(zip(RESULT_FIELDS, result)) if result is not None else None)
+                for symbol, result in message[1]]
+
+    def flush(self, timeout: float = 60.0) -> Dict[int, int]:
+        """
+        Tüm worker'ların kuyruklarını bitirmesini bekle, işlenen mesaj sayılarını döndür
+        Beklerken gelen sinyal değişimleri atılır - get_deltas tüketicisi yokken (ölçümlerde) kullanın
+        """
+        for inbox in self.inboxes:
+            inbox.put([('f',)])
+
+        processed = {}
+        deadline = time.time() + timeout
+        while len(processed) < self.workers:
+            message = self.outbox.get(timeout=max(0.0, deadline - time.time()))
+            if message[0] == 'f':
+                processed[message[1]] = message[2]
+        return processed
+
+    def stop(self):
+        """Worker süreçlerini kapat"""
+        for inbox in self.inboxes:
+            inbox.put(None)
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
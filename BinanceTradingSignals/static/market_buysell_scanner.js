@@ -7,6 +7,7 @@ class BuySellScanner {
         this.scanProgress = 0;
         this.allSymbols = [];
         this.maxParallelRequests = 10; // Paralel istek sayısı
+        this.batchRequestSize = 100; // Tek toplu mum isteğindeki sembol sayısı
         this.signals = []; // Tespit edilen sinyaller
         this.timeframe = '5m'; // Varsayılan timeframe
     }
@@ -69,9 +70,9 @@ class BuySellScanner {
         }
     }
     
-    // Tüm sembolleri batch halinde tara
+    // Tüm sembolleri batch halinde tara (batch başına tek /api/candles/batch isteği)
     async scanAllSymbols() {
-        const batchSize = this.maxParallelRequests;
+        const batchSize = this.batchRequestSize;
         let processedCount = 0;
         const batches = [];
         
@@ -87,12 +88,21 @@ class BuySellScanner {
             // Batch başlangıcında ilerleme göster
             this.updateProgress(`Batch ${i+1}/${batches.length} taranıyor...`, Math.round((processedCount / this.allSymbols.length) * 100));
             
-            // Bu batch'deki tüm sembolleri paralel tara
-            const batchPromises = batch.map(symbol => this.scanSymbol(symbol));
-            const batchResults = await Promise.all(batchPromises);
+            // Bu batch'in mumlarını tek istekte al
+            let candleMap = {};
+            try {
+                candleMap = await this.getCandleBatch(batch);
+            } catch (error) {
+                console.error(`Batch ${i+1} mum verileri alınamadı:`, error);
+            }
             
-            // Sonuçları ana sinyaller listesine ekle
-            batchResults.forEach(result => {
+            batch.forEach(symbol => {
+                const candles = candleMap[symbol];
+                if (!candles || candles.length < 10) {
+                    console.log(`${symbol} için yeterli mum verisi yok`);
+                    return;
+                }
+                const result = this.checkBuySellSignals(symbol, candles);
                 if (result && result.length) {
                     this.signals.push(...result);
                 }
@@ -105,6 +115,33 @@ class BuySellScanner {
         }
     }
     
+    // Birden çok sembolün mumlarını tek istekte al (sütun formatı -> mum nesneleri)
+    async getCandleBatch(symbols) {
+        const response = await fetch('/api/candles/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ symbols, interval: this.timeframe, limit: 100 })
+        });
+        const data = await response.json();
+        
+        if (!data.success) {
+            throw new Error(data.message || "Toplu mum verisi alınamadı");
+        }
+        
+        const candleMap = {};
+        for (const [symbol, c] of Object.entries(data.candles)) {
+            candleMap[symbol] = c.t.map((timestamp, i) => ({
+                timestamp,
+                open: c.o[i],
+                high: c.h[i],
+                low: c.l[i],
+                close: c.c[i],
+                volume: c.v[i]
+            }));
+        }
+        return candleMap;
+    }
+    
     // Tekil sembolü tara
     async scanSymbol(symbol) {
         try {
@@ -282,7 +319,9 @@ document.addEventListener('DOMContentLoaded', () => {
     
     // Tarama Başlat butonuna event listener ekle
     document.getElementById('startBtn').addEventListener('click', async () => {
-        const timeframe = document.getElementById('timeframe').value;
+        const selected = document.getElementById('timeframe').value;
+        // Tümü seçeneği gerçek bir Binance aralığı değil - REST taraması taban 1m akışını kullanır
+        const timeframe = selected === 'multi' ? '1m' : selected;
         await window.buySellScanner.startScan(timeframe);
     });
     
@@ -7,6 +7,7 @@ class ScannerUI {
         this.scanProgress = 0;
         this.allSymbols = [];  // Dinamik olarak doldurulacak
         this.maxParallelRequests = 15; // Paralel istek sayısı
+        this.batchRequestSize = 100; // Tek toplu mum isteğindeki sembol sayısı
         this.initializeUI();
         this.fetchAllSymbols(); // Sembol listesini al
     }
@@ -149,12 +150,18 @@ class ScannerUI {
         progressElement.style.width = '0%';
 
         try {
-            let results = {};
+            // Tüm evren taraması sunucuda mum kapanışı başına bir kez hesaplanır
+            let results = null;
+            if ((document.getElementById('scanType')?.value || 'all') !== 'single') {
+                results = await this.fetchServerScan(scannerType);
+            }
             
-            if (scannerType === 'ALL') {
-                results = await this.scanAllSymbols();
-            } else {
-                results = await this.scanWithType(scannerType);
+            if (!results) {
+                if (scannerType === 'ALL') {
+                    results = await this.scanAllSymbols();
+                } else {
+                    results = await this.scanWithType(scannerType);
+                }
             }
             
             this.displayResults(results);
@@ -203,15 +210,16 @@ class ScannerUI {
         let processedCount = 0;
         
         // Tüm sembolleri parçalara böl ve paralel işle
-        const batchSize = this.maxParallelRequests; // Paralel işleme sayısı
+        const batchSize = this.batchRequestSize; // Batch başına tek toplu mum isteği
         
         for (let i = 0; i < totalSymbols; i += batchSize) {
             if (!this.isScanning) break;
             
-            const batch = this.allSymbols.slice(i, i + batchSize);
+            const batch = symbolsToScan.slice(i, i + batchSize);
+            const candleMap = await this.getCandleBatch(batch);
             const promises = batch.map(async (symbol) => {
                 try {
-                    const candles = await this.getCandleData(symbol);
+                    const candles = candleMap[symbol] || await this.getCandleData(symbol);
                     if (candles && candles.length > 0) {
                         return {
                             symbol, 
@@ -279,15 +287,16 @@ class ScannerUI {
         let processedCount = 0;
         
         // Tüm sembolleri parçalara böl ve paralel işle
-        const batchSize = this.maxParallelRequests; // Paralel işleme sayısı
+        const batchSize = this.batchRequestSize; // Batch başına tek toplu mum isteği
         
         for (let i = 0; i < totalSymbols; i += batchSize) {
             if (!this.isScanning) break;
             
-            const batch = this.allSymbols.slice(i, i + batchSize);
+            const batch = symbolsToScan.slice(i, i + batchSize);
+            const candleMap = await this.getCandleBatch(batch);
             const promises = batch.map(async (symbol) => {
                 try {
-                    const candles = await this.getCandleData(symbol);
+                    const candles = candleMap[symbol] || await this.getCandleData(symbol);
                     if (candles && candles.length > 0) {
                         let result = null;
                         
@@ -346,6 +355,76 @@ class ScannerUI {
         return results;
     }
 
+    // Sunucu tarafı LQ / Whale / V1 sonuçlarını al; başarısız olursa null döner (tarayıcıda taranır)
+    async fetchServerScan(scannerType) {
+        try {
+            const interval = document.getElementById('scannerTimeframe')?.value || '15m';
+            const scanners = scannerType === 'ALL' ? 'lq,whale,v1' : scannerType.toLowerCase();
+            const response = await fetch(`/api/finyx/scan?interval=${interval}&limit=100&scanners=${scanners}`);
+            const data = await response.json();
+            
+            if (!response.ok || !data.success) {
+                throw new Error(data.message || `HTTP ${response.status}`);
+            }
+            
+            // Sembol adları tarayıcıdaki formatla (_PERP) eşlensin
+            const results = { lq: [], whale: [], v1: [] };
+            for (const key of Object.keys(results)) {
+                results[key] = (data.results[key] || []).map(item => ({ ...item, symbol: item.symbol + '_PERP' }));
+            }
+            
+            // Sunucu V1 peakTime'ı ms olarak döndürür; tarayıcı taramasıyla aynı yerel saat metnine çevir
+            results.v1.forEach(item => {
+                item.peakTime = new Date(item.peakTime).toLocaleString();
+            });
+            
+            document.getElementById('progressFill').style.width = '100%';
+            return results;
+            
+        } catch (error) {
+            console.error('Sunucu taraması alınamadı, tarayıcıda taranıyor:', error);
+            return null;
+        }
+    }
+
+    // Batch'in mumlarını tek istekte al; başarısız olursa boş döner (sembol bazlı yedek yola düşülür)
+    async getCandleBatch(symbols) {
+        try {
+            const interval = document.getElementById('scannerTimeframe')?.value || '15m';
+            const response = await fetch('/api/candles/batch', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ symbols: symbols.map(s => s.replace('_PERP', '')), interval, limit: 100 })
+            });
+            
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            
+            const data = await response.json();
+            const candleMap = {};
+            
+            // Sütun formatını scanner formatına dönüştür (anahtarlar istekteki sembol adlarıyla)
+            symbols.forEach(symbol => {
+                const c = data.candles[symbol.replace('_PERP', '')];
+                if (!c) return;
+                candleMap[symbol] = c.t.map((timestamp, i) => ({
+                    timestamp,
+                    open: c.o[i],
+                    high: c.h[i],
+                    low: c.l[i],
+                    close: c.c[i],
+                    volume: c.v[i]
+                }));
+            });
+            return candleMap;
+            
+        } catch (error) {
+            console.error('Toplu candle verisi alınırken hata:', error);
+            return {};
+        }
+    }
+
     async getCandleData(symbol) {
         try {
             // Scanner için özel zaman dilimini kullan
@@ -460,6 +539,7 @@ class ScannerUI {
             signalElement.innerHTML = `
                 <div class="signal-symbol">${signal.symbol}</div>
                 <div class="signal-price">Peak: ${signal.peakPrice.toFixed(8)}</div>
+                <div class="signal-info">Peak Time: ${signal.peakTime}</div>
                 <div class="signal-info">Buy Levels:</div>
                 <div class="signal-info" style="color: #00ff00;">Low: ${signal.lowBuy.toFixed(8)}</div>
                 <div class="signal-info" style="color: #ffff00;">Med: ${signal.mediumBuy.toFixed(8)}</div>
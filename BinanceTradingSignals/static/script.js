@@ -71,7 +71,11 @@ class TradingDashboard {
     }
     
     async startScanning() {
-        const timeframe = document.getElementById('timeframe').value;
+        const select = document.getElementById('timeframe');
+        const multi = select.value === 'multi';
+        // Tümü: tek 1m akışı, diğer zaman dilimleri sunucuda üretilir
+        const timeframes = multi ? Array.from(select.options).map(option => option.value).filter(value => value !== 'multi') : null;
+        const timeframe = multi ? '1m' : select.value;
         
         this.showLoading('Tarama başlatılıyor...');
         
@@ -82,7 +86,8 @@ class TradingDashboard {
                     'Content-Type': 'application/json',
                 },
                 body: JSON.stringify({
-                    timeframe: timeframe
+                    timeframe: timeframe,
+                    timeframes: timeframes
                 })
             });
             
@@ -151,14 +156,36 @@ class TradingDashboard {
     
     async loadSignals() {
         try {
-            const response = await fetch('/api/signals');
+            // İmleç varsa sadece son sürümden bu yana değişenler istenir
+            const cursor = this.signalCursor
+                ? `?since=${this.signalCursor.version}&epoch=${this.signalCursor.epoch}`
+                : '';
+            const response = await fetch('/api/signals' + cursor);
             const data = await response.json();
             
             if (data.success) {
-                this.updateSignalsDisplay(data.signals);
+                const known = this.signalMap || new Map();
+                let hasNew = false;
+                
+                if (data.reset === false) {
+                    data.removed.forEach(symbol => known.delete(symbol));
+                    data.signals.forEach(signal => {
+                        hasNew = hasNew || !known.has(signal.symbol);
+                        known.set(signal.symbol, signal);
+                    });
+                    this.signalMap = known;
+                } else {
+                    this.signalMap = new Map(data.signals.map(signal => [signal.symbol, signal]));
+                    hasNew = data.signals.some(signal => !known.has(signal.symbol));
+                }
+                
+                if (data.epoch !== undefined) {
+                    this.signalCursor = { epoch: data.epoch, version: data.version };
+                }
+                this.renderSignalMap();
                 
                 // Play sound if new signals detected
-                if (data.signals.length > 0) {
+                if (hasNew) {
                     this.playSignalSound();
                 }
             }
@@ -310,7 +337,17 @@ class TradingDashboard {
     }
     
     startIntensiveUpdates() {
+        // Olaylar SSE ile itilir; tarayıcı desteklemiyorsa veya akış açılamazsa yoklamaya düş
+        if (window.EventSource && !this.streamFailed) {
+            this.openEventStream();
+        } else {
+            this.startPolling();
+        }
+    }
+    
+    startPolling() {
         // Intensive updates every 1 second when scanning for real-time console
+        if (this.intensiveInterval) return;
         this.intensiveInterval = setInterval(() => {
             this.loadSignals();
             this.loadStatus();
@@ -318,7 +355,95 @@ class TradingDashboard {
         }, 1000);
     }
     
+    openEventStream() {
+        this.closeEventStream();
+        this.signalMap = new Map();
+        this.activeSymbols = [];
+        
+        const source = new EventSource('/api/stream');
+        this.eventSource = source;
+        const parse = handler => event => handler(JSON.parse(event.data));
+        
+        source.addEventListener('snapshot', parse(data => {
+            this.signalMap = new Map(data.signals.map(signal => [signal.symbol, signal]));
+            this.activeSymbols = data.active_symbols || [];
+            this.renderSignalMap();
+            this.applyStatus(data.status);
+        }));
+        
+        source.addEventListener('signal', parse(signal => {
+            const isNew = !this.signalMap.has(signal.symbol);
+            this.signalMap.set(signal.symbol, signal);
+            this.renderSignalMap();
+            this.addConsoleMessage(`${signal.symbol}: ${signal.signals.join(' + ')} sinyali`, 'success');
+            if (isNew) {
+                this.playSignalSound();
+            }
+        }));
+        
+        source.addEventListener('signal_expired', parse(data => {
+            if (this.signalMap.delete(data.symbol)) {
+                this.renderSignalMap();
+            }
+        }));
+        
+        source.addEventListener('batch', parse(data => {
+            this.activeSymbols = data.symbols;
+            const message = data.total_batches > 1
+                ? `Batch ${data.current_batch + 1}/${data.total_batches} taranıyor (${data.symbols.length} coin)`
+                : `Tüm semboller taranıyor (${data.symbols.length} coin)`;
+            this.addConsoleMessage(message, 'scanning');
+        }));
+        
+        source.addEventListener('status', parse(status => this.applyStatus(status)));
+        
+        source.onerror = () => {
+            // CONNECTING durumunda EventSource kendisi yeniden bağlanır
+            if (source.readyState === EventSource.CLOSED) {
+                console.warn('Olay akışı kapandı, yoklamaya geçiliyor');
+                this.streamFailed = true;
+                this.closeEventStream();
+                this.startPolling();
+            }
+        };
+    }
+    
+    closeEventStream() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+    }
+    
+    applyStatus(status) {
+        if (status.current_batch === undefined) {
+            return;
+        }
+        this.scanning = status.scanning;
+
+        // Tam evren modunda geçmiş yükleme ilerlemesi (semboller hazır oldukça canlıya geçer)
+        if (status.scan_mode === 'full' && status.seeding) {
+            if (status.phase === 'seeding') {
+                this.addConsoleMessage(`Geçmiş yükleniyor: ${status.seeding.seeded}/${status.seeding.total} sembol canlı`, 'info');
+            } else if (status.phase === 'live' && this.lastPhase === 'seeding') {
+                this.addConsoleMessage(`Tüm semboller canlı (${status.seeding.seeded})`, 'success');
+            }
+        }
+        this.lastPhase = status.phase;
+
+        this.updateStatusDisplay(status, this.activeSymbols);
+        this.updateUI();
+    }
+    
+    renderSignalMap() {
+        // Son sinyaller önce
+        const signals = Array.from(this.signalMap.values())
+            .sort((a, b) => b.timestamp.localeCompare(a.timestamp));
+        this.updateSignalsDisplay(signals);
+    }
+    
     stopIntensiveUpdates() {
+        this.closeEventStream();
         if (this.intensiveInterval) {
             clearInterval(this.intensiveInterval);
             this.intensiveInterval = null;
@@ -326,6 +451,8 @@ class TradingDashboard {
     }
     
     refreshSignals() {
+        // Tam listeyi yeniden iste
+        this.signalCursor = null;
         this.loadSignals();
         this.showNotification('Bilgi', 'Sinyaller yenilendi', 'success');
     }
@@ -0,0 +1,33 @@
+"""
+Combined-stream kline mesajlarının hızlı çözümü
+
+orjson kuruluysa mesajlar onunla, değilse standart json ile çözülür. Mum alanları ara sözlük
+veya Timestamp oluşturmadan tek tuple olarak döner; açılış zamanı int64 ms olarak kalır.
+"""
+import json
+from typing import Optional, Tuple, Union
+
+# orjson opsiyonel: kuruluysa mesaj çözümü yaklaşık iki kat hızlı
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+KlineRow = Tuple[str, int, float, float, float, float, float, bool, int]
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def decode_kline(message: Union[str, bytes], parser=None) -> Optional[KlineRow]:
+    """
+    Mesajı (symbol, open_time, open, high, low, close, volume, is_closed, event_time) olarak çöz
+    event_time borsanın olay zamanıdır (ms, yoksa 0). Kline olmayan mesajlarda None döner.
+    parser: ölçümler için çözücüyü değiştirir.
+    """
+    data = (parser or loads)(message)
+    data = data.get('data', data)
+    kline = data.get('k')
+    if kline is None:
+        return None
+    return (kline['s'], kline['t'], float(kline['o']), float(kline['h']), float(kline['l']),
+            float(kline['c']), float(kline['v']), kline['x'], data.get('E', 0))
@@ -0,0 +1,301 @@
+"""
+Kline stream kayıt ve tekrar oynatma aracı
+
+Kayıt (ağ gerekir):
+    python stream_replay.py record --out kayit.jsonl.gz --seconds 120 --mode full
+Tekrar oynatma (ağ gerekmez):
+    python stream_replay.py replay kayit.jsonl.gz --pace original
+"""
+import argparse
+import gzip
+import json
+import logging
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StreamRecorder:
+    """
+    Ham combined-stream mesajlarını ve REST yanıtlarını gzip'li JSON satırlarına yazar
+    Satır formatı: {"t": alış zamanı (ms), "k": "ws" | "rest", ...}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = gzip.open(path, 'wt', encoding='utf-8')
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def _write(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(',', ':'))
+        with self.lock:
+            if self.file:
+                self.file.write(line + '\n')
+                self.count += 1
+
+    def record_message(self, message: str):
+        """Ham stream mesajını kaydet"""
+        self._write({'t': int(time.time() * 1000), 'k': 'ws', 'm': message})
+
+    def record_rest(self, url: str, params: Optional[Dict[str, Any]], body: Any):
+        """REST yanıtını kaydet"""
+        self._write({'t': int(time.time() * 1000), 'k': 'rest', 'u': url, 'p': params or {}, 'b': body})
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+
+def load_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """Kayıt dosyasını satır satır oku"""
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ReplayDriver:
+    """
+    Kaydı tarayıcıya ağ olmadan besler
+    REST çağrıları kayıttaki yanıtlardan, saat kayıttaki zamandan gelir.
+    pace='original' kayıttaki aralıklarla, pace='fast' bekleme olmadan oynatır.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]], pace: str = 'fast', speed: float = 1.0):
+        self.records = records
+        self.pace = pace
+        self.speed = speed
+        self.current_ms = records[0]['t'] if records else int(time.time() * 1000)
+        self.rest_responses: Dict[tuple, Any] = {}
+        # Mesajın alınmasından sinyalin yayınlanmasına (_publish_signal) geçen süreler (sn)
+        self.publish_latencies: List[float] = []
+        # Artımlı motorun geçmişten (yeniden) kurulma süreleri (sn) - yayın gecikmesinden ayrı raporlanır
+        self.rebuild_seconds: List[float] = []
+        self.rebuilt_keys = set()
+        # sembol -> henüz değerlendirilmemiş en eski mesajın alınma zamanı
+        self.pending_receipts: Dict[str, float] = {}
+        self.receipt = 0.0
+
+        for record in records:
+            if record['k'] == 'rest':
+                self.rest_responses[self._rest_key(record['u'], record['p'])] = record['b']
+
+    @classmethod
+    def from_file(cls, path: str, pace: str = 'fast', speed: float = 1.0) -> 'ReplayDriver':
+        return cls(list(load_recording(path)), pace, speed)
+
+    def _rest_key(self, url: str, params: Optional[Dict[str, Any]]) -> tuple:
+        # limit eşleşmesi aranmaz - tohumlama sırasında kayıttakinden farklı limit istenebilir
+        params = params or {}
+        return (url.split('?')[0], params.get('symbol'), params.get('interval'))
+
+    def rest_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Kayıttaki REST yanıtını döndür"""
+        key = self._rest_key(url, params)
+        if key not in self.rest_responses:
+            raise ConnectionError(f"Kayıtta yanıt yok: {key}")
+        return self.rest_responses[key]
+
+    def clock(self) -> float:
+        return self.current_ms / 1000
+
+    @property
+    def symbols(self) -> List[str]:
+        """Kayıtta geçmişi bulunan semboller"""
+        return [key[1] for key in self.rest_responses if key[1]]
+
+    def attach(self, scanner):
+        """Tarayıcının ağ ve saat bağımlılıklarını kayda yönlendir, ölçüm noktalarını bağla"""
+        scanner._rest_get = self.rest_get
+        scanner.clock = self.clock
+
+        store_kline = scanner._store_kline
+        publish_signal = scanner._publish_signal
+        analyze_signals = scanner._analyze_signals
+        close_sweep = scanner._close_sweep
+        get_signal_engine = scanner._get_signal_engine
+
+        def timed_store(symbol, *args, **kwargs):
+            # Kapanış modunda açık mum tick'i değerlendirilmez; gecikme kapanış mesajından ölçülür
+            if scanner.evaluation == "tick" or args[6]:
+                self.pending_receipts.setdefault(symbol, self.receipt)
+            return store_kline(symbol, *args, **kwargs)
+
+        def timed_publish(key, signals):
+            publish_signal(key, signals)
+            received = self.pending_receipts.get(key.split('@')[0])
+            if key in self.rebuilt_keys:
+                # Kurulum maliyeti rebuild_seconds'ta; bu yayın gecikme dağılımına katılmaz
+                self.rebuilt_keys.discard(key)
+            elif received is not None:
+                self.publish_latencies.append(time.perf_counter() - received)
+
+        def timed_analyze(symbol):
+            try:
+                analyze_signals(symbol)
+            finally:
+                self.pending_receipts.pop(symbol, None)
+
+        def timed_sweep(open_time):
+            symbols = list(scanner.close_pending.get(open_time, ()))
+            try:
+                close_sweep(open_time)
+            finally:
+                for symbol in symbols:
+                    self.pending_receipts.pop(symbol, None)
+
+        def timed_engine(key, klines, timeframe_seconds):
+            previous = scanner.signal_engines.get(key)
+            started = time.perf_counter()
+            engine = get_signal_engine(key, klines, timeframe_seconds)
+            if engine is not previous:
+                self.rebuild_seconds.append(time.perf_counter() - started)
+                self.rebuilt_keys.add(key)
+            return engine
+
+        scanner._store_kline = timed_store
+        scanner._publish_signal = timed_publish
+        scanner._analyze_signals = timed_analyze
+        scanner._close_sweep = timed_sweep
+        scanner._get_signal_engine = timed_engine
+
+    @staticmethod
+    def _run_due(scanner, until: Optional[float] = None):
+        """
+        Zamanlayıcıda vakti gelen kirli sembolleri değerlendir (_tick_evaluator'ın event loop'suz karşılığı)
+        until verilirse o ana kadar bekleyerek değerlendirmeye devam edilir
+        """
+        scheduler = scanner.tick_scheduler
+        while True:
+            for symbol in scheduler.pop_due():
+                scanner._analyze_signals(symbol)
+            now = scheduler.clock()
+            due = scheduler.next_due()
+            if until is None or now >= until:
+                return
+            if due is None or due > until:
+                time.sleep(max(0.0, until - now))
+                return
+            time.sleep(max(0.0, due - now))
+
+    def run(self, scanner, seed: bool = True) -> Dict[str, Any]:
+        """
+        Kaydı canlıdaki yolla oynat ve özet istatistikleri döndür
+        Açık mum tick'leri tarayıcının zamanlayıcısından geçer; her yayında sembolün değerlendirilmemiş
+        en eski mesajının alınmasından _publish_signal'ın bitişine kadar geçen süre publish_latencies'e
+        eklenir. Motor kurulumları (ilk kurulum ve boşluk sonrası yeniden kurulum) rebuild_seconds'a
+        yazılır; kurulum içeren değerlendirmelerin yayınları gecikme dağılımına katılmaz.
+        """
+        self.attach(scanner)
+        messages = [record for record in self.records if record['k'] == 'ws']
+
+        if seed:
+            for symbol in self.symbols:
+                scanner._seed_history(symbol)
+
+        scheduled = scanner.evaluation == "tick" and scanner.tick_scheduler is not None
+        # Tohumlama sırasında yazılan mumlar ölçülmez
+        self.pending_receipts.clear()
+        if scheduled:
+            # _on_kline_message sadece set() çağırır; değerlendirmeyi _run_due yapar
+            scanner.tick_wakeup = threading.Event()
+            scheduler_clock = scanner.tick_scheduler.clock
+
+        started = time.perf_counter()
+        first_ms = messages[0]['t'] if messages else 0
+        try:
+            for record in messages:
+                if self.pace == 'original':
+                    target = started + (record['t'] - first_ms) / 1000 / self.speed
+                    if scheduled:
+                        self._run_due(scanner, scheduler_clock() + target - time.perf_counter())
+                    else:
+                        delay = target - time.perf_counter()
+                        if delay > 0:
+                            time.sleep(delay)
+
+                self.current_ms = record['t']
+                self.receipt = time.perf_counter()
+                scanner._on_kline_message(None, record['m'])
+                if scheduled:
+                    self._run_due(scanner)
+
+            # Birleştirilip bekleyen son tick'ler
+            if scheduled:
+                due = scanner.tick_scheduler.next_due()
+                while due is not None:
+                    self._run_due(scanner, due)
+                    due = scanner.tick_scheduler.next_due()
+        finally:
+            if scheduled:
+                scanner.tick_wakeup = None
+
+        elapsed = time.perf_counter() - started
+        return {
+            'messages': len(messages),
+            'elapsed': elapsed,
+            'ticks_per_second': len(messages) / elapsed if elapsed > 0 else 0.0,
+            'signals': len(scanner.signals),
+            'publishes': len(self.publish_latencies),
+            'rebuilds': len(self.rebuild_seconds),
+            'rebuild_seconds': sum(self.rebuild_seconds)
+        }
+
+
+def record(args):
+    """Canlı stream'i belirtilen süre boyunca kaydet"""
+    from binance_scanner import BinancePerperualScanner
+
+    recorder = StreamRecorder(args.out)
+    scanner = BinancePerperualScanner(timeframe=args.timeframe, scan_mode=args.mode, recorder=recorder)
+    try:
+        scanner.start_scanning()
+        time.sleep(args.seconds)
+    finally:
+        scanner.stop_scanning()
+        recorder.close()
+    print(f"{recorder.count} kayıt yazıldı: {args.out}")
+
+
+def replay(args):
+    """Kaydı ağ olmadan tarayıcıya oynat"""
+    from binance_scanner import BinancePerperualScanner
+
+    driver = ReplayDriver.from_file(args.path, args.pace, args.speed)
+    scanner = BinancePerperualScanner(timeframe=args.timeframe, symbols=driver.symbols or ['BTCUSDT'])
+    stats = driver.run(scanner)
+    print(f"{stats['messages']} mesaj, {stats['elapsed']:.2f} sn, "
+          f"{stats['ticks_per_second']:.0f} tick/sn, {stats['signals']} aktif sinyal, "
+          f"{stats['rebuilds']} motor kurulumu ({stats['rebuild_seconds'] * 1000:.0f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kline stream kayıt/oynatma")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help='Canlı stream kaydet')
+    record_parser.add_argument('--out', required=True)
+    record_parser.add_argument('--seconds', type=int, default=60)
+    record_parser.add_argument('--timeframe', default='5m')
+    record_parser.add_argument('--mode', default='full', choices=['rotation', 'full'])
+    record_parser.set_defaults(func=record)
+
+    replay_parser = subparsers.add_parser('replay', help='Kaydı oynat')
+    replay_parser.add_argument('path')
+    replay_parser.add_argument('--timeframe', default='5m')
+    replay_parser.add_argument('--pace', default='fast', choices=['fast', 'original'])
+    replay_parser.add_argument('--speed', type=float, default=1.0)
+    replay_parser.set_defaults(func=replay)
+
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from upstream import shared_client as upstream, PRIORITY_SCANNER
+
+logger = logging.getLogger(__name__)
+
+EXCHANGE_INFO_URL = "https://fapi.binance.com/fapi/v1/exchangeInfo"
+
+# Tarayıcının önce dinlediği popüler coinler
+PRIORITY_COINS = ['BTC', 'ETH', 'BNB', 'ADA', 'DOT', 'LINK', 'SOL', 'MATIC', 'AVAX', 'ATOM']
+
+
+class SymbolUniverse:
+    """
+    Futures exchangeInfo'yu bir kez indirip tüm uygulamaya paylaştıran servis
+    Arka planda düzenli yenilenir; route'lar için filtrelenmiş ve önceden serileştirilmiş
+    görünümler (gövde + ETag) tutar.
+    """
+
+    def __init__(self, refresh_interval: float = 300.0, fetch: Optional[Callable[[], Any]] = None):
+        self.refresh_interval = refresh_interval
+        self.fetch = fetch or self._fetch_exchange_info
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.views: Dict[str, Tuple[bytes, str]] = {}
+        self.perpetual_usdt: List[str] = []
+        self.updated_at: Optional[float] = None
+        self.refresh_thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+
+    def _fetch_exchange_info(self) -> Dict[str, Any]:
+        response = upstream.get(EXCHANGE_INFO_URL, priority=PRIORITY_SCANNER)
+        response.raise_for_status()
+        return response.json()
+
+    def _serialize(self, payload: Any) -> Tuple[bytes, str]:
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return body, hashlib.sha1(body).hexdigest()
+
+    def refresh(self) -> bool:
+        """exchangeInfo'yu indir ve tüm görünümleri yeniden oluştur"""
+        try:
+            data = self.fetch()
+            symbols = data['symbols']
+        except Exception as e:
+            logger.error(f"exchangeInfo yenilenemedi: {e}")
+            return False
+
+        perpetual_usdt = [s['symbol'] for s in symbols
+                          if s['status'] == 'TRADING' and s['contractType'] == 'PERPETUAL'
+                          and s['symbol'].endswith('USDT')]
+
+        # Önce popüler coinler, sonra diğerleri
+        priority = [s for s in perpetual_usdt if any(coin in s for coin in PRIORITY_COINS)]
+        priority_set = set(priority)
+        ordered = priority + [s for s in perpetual_usdt if s not in priority_set]
+
+        views = {
+            # Ham yanıt (/api/binance/fapi/v1/exchangeInfo proxy'si)
+            'exchange_info': self._serialize(data),
+            # Tüm sembol kayıtları
+            'symbols_full': self._serialize(symbols),
+            # İşlemde olan USDT sembolleri (/api/get_symbols)
+            'trading_usdt': self._serialize({
+                'success': True,
+                'symbols': [s['symbol'] for s in symbols
+                            if s.get('status') == 'TRADING' and 'USDT' in s.get('symbol', '')]
+            }),
+            # Perpetual kontratlar (/api/futures/symbols)
+            'perpetual': self._serialize([{
+                'symbol': s['symbol'],
+                'status': s['status'],
+                'baseAsset': s['baseAsset'],
+                'quoteAsset': s['quoteAsset']
+            } for s in symbols if s['contractType'] == 'PERPETUAL']),
+            # Tarayıcı evreni
+            'perpetual_usdt': self._serialize(ordered)
+        }
+
+        with self.lock:
+            self.views = views
+            self.perpetual_usdt = ordered
+            self.updated_at = time.time()
+
+        logger.info(f"exchangeInfo güncellendi: {len(symbols)} sembol, {len(ordered)} USDT perpetual")
+        return True
+
+    def ensure_loaded(self):
+        """İlk kullanımda veriyi yükle ve arka plan yenilemesini başlat"""
+        if self.updated_at is None:
+            # Eşzamanlı ilk istekler tek indirmede birleşir
+            with self.load_lock:
+                if self.updated_at is None and not self.refresh():
+                    raise RuntimeError("Sembol listesi alınamadı")
+
+                if self.refresh_thread is None:
+                    self.refresh_thread = threading.Thread(target=self._refresh_loop)
+                    self.refresh_thread.daemon = True
+                    self.refresh_thread.start()
+
+    def _refresh_loop(self):
+        while not self.stop_event.wait(self.refresh_interval):
+            self.refresh()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def view(self, name: str) -> Tuple[bytes, str]:
+        """Önceden serileştirilmiş görünümü (gövde, ETag) döndür"""
+        self.ensure_loaded()
+        with self.lock:
+            return self.views[name]
+
+    def perpetual_symbols(self) -> List[str]:
+        """Tarayıcı için sıralı USDT perpetual sembolleri"""
+        self.ensure_loaded()
+        with self.lock:
+            return list(self.perpetual_usdt)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'loaded': self.updated_at is not None,
+            'updated_at': self.updated_at,
+            'perpetual_usdt': len(self.perpetual_usdt),
+            'refresh_interval': self.refresh_interval
+        }
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modüller düz yerleşimde: testler proje kökünden import eder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
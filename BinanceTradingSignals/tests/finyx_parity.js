@@ -0,0 +1,34 @@
+// static/finyx_scanners.js tarayıcılarını Node ile çalıştırır (test_finyx_scanners.py referansı)
+// Girdi (stdin): {"SEMBOL": [[open_time, open, high, low, close, volume], ...]}
+// Çıktı (stdout): {"SEMBOL": {"lq": ..., "whale": ..., "v1": ...}} - zaman damgaları çıkarılmış
+const fs = require('fs');
+const path = require('path');
+
+global.window = globalThis;
+const print = console.log;
+console.log = () => {};
+require(path.join(__dirname, '..', 'static', 'finyx_scanners.js'));
+
+const scanners = window.finyxScanners;
+const input = JSON.parse(fs.readFileSync(0, 'utf8'));
+const output = {};
+
+for (const [symbol, rows] of Object.entries(input)) {
+    const candles = rows.map(row => scanners.v1Scanner.formatCandle(row));
+
+    const whale = scanners.whaleScanner.processData(symbol, candles);
+    if (whale) delete whale.timestamp;
+
+    const v1Results = scanners.v1Scanner.findLatestPeak(candles);
+    let v1 = null;
+    if (v1Results.length > 0) {
+        v1 = v1Results[0];
+        delete v1.timestamp;
+        // JS peakTime yerel saat metnidir; karşılaştırma için tepe mumunun açılış zamanı da yazılır
+        v1.peakOpenTime = candles[candles.length - 1 - v1.peakDistance].timestamp;
+    }
+
+    output[symbol] = { lq: scanners.lqScanner.get786Level(candles), whale, v1 };
+}
+
+print(JSON.stringify(output));
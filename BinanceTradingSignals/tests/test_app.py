@@ -0,0 +1,70 @@
+"""
+Flask API uç noktaları (upstream'e gitmeden)
+"""
+import app as app_module
+from signal_table import SignalTableReader, SignalTableWriter
+
+
+def test_batch_rejects_unknown_interval(monkeypatch):
+    calls = []
+    monkeypatch.setattr(app_module, 'fetch_klines', lambda *args: calls.append(args) or (200, []))
+    client = app_module.app.test_client()
+    response = client.post('/api/candles/batch', json={'symbols': ['BTCUSDT', 'ETHUSDT'], 'interval': 'multi'})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+    assert calls == []
+
+
+def test_batch_accepts_known_interval(monkeypatch):
+    row = [0, '1', '2', '0.5', '1.5', '10', 59999, '0', 1, '0', '0', '0']
+    monkeypatch.setattr(app_module, 'fetch_klines', lambda market, symbol, interval, limit: (200, [row]))
+    client = app_module.app.test_client()
+    response = client.post('/api/candles/batch', json={'symbols': ['BTCUSDT'], 'interval': '1m'})
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['success'] is True
+    assert 'BTCUSDT' in body['candles']
+
+
+def table_mode(monkeypatch, tmp_path, status, batch=None, active_symbols=()):
+    """Ayrı tarayıcı servisi gibi tabloya durum yazan writer ve app'e bağlı okuyucu"""
+    path = str(tmp_path / 'signal_table.bin')
+    writer = SignalTableWriter(path, capacity=16)
+    writer.set_state(status=status, batch=batch, active_symbols=list(active_symbols))
+    writer.heartbeat()
+    monkeypatch.setattr(app_module, 'scanner', None)
+    monkeypatch.setattr(app_module, 'signal_table', SignalTableReader(path))
+    monkeypatch.setattr(app_module, 'SIGNAL_TABLE_PATH', path)
+    return writer
+
+
+def test_table_mode_reports_service_scanner(monkeypatch, tmp_path):
+    status = {'scanning': True, 'scan_mode': 'rotation', 'current_batch': 1, 'queue_depth': 7,
+              'signals_count': 3, 'streams': ['current'], 'scheduler': {'pending': 2}}
+    writer = table_mode(monkeypatch, tmp_path, status, batch={'current_batch': 1, 'total_batches': 4},
+                        active_symbols=['AAAUSDT', 'BBBUSDT'])
+    client = app_module.app.test_client()
+    try:
+        assert client.get('/api/health').get_json()['scanner_status'] is True
+
+        messages = client.get('/api/console_messages').get_json()['messages']
+        assert messages[0]['message'] == 'Batch 2/4 taranıyor'
+        assert [message['message'] for message in messages[1:]] == ['AAAUSDT taranıyor...', 'BBBUSDT taranıyor...']
+
+        metrics = client.get('/api/metrics').get_data(as_text=True)
+        assert 'scanner_queue_depth 7' in metrics
+        assert 'scanner_active_signals 3' in metrics
+        assert 'scanner_active_symbols 2' in metrics
+        assert 'scanner_stream_connected{connection="current"} 1' in metrics
+        assert 'scanner_scheduler_pending 2' in metrics
+    finally:
+        writer.close()
+
+
+def test_table_mode_without_service(monkeypatch, tmp_path):
+    writer = table_mode(monkeypatch, tmp_path, {'scanning': True})
+    writer.close()
+    client = app_module.app.test_client()
+    assert client.get('/api/health').get_json()['scanner_status'] is False
+    assert client.get('/api/console_messages').get_json()['messages'] == []
+    assert 'scanner_active_symbols ' not in client.get('/api/metrics').get_data(as_text=True)
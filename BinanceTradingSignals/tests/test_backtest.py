@@ -0,0 +1,129 @@
+"""
+Backtest: ileri getiriler, ısınma maskesi, koşul sayaçları, birleştirme ve CSV okuma
+"""
+import numpy as np
+import pandas as pd
+import pytest
+import backtest
+from backtest import MIN_BARS, backtest_symbol, load_csv, merge_stats, run_backtest
+from trading_signals import FinyXAdvancedSignal
+
+BAR_MS = 300000
+HORIZONS = (1, 3)
+
+
+def columns(count, seed=None):
+    if seed is None:
+        closes = 100.0 + np.arange(count)
+    else:
+        rng = np.random.default_rng(seed)
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.012, count)))
+    opens = np.r_[closes[0], closes[:-1]]
+    volumes = np.ones(count) if seed is None else \
+        np.random.default_rng(seed + 1).lognormal(5, 0.5, count) * np.where(np.arange(count) % 17 == 0, 4, 1)
+    return (np.arange(count, dtype=np.int64) * BAR_MS, opens, np.maximum(opens, closes) * 1.003,
+            np.minimum(opens, closes) * 0.997, closes, volumes)
+
+
+def scripted_arrays(count, fired, conditions=()):
+    """signal_arrays yerine: fired {tür: [mum]}, conditions {koşul adı: [mum]}"""
+    def fake(self, *args, **kwargs):
+        arrays = {'rsi': np.linspace(0, 100, count)}
+        for kind in backtest.SIGNAL_TYPES:
+            arrays[f'is_{kind}_signal'] = np.isin(np.arange(count), fired.get(kind, []))
+            for n in (1, 2, 3):
+                name = f'{kind}_condition_{n}'
+                arrays[name] = np.isin(np.arange(count), dict(conditions).get(name, []))
+        return arrays
+    return fake
+
+
+def test_forward_returns_and_condition_stats(monkeypatch):
+    count = MIN_BARS + 5
+    fired = {'buy': [150, MIN_BARS - 1, count - 2], 'sell': [MIN_BARS]}
+    conditions = {'buy_condition_2': [MIN_BARS - 1], 'sell_condition_1': [MIN_BARS]}
+    monkeypatch.setattr(FinyXAdvancedSignal, 'signal_arrays', scripted_arrays(count, fired, conditions))
+
+    data = columns(count)
+    closes = data[4]
+    result = backtest_symbol('BTCUSDT', data, 300, HORIZONS)
+
+    # Isınma içindeki sinyal (150) sayılmaz
+    assert [signal['open_time'] for signal in result['signals']] == \
+        [(MIN_BARS - 1) * BAR_MS, MIN_BARS * BAR_MS, (count - 2) * BAR_MS]
+    first = result['signals'][0]
+    assert first['types'] == ['buy'] and first['conditions'] == ['buy_condition_2']
+    assert first['returns'][1] == pytest.approx(closes[MIN_BARS] / closes[MIN_BARS - 1] - 1)
+    assert first['returns'][3] == pytest.approx(closes[MIN_BARS + 2] / closes[MIN_BARS - 1] - 1)
+    # Geçmişin sonunu aşan ufuk None
+    last = result['signals'][-1]
+    assert last['returns'][1] is not None and last['returns'][3] is None
+
+    buy = result['stats']['buy']
+    assert buy['count'] == 2
+    assert buy['valid'] == {1: 2, 3: 1}
+    assert buy['hits'] == {1: 2, 3: 1}
+    assert buy['return_sum'][3] == pytest.approx(closes[MIN_BARS + 2] / closes[MIN_BARS - 1] - 1)
+    assert result['stats']['buy_condition_2']['count'] == 1
+    assert result['stats']['buy_condition_1']['count'] == 0
+
+    # Satış yönünde düşüş isabettir - yükselen seride isabet yok
+    sell = result['stats']['sell']
+    assert sell['count'] == 1 and sell['hits'] == {1: 0, 3: 0} and sell['valid'] == {1: 1, 3: 1}
+    assert result['stats']['sell_condition_1']['count'] == 1
+
+
+def test_short_history_has_no_signals():
+    result = backtest_symbol('BTCUSDT', columns(MIN_BARS - 1, seed=1), 300, HORIZONS)
+    assert result == {'symbol': 'BTCUSDT', 'bars': MIN_BARS - 1, 'signals': [], 'stats': {}}
+
+
+def test_signals_match_live_evaluation():
+    # Her sinyal mumu, o muma kadarki geçmişle calculate_signals'ın verdiği sinyaldir (ileriye bakmaz)
+    data = columns(320, seed=7)
+    result = backtest_symbol('BTCUSDT', data, 300, HORIZONS)
+    detector = FinyXAdvancedSignal(300)
+    frame = pd.DataFrame(dict(zip(('open_time', 'open', 'high', 'low', 'close', 'volume'), data)))
+
+    live = {}
+    for index in range(MIN_BARS - 1, len(data[0])):
+        signals = detector.calculate_signals(frame.iloc[:index + 1])
+        types = [kind for kind in backtest.SIGNAL_TYPES if signals[f'{kind}_signal']]
+        if types:
+            live[index * BAR_MS] = types
+    assert live
+    assert {signal['open_time']: signal['types'] for signal in result['signals']} == live
+
+
+def test_merge_stats_rates():
+    first = {'stats': {'buy': {'count': 2, 'valid': {1: 2}, 'hits': {1: 1}, 'return_sum': {1: 0.02}}}}
+    second = {'stats': {'buy': {'count': 1, 'valid': {1: 1}, 'hits': {1: 1}, 'return_sum': {1: 0.04}},
+                        'sell': {'count': 1, 'valid': {1: 0}, 'hits': {1: 0}, 'return_sum': {1: 0.0}}}}
+    merged = merge_stats([first, second], [1])
+    assert merged['buy']['count'] == 3
+    assert merged['buy']['hit_rate'][1] == pytest.approx(2 / 3)
+    assert merged['buy']['avg_return'][1] == pytest.approx(0.02)
+    assert merged['sell']['hit_rate'][1] is None and merged['sell']['avg_return'][1] is None
+
+
+def test_load_csv_sorts_and_deduplicates(tmp_path):
+    first = tmp_path / 'BTCUSDT-5m-2024-01.csv'
+    second = tmp_path / 'BTCUSDT-5m-2024-02.csv'
+    first.write_text('open_time,open,high,low,close,volume\n600000,3,3,3,3,1\n0,1,1,1,1,1\n')
+    second.write_text('300000,2,2,2,2,1\n600000,3,3,3,3,1\n')
+    open_times, opens, *_ = load_csv([str(first), str(second)])
+    assert open_times.tolist() == [0, 300000, 600000]
+    assert opens.tolist() == [1.0, 2.0, 3.0]
+    assert backtest.csv_symbol(str(first)) == 'BTCUSDT'
+
+
+def test_run_backtest_from_csv(tmp_path):
+    data = columns(260, seed=7)
+    path = tmp_path / 'AAAUSDT-5m.csv'
+    path.write_text(''.join(','.join(str(column[i]) for column in data) + '\n' for i in range(260)))
+    report = run_backtest({'AAAUSDT': ('csv', [str(path)])}, '5m', HORIZONS, workers=1)
+    expected = backtest_symbol('AAAUSDT', data, 300, HORIZONS)
+    assert report['bars'] == 260
+    assert [signal['open_time'] for signal in report['signals']] == \
+        [signal['open_time'] for signal in expected['signals']]
+    assert report['stats'].keys() == merge_stats([expected], list(HORIZONS)).keys()
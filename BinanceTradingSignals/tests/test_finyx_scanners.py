@@ -0,0 +1,110 @@
+"""
+finyx_scanners.py ile static/finyx_scanners.js arasındaki çıktı eşliği
+
+tests/data/finyx_klines.json'daki beklenen değerler sabit mumlar üzerinde JS tarayıcılarından
+(tests/finyx_parity.js) üretilmiştir. Node kuruluysa rastgele serilerde de karşılaştırma yapılır.
+"""
+import json
+import os
+import shutil
+import subprocess
+import numpy as np
+import pytest
+from finyx_scanners import FinyXScannerManager
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_PATH = os.path.join(TESTS_DIR, 'data', 'finyx_klines.json')
+PARITY_SCRIPT = os.path.join(TESTS_DIR, 'finyx_parity.js')
+
+
+def to_columns(rows):
+    """Binance kline satırlarını scan_universe'ün beklediği sütunlara çevir"""
+    values = np.array([row[1:6] for row in rows], dtype=np.float64).reshape(-1, 5)
+    return (np.array([row[0] for row in rows], dtype=np.int64),) + tuple(values.T)
+
+
+def scan(candles):
+    """Sembol -> {'lq', 'whale', 'v1'} (sinyal yoksa None)"""
+    results = FinyXScannerManager().scan_universe({symbol: to_columns(rows) for symbol, rows in candles.items()})
+    by_symbol = {symbol: {'lq': None, 'whale': None, 'v1': None} for symbol in candles}
+    for name, hits in results.items():
+        for hit in hits:
+            by_symbol[hit['symbol']][name] = hit
+    return by_symbol
+
+
+def assert_matches_js(actual, expected):
+    lq, whale, v1 = actual['lq'], actual['whale'], actual['v1']
+
+    if expected['lq'] is None:
+        assert lq is None
+    else:
+        assert lq['levelName'] == expected['lq']['levelName']
+        assert lq['price'] == pytest.approx(expected['lq']['price'], rel=1e-12)
+
+    if expected['whale'] is None:
+        assert whale is None
+    else:
+        assert whale['strength'] == expected['whale']['strength']
+        for key in ('price', 'rsi', 'rv'):
+            assert whale[key] == pytest.approx(expected['whale'][key], rel=1e-9)
+
+    if expected['v1'] is None:
+        assert v1 is None
+    else:
+        assert v1['peakDistance'] == expected['v1']['peakDistance']
+        # JS peakTime yerel saat metnidir; sunucu tepe mumunun açılış zamanını (ms) döndürür
+        assert v1['peakTime'] == expected['v1']['peakOpenTime']
+        for key in ('peakPrice', 'lowBuy', 'mediumBuy', 'highBuy'):
+            assert v1[key] == pytest.approx(expected['v1'][key], rel=1e-12)
+
+
+def load_fixture():
+    with open(FIXTURE_PATH, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def test_fixture_covers_every_scanner():
+    expected = load_fixture()['expected'].values()
+    for name in ('lq', 'whale', 'v1'):
+        assert any(item[name] for item in expected)
+        assert any(item[name] is None for item in expected)
+
+
+@pytest.mark.parametrize('symbol', sorted(load_fixture()['candles']))
+def test_matches_js_fixture(symbol):
+    fixture = load_fixture()
+    actual = scan({symbol: fixture['candles'][symbol]})[symbol]
+    assert_matches_js(actual, fixture['expected'][symbol])
+
+
+def test_mixed_lengths_are_grouped():
+    # Farklı uzunluktaki semboller ayrı 2B dizilerde değerlendirilir, sonuç tek tek taramayla aynıdır
+    fixture = load_fixture()
+    actual = scan(fixture['candles'])
+    for symbol, expected in fixture['expected'].items():
+        assert_matches_js(actual[symbol], expected)
+
+
+def random_candles(seed, count):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.cumprod(1 + rng.normal(0.002 * (seed % 3 - 1), 0.01, count))
+    opens = np.concatenate(([100.0], closes[:-1]))
+    highs = np.maximum(opens, closes) * (1 + np.abs(rng.normal(0, 0.004, count)))
+    lows = np.minimum(opens, closes) * (1 - np.abs(rng.normal(0, 0.004, count)))
+    volumes = rng.uniform(100, 200, count)
+    volumes[-1] *= rng.choice([1, 5, 12])
+    rows = np.round(np.column_stack([opens, highs, lows, closes, volumes]), 4)
+    return [[1700000000000 + i * 60000] + [str(value) for value in row] for i, row in enumerate(rows)]
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node kurulu değil")
+def test_matches_js_on_random_series():
+    candles = {f'R{seed}USDT': random_candles(seed, 12 + seed % 90) for seed in range(60)}
+    completed = subprocess.run(['node', PARITY_SCRIPT], input=json.dumps(candles),
+                               capture_output=True, text=True, check=True)
+    expected = json.loads(completed.stdout)
+
+    actual = scan(candles)
+    for symbol in candles:
+        assert_matches_js(actual[symbol], expected[symbol])
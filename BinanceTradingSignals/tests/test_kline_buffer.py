@@ -0,0 +1,81 @@
+"""
+KlineRingBuffer: açık mum yuvası, kapasite sınırı, sıkıştırma (wrap) ve kopyasız görünümler
+"""
+import numpy as np
+from kline_buffer import KlineRingBuffer
+
+
+def row(index, is_closed=True, close=None):
+    value = float(index)
+    return (index * 1000, value, value + 1, value - 1, value + 0.5 if close is None else close, value * 10, is_closed)
+
+
+def test_open_slot_updates_in_place():
+    klines = KlineRingBuffer(5)
+    assert klines.append(*row(0, False, close=1.0))
+    assert klines.append(*row(0, False, close=2.0))
+    assert len(klines) == 1 and klines.closed_count == 0 and klines.has_open
+    assert klines.last()[4] == 2.0 and klines.last()[6] is False
+
+    # Yeni açılış zamanı bekleyen açık mumu kapatır
+    assert klines.append(*row(1, False))
+    assert klines.closed_count == 1
+    assert klines.column('close', include_open=False).tolist() == [2.0]
+    assert klines.column('close').tolist() == [2.0, 1.5]
+
+
+def test_stale_and_late_closed_updates():
+    klines = KlineRingBuffer(5)
+    for index in range(3):
+        klines.append(*row(index))
+    assert not klines.append(*row(1))
+    # Son kapanmış mumun geç gelen güncellemesi yerinde yazılır
+    assert klines.append(*row(2, close=9.0))
+    assert klines.closed_count == 3 and klines.last()[4] == 9.0
+
+
+def test_capacity_and_compaction_keep_latest_bars():
+    klines = KlineRingBuffer(5, headroom=2)
+    size = len(klines.open_times)
+    for index in range(40):
+        klines.append(*row(index, False))
+        klines.append(*row(index))
+        # Depo sabit boyutlu: dizi büyümez, en fazla kapasite kadar kapanmış mum tutulur
+        assert len(klines.open_times) == size
+        expected = list(range(max(0, index - 4), index + 1))
+        assert (klines.column('open_time') // 1000).tolist() == expected
+        assert klines.column('high').tolist() == [value + 1.0 for value in expected]
+        assert klines.last_open_time == index * 1000
+
+    # Açık mum yuvası sıkıştırmadan sonra da yazılabilir
+    klines.append(*row(40, False))
+    assert len(klines) == 6 and klines.closed_count == 5
+    assert klines.columns()[0][-1] == 40000
+
+
+def test_columns_are_views():
+    klines = KlineRingBuffer(10)
+    for index in range(5):
+        klines.append(*row(index))
+    open_times, opens, highs, lows, closes, volumes = klines.columns()
+    assert np.shares_memory(closes, klines.values) and np.shares_memory(open_times, klines.open_times)
+    assert closes.flags['C_CONTIGUOUS']
+    assert klines['volume'].tolist() == [0.0, 10.0, 20.0, 30.0, 40.0]
+
+
+def test_load_keeps_last_capacity_rows():
+    klines = KlineRingBuffer(3)
+    klines.append(*row(99, False))
+    columns = [np.arange(6, dtype=np.int64) * 1000] + [np.arange(6, dtype=float) + offset for offset in range(5)]
+    klines.load(*columns)
+    assert not klines.has_open
+    assert klines.column('open_time').tolist() == [3000, 4000, 5000]
+    assert klines.column('volume').tolist() == [7.0, 8.0, 9.0]
+    klines.append(*row(6))
+    assert klines.column('open_time').tolist() == [4000, 5000, 6000]
+
+
+def test_empty_buffer():
+    klines = KlineRingBuffer(3)
+    assert len(klines) == 0 and klines.last() is None and klines.last_open_time is None
+    assert klines.column('close').tolist() == []
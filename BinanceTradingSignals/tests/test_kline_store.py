@@ -0,0 +1,70 @@
+"""
+KlineStore ekleme / yarım kayıt onarımı ve tarayıcının kapanan mumları diske yazması
+"""
+import os
+import numpy as np
+import pytest
+from binance_scanner import BinancePerperualScanner
+from kline_store import KLINE_DTYPE, KlineStore
+
+BAR_MS = 300000
+
+
+def columns(open_times):
+    open_times = np.asarray(open_times, dtype=np.int64)
+    values = open_times.astype(np.float64) / BAR_MS
+    return (open_times, values, values + 1, values - 1, values + 0.5, values * 10)
+
+
+def test_append_skips_stored_rows(tmp_path):
+    store = KlineStore(str(tmp_path))
+    assert store.append('BTCUSDT', '5m', *columns([0, BAR_MS, 2 * BAR_MS])) == 3
+    assert store.append('BTCUSDT', '5m', *columns([BAR_MS, 2 * BAR_MS, 3 * BAR_MS])) == 1
+    stored = store.read('BTCUSDT', '5m')
+    assert stored[0].tolist() == [0, BAR_MS, 2 * BAR_MS, 3 * BAR_MS]
+
+
+@pytest.mark.parametrize('complete', [0, 2])
+def test_append_truncates_partial_record(tmp_path, complete):
+    store = KlineStore(str(tmp_path))
+    if complete:
+        store.append('BTCUSDT', '5m', *columns(range(0, complete * BAR_MS, BAR_MS)))
+    path = store.path('BTCUSDT', '5m')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'ab') as f:
+        f.write(b'\x01' * 20)
+
+    # Yeni süreç: sayı dosyadan okunur (tamamlanmış kayıt yoksa 0)
+    store = KlineStore(str(tmp_path))
+    assert store.append('BTCUSDT', '5m', *columns([10 * BAR_MS])) == 1
+    assert os.path.getsize(path) == (complete + 1) * KLINE_DTYPE.itemsize
+    stored = store.read('BTCUSDT', '5m')
+    assert stored[0][-1] == 10 * BAR_MS
+    assert stored[4][-1] == 10.5
+
+
+def test_scanner_persists_only_new_rows_outside_lock(tmp_path):
+    store = KlineStore(str(tmp_path))
+    scanner = BinancePerperualScanner(symbols=['BTCUSDT'], timeframes=['5m', '15m'], store=store)
+    calls = []
+    append = store.append
+
+    def checked_append(symbol, interval, *data):
+        assert not scanner.kline_lock.locked()
+        calls.append((interval, len(data[0])))
+        return append(symbol, interval, *data)
+
+    store.append = checked_append
+    rows = [(i * BAR_MS, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0, True) for i in range(6)]
+    for row in rows[:3]:
+        scanner._store_kline('BTCUSDT', *row, persist=False)
+    scanner._persist_closed('BTCUSDT')
+    assert calls == [('5m', 3), ('15m', 1)]
+
+    calls.clear()
+    for row in rows[3:]:
+        scanner._store_kline('BTCUSDT', *row)
+    # Her kapanışta sadece yeni taban mumu, kova kapanınca tek üst zaman dilimi mumu yazılır
+    assert calls == [('5m', 1), ('5m', 1), ('5m', 1), ('15m', 1)]
+    assert store.read('BTCUSDT', '5m')[0].tolist() == [row[0] for row in rows]
+    assert store.read('BTCUSDT', '15m')[0].tolist() == [0, 3 * BAR_MS]
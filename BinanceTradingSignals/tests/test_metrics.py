@@ -0,0 +1,37 @@
+"""
+Metrik kaydı: etiketli alt seriler, callback göstergeleri ve Prometheus metin çıktısı
+"""
+import pytest
+from metrics import MetricsRegistry
+
+
+def test_counter_and_histogram_children():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', 'İstekler', ('route',))
+    requests.labels('/a').inc()
+    requests.labels('/a').inc(2)
+    assert requests.labels('/a') is requests.labels('/a')
+    with pytest.raises(ValueError):
+        requests.labels('/a', 'fazla')
+
+    seconds = registry.histogram('seconds', 'Süre', buckets=(0.1, 1.0))
+    seconds.observe(0.05)
+    seconds.observe(5.0)
+    text = registry.render()
+    assert 'requests_total{route="/a"} 3' in text
+    assert 'seconds_bucket{le="0.1"} 1' in text and 'seconds_bucket{le="+Inf"} 2' in text
+
+
+def test_gauge_has_no_children():
+    registry = MetricsRegistry()
+    gauge = registry.gauge('streams', 'Bağlantılar', ('connection',), callback=lambda: {('pool_0',): 1})
+    with pytest.raises(TypeError, match='alt serisi yok'):
+        gauge.labels('pool_0')
+    assert 'streams{connection="pool_0"} 1' in registry.render()
+
+
+def test_gauge_without_value_is_omitted():
+    registry = MetricsRegistry()
+    registry.gauge('idle', 'Boş', callback=lambda: None)
+    registry.gauge('broken', 'Hatalı', callback=lambda: 1 / 0)
+    assert 'idle' not in registry.render() and 'broken ' not in registry.render()
@@ -0,0 +1,111 @@
+"""
+Vektörize _pivot_high / _pivot_low'un önceki döngü sürümüyle aynı sonucu verdiğini doğrular
+"""
+import numpy as np
+import pytest
+from trading_signals import FinyXAdvancedSignal
+
+
+def reference_pivot_high(data, left_bars, right_bars=None):
+    """Vektörizasyondan önceki döngü sürümü (referans)"""
+    if right_bars is None:
+        right_bars = left_bars
+
+    result = np.full(len(data), np.nan)
+
+    for i in range(left_bars, len(data) - right_bars):
+        current = data[i]
+        is_highest = True
+
+        # Sol taraf kontrolü
+        for j in range(i - left_bars, i):
+            if data[j] >= current:
+                is_highest = False
+                break
+
+        # Sağ taraf kontrolü
+        if is_highest:
+            for j in range(i + 1, i + right_bars + 1):
+                if data[j] >= current:
+                    is_highest = False
+                    break
+
+        if is_highest:
+            result[i] = current
+
+    return result
+
+
+def reference_pivot_low(data, left_bars, right_bars=None):
+    """Vektörizasyondan önceki döngü sürümü (referans)"""
+    if right_bars is None:
+        right_bars = left_bars
+
+    result = np.full(len(data), np.nan)
+
+    for i in range(left_bars, len(data) - right_bars):
+        current = data[i]
+        is_lowest = True
+
+        # Sol taraf kontrolü
+        for j in range(i - left_bars, i):
+            if data[j] <= current:
+                is_lowest = False
+                break
+
+        # Sağ taraf kontrolü
+        if is_lowest:
+            for j in range(i + 1, i + right_bars + 1):
+                if data[j] <= current:
+                    is_lowest = False
+                    break
+
+        if is_lowest:
+            result[i] = current
+
+    return result
+
+
+def random_series(rng, length, tie_levels, nan_ratio):
+    """Az sayıda fiyat seviyesi (bol eşitlik) ve rastgele NaN içeren seri"""
+    data = rng.integers(0, tie_levels, length).astype(float)
+    data[rng.random(length) < nan_ratio] = np.nan
+    return data
+
+
+@pytest.fixture
+def detector():
+    return FinyXAdvancedSignal()
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_matches_reference_on_random_series(detector, seed):
+    rng = np.random.default_rng(seed)
+    data = random_series(rng, int(rng.integers(0, 120)), int(rng.integers(2, 12)), rng.choice([0.0, 0.05, 0.3]))
+    left_bars = int(rng.integers(1, 8))
+    right_bars = None if seed % 2 else int(rng.integers(0, 8))
+
+    np.testing.assert_array_equal(detector._pivot_high(data, left_bars, right_bars),
+                                  reference_pivot_high(data, left_bars, right_bars))
+    np.testing.assert_array_equal(detector._pivot_low(data, left_bars, right_bars),
+                                  reference_pivot_low(data, left_bars, right_bars))
+
+
+def test_ties_block_pivot(detector):
+    data = np.array([1.0, 3.0, 5.0, 5.0, 2.0, 1.0, 4.0])
+    assert np.isnan(detector._pivot_high(data, 2)).all()
+    np.testing.assert_array_equal(detector._pivot_low(data, 1), reference_pivot_low(data, 1))
+
+
+def test_nan_neighbours_do_not_block(detector):
+    data = np.array([1.0, np.nan, 5.0, 2.0, np.nan])
+    result = detector._pivot_high(data, 2)
+    assert result[2] == 5.0
+    np.testing.assert_array_equal(result, reference_pivot_high(data, 2))
+
+
+@pytest.mark.parametrize('length', [0, 1, 4, 5])
+def test_short_series(detector, length):
+    data = np.arange(length, dtype=float)[::-1]
+    np.testing.assert_array_equal(detector._pivot_low(data, 2), reference_pivot_low(data, 2))
+    np.testing.assert_array_equal(detector._pivot_high(data, 2), reference_pivot_high(data, 2))
@@ -0,0 +1,62 @@
+"""
+Tarayıcı yaşam döngüsü: aynı örnekte durdurup yeniden başlatma tohumlamayı baştan kurar
+"""
+import asyncio
+import logging
+import threading
+import time
+import pytest
+from binance_scanner import BinancePerperualScanner
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_restart_rebuilds_seed_state(monkeypatch):
+    scanner = BinancePerperualScanner(symbols=['AAAUSDT', 'BBBUSDT'], scan_mode='full')
+    release = threading.Event()
+    started = threading.Event()
+    seeded = []
+
+    def seed_history(symbol):
+        started.set()
+        release.wait(5)
+        seeded.append(symbol)
+
+    async def stream_connection(key, symbols):
+        # Ağ yok - bağlantı iptal edilene kadar açık kalır
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(scanner, '_seed_history', seed_history)
+    monkeypatch.setattr(scanner, '_stream_connection', stream_connection)
+
+    # İlk çalıştırma tohumlama sürerken durdurulur
+    scanner.start_scanning()
+    assert started.wait(5)
+    scanner.stop_scanning()
+    assert scanner.seed_queue is None and scanner.seed_tasks == []
+    assert not scanner.seed_pending and not scanner.seed_futures
+    assert scanner.seed_in_flight == 0
+    release.set()
+
+    # Yeniden başlatmada yeni kuyruk ve worker'lar kurulur, semboller canlıya geçer
+    try:
+        scanner.start_scanning()
+        assert wait_for(lambda: scanner.seeded_symbols == {'AAAUSDT', 'BBBUSDT'})
+        assert wait_for(lambda: not scanner.seed_pending)
+        assert scanner.get_scanning_status()['seeding']['pending'] == 0
+    finally:
+        scanner.stop_scanning()
@@ -0,0 +1,46 @@
+"""
+ScannerService: uzun süren komutlar sırasında kalp atışının sürmesi
+"""
+import threading
+import time
+from scanner_service import ScannerService
+from signal_table import SignalTableReader, SignalTableWriter, send_command
+
+
+class SlowScanner:
+    """stop_scanning'i uzun süren sahte tarayıcı (websocket kapanışı / iş parçacığı join'i gibi)"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.stopped = threading.Event()
+
+    def stop_scanning(self):
+        time.sleep(self.seconds)
+        self.stopped.set()
+
+
+def test_heartbeat_continues_while_command_blocks(tmp_path):
+    path = str(tmp_path / 'signal_table.bin')
+    table = SignalTableWriter(path, capacity=16)
+    service = ScannerService(table, poll_interval=0.02, heartbeat_interval=0.05)
+    scanner = service.scanner = SlowScanner(0.6)
+
+    runner = threading.Thread(target=service.run, daemon=True)
+    runner.start()
+    try:
+        reader = SignalTableReader(path)
+        while not reader.alive():
+            time.sleep(0.01)
+
+        send_command(path, 'stop')
+        beats = set()
+        # Komut iş parçacığı stop_scanning'de beklerken kalp atışı ilerlemeye devam etmeli
+        while not scanner.stopped.is_set():
+            beats.add(float(reader.header['heartbeat']))
+            time.sleep(0.02)
+        assert len(beats) >= 5
+        assert reader.alive()
+    finally:
+        service.stop()
+        runner.join(5)
+    assert not runner.is_alive()
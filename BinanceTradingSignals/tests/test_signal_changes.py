@@ -0,0 +1,136 @@
+"""
+Sürümlü sinyal günlüğü (get_signal_changes) ve vadesi gelen sinyallerin heap ile silinmesi
+"""
+import logging
+import pytest
+from binance_scanner import BinancePerperualScanner
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def scanner():
+    scanner = BinancePerperualScanner(symbols=['AAAUSDT', 'BBBUSDT', 'CCCUSDT'])
+    scanner.clock = ManualClock()
+    events = []
+    scanner._emit = lambda event, data: events.append((event, data))
+    scanner.events_seen = events
+    return scanner
+
+
+def signal(buy=False, sell=False, price=1.0):
+    return {'buy_signal': buy, 'pump_signal': False, 'sell_signal': sell, 'rsi': 30.0, 'trend': 'Yatay',
+            'volume_status': 'Normal', 'price': price, 'price_change': 0.0}
+
+
+def symbols_of(changes):
+    return sorted(payload['symbol'] for payload in changes['signals']), sorted(changes['removed'])
+
+
+def test_changes_since_cursor(scanner):
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+    scanner._publish_signal('BBBUSDT', signal(sell=True))
+    first = scanner.get_signal_changes(0)
+    assert not first['reset'] and first['version'] == 2
+    assert symbols_of(first) == (['AAAUSDT', 'BBBUSDT'], [])
+
+    # Aynı tipte tekrar eden sinyal günlüğe yazılmaz
+    scanner._publish_signal('AAAUSDT', signal(buy=True, price=2.0))
+    assert scanner.signal_version == 2
+    assert symbols_of(scanner.get_signal_changes(2)) == ([], [])
+
+    # Tip değişimi ve kalkan sinyal
+    scanner._publish_signal('AAAUSDT', signal(sell=True))
+    scanner._publish_signal('BBBUSDT', signal())
+    changes = scanner.get_signal_changes(2, scanner.epoch)
+    assert changes['version'] == 4
+    assert symbols_of(changes) == (['AAAUSDT'], ['BBBUSDT'])
+    assert changes['signals'][0]['signals'] == ['SELL']
+
+
+def test_periodic_refresh_is_logged(scanner):
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+    scanner.clock.now += scanner.signal_refresh_seconds
+    scanner._publish_signal('AAAUSDT', signal(buy=True, price=3.0))
+    changes = scanner.get_signal_changes(1)
+    assert changes['version'] == 2 and changes['signals'][0]['price'] == 3.0
+
+
+def test_last_change_per_symbol_wins(scanner):
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+    scanner._publish_signal('AAAUSDT', signal())
+    scanner._publish_signal('AAAUSDT', signal(sell=True))
+    assert symbols_of(scanner.get_signal_changes(0)) == (['AAAUSDT'], [])
+    scanner._publish_signal('AAAUSDT', signal())
+    assert symbols_of(scanner.get_signal_changes(0)) == ([], ['AAAUSDT'])
+
+
+@pytest.mark.parametrize('cursor', ['future', 'trimmed', 'epoch'])
+def test_invalid_cursor_resets(scanner, cursor):
+    scanner.signal_log_size = 2
+    for index in range(6):
+        scanner._publish_signal('AAAUSDT', signal(buy=index % 2 == 0, sell=index % 2 == 1))
+    scanner._publish_signal('BBBUSDT', signal(buy=True))
+    assert len(scanner.signal_log) <= 2 * scanner.signal_log_size
+
+    since, epoch = {'future': (99, None), 'trimmed': (0, None), 'epoch': (7, 'baska')}[cursor]
+    changes = scanner.get_signal_changes(since, epoch)
+    assert changes['reset'] and changes['version'] == 7 and changes['epoch'] == scanner.epoch
+    assert symbols_of(changes) == (['AAAUSDT', 'BBBUSDT'], [])
+
+
+def test_expiry_heap_removes_only_due_signals(scanner):
+    scanner.signal_ttl = 10.0
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+    scanner.clock.now += 5
+    scanner._publish_signal('BBBUSDT', signal(buy=True))
+
+    scanner.clock.now += 5
+    assert scanner._expire_due() == 1
+    assert list(scanner.signals) == ['BBBUSDT']
+    assert ('signal_expired', {'symbol': 'AAAUSDT'}) in scanner.events_seen
+    assert symbols_of(scanner.get_signal_changes(2)) == ([], ['AAAUSDT'])
+    assert scanner._expire_due() == 0
+
+
+def test_refreshed_signal_is_rescheduled(scanner):
+    scanner.signal_ttl = 10.0
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+    scanner.clock.now += 8
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+
+    # Eski vade geldiğinde kayıt yeni vadeyle tekrar sıraya girer, heap'te tek kayıt kalır
+    scanner.clock.now += 2
+    assert scanner._expire_due() == 0
+    assert len(scanner.expiry_heap) == 1 and scanner.expiry_heap[0] == (1018.0, 'AAAUSDT')
+    scanner.clock.now += 8
+    assert scanner._expire_due() == 1
+    assert not scanner.signals and not scanner.expiry_heap and not scanner.expiry_scheduled
+
+
+def test_removed_signal_leaves_no_expiry(scanner):
+    scanner.signal_ttl = 10.0
+    scanner._publish_signal('AAAUSDT', signal(buy=True))
+    scanner._publish_signal('AAAUSDT', signal())
+    version = scanner.signal_version
+    scanner.clock.now += 10
+    assert scanner._expire_due() == 0
+    assert scanner.signal_version == version and not scanner.expiry_scheduled
+
+    # Snapshot okuması da vadesi gelenleri temizler
+    scanner._publish_signal('BBBUSDT', signal(buy=True))
+    scanner.clock.now += 10
+    assert scanner.get_signal_snapshot() == (version + 2, {})
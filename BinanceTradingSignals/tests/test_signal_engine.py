@@ -0,0 +1,69 @@
+"""
+Artımlı motorun yeniden kurulma kuralı (tarayıcı ve worker süreçleri aynı kuralı kullanır)
+"""
+import numpy as np
+from binance_scanner import BinancePerperualScanner
+from kline_buffer import KlineRingBuffer
+from signal_workers import SymbolSignalState
+from trading_signals import FinyXStreamingSignal
+
+TIMEFRAME_SECONDS = 300
+BAR_MS = TIMEFRAME_SECONDS * 1000
+
+
+def candles(count, start=0, seed=3):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    opens = np.r_[closes[0], closes[:-1]]
+    highs = np.maximum(opens, closes) * 1.002
+    lows = np.minimum(opens, closes) * 0.998
+    volumes = rng.lognormal(5, 1, count)
+    return [((start + i) * BAR_MS, opens[i], highs[i], lows[i], closes[i], volumes[i], True) for i in range(count)]
+
+
+def buffer(rows):
+    klines = KlineRingBuffer(200)
+    for row in rows:
+        klines.append(*row)
+    return klines
+
+
+def test_engine_reused_on_same_and_next_bar():
+    rows = candles(150)
+    klines = buffer(rows)
+    engine = FinyXStreamingSignal.for_buffer(None, klines, TIMEFRAME_SECONDS)
+    # Son mum hariç geçmişten kurulur
+    assert engine.last_open_time == rows[-2][0]
+    assert FinyXStreamingSignal.for_buffer(engine, klines, TIMEFRAME_SECONDS) is engine
+
+    engine.update(*klines.last())
+    klines.append(150 * BAR_MS, 1.0, 1.0, 1.0, 1.0, 1.0, False)
+    assert FinyXStreamingSignal.for_buffer(engine, klines, TIMEFRAME_SECONDS) is engine
+
+
+def test_engine_rebuilt_after_gap():
+    klines = buffer(candles(150))
+    engine = FinyXStreamingSignal.for_buffer(None, klines, TIMEFRAME_SECONDS)
+    klines.append(152 * BAR_MS, 1.0, 1.0, 1.0, 1.0, 1.0, False)
+    rebuilt = FinyXStreamingSignal.for_buffer(engine, klines, TIMEFRAME_SECONDS)
+    assert rebuilt is not engine
+    assert rebuilt.last_open_time == 149 * BAR_MS
+
+
+def test_scanner_and_worker_state_agree():
+    rows = candles(160)
+    scanner = BinancePerperualScanner(symbols=['BTCUSDT'])
+    state = SymbolSignalState(TIMEFRAME_SECONDS)
+    for row in rows[:150]:
+        scanner._store_kline('BTCUSDT', *row, persist=False)
+        state.store(*row)
+
+    # Ardışık mumlar ve bir boşluk: iki yol da aynı motor kararını ve sonucu verir
+    for row in rows[150:155] + rows[157:]:
+        scanner._store_kline('BTCUSDT', *row, persist=False)
+        state.store(*row)
+        klines = scanner.kline_data['BTCUSDT']
+        engine = scanner._get_signal_engine('BTCUSDT', klines, TIMEFRAME_SECONDS)
+        expected = engine.update(*klines.last())
+        assert state.evaluate() == expected
+        assert state.engine.last_open_time == engine.last_open_time
@@ -0,0 +1,102 @@
+"""
+Sinyal yolları arasında eşdeğerlik: artımlı motor (açık ve kapanmış mum güncellemeleri) ve
+matris yolu calculate_signals_batch, aynı geçmişte calculate_signals ile aynı sonucu vermeli
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from trading_signals import FinyXAdvancedSignal, FinyXStreamingSignal
+
+FLOAT_FIELDS = ('rsi', 'price', 'price_change')
+
+
+def ohlcv(count, seed):
+    """Hacim sıçramaları ve V dönüşleri içeren rastgele seri (sinyaller gerçekten tetiklensin)"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, 0.012, count)
+    # Ara sıra sert düşüş + toparlanma
+    for start in rng.choice(np.arange(5, count - 5), count // 25, replace=False):
+        returns[start:start + 3] -= 0.02
+        returns[start + 3:start + 5] += 0.03
+    closes = 100 * np.exp(np.cumsum(returns))
+    opens = np.r_[closes[0], closes[:-1]] * (1 + rng.normal(0, 0.002, count))
+    highs = np.maximum(opens, closes) * (1 + rng.uniform(0, 0.006, count))
+    lows = np.minimum(opens, closes) * (1 - rng.uniform(0, 0.006, count))
+    volumes = rng.lognormal(5, 0.4, count) * np.where(rng.random(count) < 0.12, rng.uniform(2, 5, count), 1)
+    return opens, highs, lows, closes, volumes
+
+
+def frame(opens, highs, lows, closes, volumes):
+    return pd.DataFrame({'open': opens, 'high': highs, 'low': lows, 'close': closes, 'volume': volumes})
+
+
+def assert_same(actual, expected):
+    for key, value in expected.items():
+        if key in FLOAT_FIELDS:
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-9, nan_ok=True), key
+        else:
+            assert actual[key] == value, key
+
+
+@pytest.mark.parametrize('timeframe_seconds', [60, 300, 3600, 14400])
+def test_streaming_matches_full_recompute(timeframe_seconds):
+    opens, highs, lows, closes, volumes = ohlcv(280, seed=timeframe_seconds)
+    reference = FinyXAdvancedSignal(timeframe_seconds)
+    engine = FinyXStreamingSignal(timeframe_seconds)
+    bar_ms = timeframe_seconds * 1000
+    fired = 0
+
+    for index in range(len(closes)):
+        history = [column[:index] for column in (opens, highs, lows, closes, volumes)]
+
+        # Açık mum: kısmi tick'ler durumu değiştirmeden değerlendirilir
+        if index >= 190:
+            for fraction in (0.3, 0.7):
+                close = opens[index] + (closes[index] - opens[index]) * fraction
+                high = max(opens[index], close, highs[index] * fraction + opens[index] * (1 - fraction))
+                low = min(opens[index], close, lows[index] * fraction + opens[index] * (1 - fraction))
+                volume = volumes[index] * fraction
+                tentative = engine.update(index * bar_ms, opens[index], high, low, close, volume, False)
+                expected = reference.calculate_signals(frame(*(np.r_[column, value] for column, value in
+                                                               zip(history, (opens[index], high, low, close, volume)))))
+                assert_same(tentative, expected)
+
+        # Kapanan mum duruma işlenir
+        committed = engine.update(index * bar_ms, opens[index], highs[index], lows[index],
+                                  closes[index], volumes[index], True)
+        if index >= 190:
+            expected = reference.calculate_signals(frame(*(column[:index + 1] for column in
+                                                           (opens, highs, lows, closes, volumes))))
+            assert_same(committed, expected)
+            fired += expected['buy_signal'] + expected['pump_signal'] + expected['sell_signal']
+
+    assert engine.bar_count == len(closes)
+    # Seri en az bir sinyal üretmeli, yoksa karşılaştırma sadece boş sonuçları doğrular
+    assert fired > 0
+
+
+def test_batch_matches_per_symbol():
+    count = 260
+    histories = [ohlcv(count, seed) for seed in range(6)]
+    # Düz seri (sıfır varyans, RSI ve oranlar uç durumda)
+    histories.append(tuple(np.full(count, value) for value in (5.0, 5.0, 5.0, 5.0, 100.0)))
+    # Soldan NaN ile doldurulmuş kısa geçmişler: biri minimumun üstünde, biri altında
+    short_histories = [ohlcv(220, 21), ohlcv(150, 22)]
+    padded = [tuple(np.r_[np.full(count - len(column), np.nan), column] for column in history)
+              for history in short_histories]
+
+    detector = FinyXAdvancedSignal(300)
+    rows = histories + padded
+    matrices = [np.vstack([row[column] for row in rows]) for column in range(5)]
+    results = detector.calculate_signals_batch(*matrices)
+
+    assert len(results) == len(rows)
+    for result, history in zip(results, histories + short_histories):
+        assert_same(result, detector.calculate_signals(frame(*history)))
+    assert results[-1] == detector._empty_signal()
+
+
+def test_batch_short_matrix_returns_empty():
+    detector = FinyXAdvancedSignal(300)
+    matrices = [np.vstack([column, column]) for column in ohlcv(150, 5)]
+    assert detector.calculate_signals_batch(*matrices) == [detector._empty_signal()] * 2
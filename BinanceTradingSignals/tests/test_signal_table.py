@@ -0,0 +1,59 @@
+"""
+SignalTableReader: eski kalp atışında yeniden eşleme yapılmaması, yeni tablo dosyasının yakalanması
+"""
+import time
+import signal_table
+from signal_table import SignalTableReader, SignalTableWriter
+
+
+def count_maps(monkeypatch):
+    calls = []
+    original = signal_table.mmap.mmap
+
+    def counting_mmap(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(signal_table.mmap, 'mmap', counting_mmap)
+    return calls
+
+
+def test_stale_table_is_not_remapped_per_call(tmp_path, monkeypatch):
+    path = str(tmp_path / 'signal_table.bin')
+    writer = SignalTableWriter(path, capacity=16)
+    writer.heartbeat()
+    reader = SignalTableReader(path)
+    assert reader.alive()
+
+    writer.header['heartbeat'] = time.time() - signal_table.STALE_SECONDS - 1
+    calls = count_maps(monkeypatch)
+    for _ in range(100):
+        assert not reader.alive()
+        assert reader.get_signal_snapshot() is None
+    assert calls == []
+
+    # Aynı dosyaya yazan servis geri gelince eşleme değişmeden canlı görülür
+    writer.heartbeat()
+    assert reader.alive()
+    assert calls == []
+    writer.close()
+
+
+def test_replaced_table_is_remapped(tmp_path):
+    path = str(tmp_path / 'signal_table.bin')
+    old = SignalTableWriter(path, capacity=16)
+    old.close()
+    reader = SignalTableReader(path)
+    assert not reader.alive()
+
+    # Farklı kapasiteli servis dosyayı atomik olarak değiştirir
+    new = SignalTableWriter(path, capacity=32)
+    new.reset('epoch-2')
+    new.publish('BTCUSDT', {'symbol': 'BTCUSDT', 'timeframe': '5m', 'timestamp': '12:00:00', 'price': 1.0,
+                            'rsi': 50.0, 'price_change': 0.0, 'signals': ['BUY'], 'trend': 'Yatay',
+                            'volume_status': 'Normal'})
+    new.heartbeat()
+    assert reader.alive()
+    assert reader.epoch == 'epoch-2'
+    assert list(reader.get_signal_snapshot()[1]) == ['BTCUSDT']
+    new.close()
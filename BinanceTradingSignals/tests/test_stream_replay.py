@@ -0,0 +1,45 @@
+"""
+ReplayDriver ölçümleri: mesaj -> yayın gecikmesi zamanlayıcıdan geçer, motor kurulumu ayrı sayılır
+"""
+import logging
+import pytest
+from benchmark import synthetic_recording
+from binance_scanner import BinancePerperualScanner
+from stream_replay import ReplayDriver
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def replay(symbols=5, ticks=10, **options):
+    driver = ReplayDriver(synthetic_recording(symbols, ticks))
+    scanner = BinancePerperualScanner(symbols=driver.symbols, **options)
+    return driver, scanner, driver.run(scanner)
+
+
+def test_open_ticks_go_through_scheduler():
+    driver, scanner, stats = replay()
+    scheduler = scanner.tick_scheduler.stats()
+
+    # İlk tick motoru kurar; sonraki açık mum tick'leri birleştirilir, kapanış acil değerlendirilir
+    assert stats['rebuilds'] == 5 and len(driver.rebuild_seconds) == 5
+    assert scheduler['coalesced'] > 0 and scheduler['urgent'] == 5
+    assert scheduler['pending'] == 0
+    assert scanner.tick_wakeup is None
+
+    # Kurulum içeren değerlendirmeler gecikme dağılımına katılmaz
+    assert stats['publishes'] == len(driver.publish_latencies) == 5
+    assert all(latency > 0 for latency in driver.publish_latencies)
+    assert not driver.pending_receipts
+
+
+def test_close_evaluation_measures_from_close_message():
+    driver, scanner, stats = replay(evaluation='close')
+    assert scanner.close_sweeps == 1
+    assert stats['rebuilds'] == 0
+    assert stats['publishes'] == 5
+    assert not driver.pending_receipts
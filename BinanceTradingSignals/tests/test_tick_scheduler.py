@@ -0,0 +1,123 @@
+"""
+TickScheduler: açık mum tick'lerinin birleştirilmesi, aralık sınırı ve acil (kapanış) değerlendirme
+"""
+import json
+import threading
+from binance_scanner import BinancePerperualScanner
+from tick_scheduler import TickScheduler
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def scheduler(interval=0.25):
+    clock = ManualClock()
+    return TickScheduler(interval, clock=clock), clock
+
+
+def test_ticks_coalesce_until_due():
+    ticks, clock = scheduler()
+    assert ticks.mark('AAA')
+    assert not ticks.mark('AAA')
+    assert not ticks.mark('AAA')
+    assert ticks.mark('BBB')
+
+    # İlk değerlendirme hemen yapılabilir, her sembol bir kez
+    assert ticks.pop_due() == ['AAA', 'BBB']
+    assert ticks.pop_due() == []
+    stats = ticks.stats()
+    assert stats['ticks'] == 4 and stats['coalesced'] == 2 and stats['evaluations'] == 2
+    assert stats['pending'] == 0
+
+
+def test_interval_limits_evaluation_rate():
+    ticks, clock = scheduler(0.25)
+    ticks.mark('AAA')
+    assert ticks.pop_due() == ['AAA']
+
+    clock.now += 0.1
+    ticks.mark('AAA')
+    assert ticks.pop_due() == []
+    assert ticks.next_due() == 100.25
+
+    clock.now = 100.25
+    assert ticks.pop_due() == ['AAA']
+    # Gecikme ilk bekleyen tick'ten ölçülür
+    assert ticks.stats()['max_lag_ms'] == 150.0
+
+
+def test_due_order_follows_first_tick():
+    ticks, clock = scheduler(0.25)
+    for symbol in ('AAA', 'BBB', 'CCC'):
+        ticks.mark(symbol)
+    ticks.pop_due()
+
+    clock.now += 0.05
+    ticks.mark('CCC')
+    clock.now += 0.05
+    ticks.mark('AAA')
+    ticks.mark('BBB')
+    clock.now += 1
+    assert ticks.pop_due() == ['CCC', 'AAA', 'BBB']
+
+
+def test_urgent_run_flushes_pending_tick():
+    ticks, clock = scheduler(0.25)
+    ticks.mark('AAA')
+    clock.now += 0.01
+    ticks.ran('AAA')
+
+    # Bekleyen heap kaydı geçersiz - sembol tekrar değerlendirilmez
+    assert ticks.next_due() is None
+    clock.now += 1
+    assert ticks.pop_due() == []
+    stats = ticks.stats()
+    assert stats['urgent'] == 1 and stats['evaluations'] == 0 and stats['pending'] == 0
+
+    # Acil değerlendirme de aralığı başlatır
+    clock.now = 200.0
+    ticks.ran('AAA')
+    clock.now += 0.1
+    ticks.mark('AAA')
+    assert ticks.pop_due() == []
+    assert ticks.next_due() == 200.25
+
+
+def test_discard_drops_pending():
+    ticks, clock = scheduler()
+    ticks.mark('AAA')
+    ticks.mark('BBB')
+    ticks.discard(['AAA'])
+    assert ticks.pop_due() == ['BBB']
+    assert ticks.stats()['dropped'] == 1
+
+
+def kline_message(symbol, open_time, close, is_closed):
+    return json.dumps({'stream': f'{symbol.lower()}@kline_5m', 'data': {
+        'e': 'kline', 'E': open_time + 1000, 's': symbol,
+        'k': {'s': symbol, 't': open_time, 'o': '1', 'h': '2', 'l': '0.5', 'c': str(close), 'v': '10', 'x': is_closed}
+    }})
+
+
+def test_scanner_defers_open_ticks_and_evaluates_close_immediately(monkeypatch):
+    scanner = BinancePerperualScanner(symbols=['AAAUSDT'])
+    scanner.tick_wakeup = threading.Event()
+    analyzed = []
+    monkeypatch.setattr(scanner, '_analyze_signals', analyzed.append)
+
+    for close in (1.1, 1.2, 1.3):
+        scanner._on_kline_message(None, kline_message('AAAUSDT', 0, close, False))
+    assert analyzed == []
+    assert scanner.tick_wakeup.is_set()
+    assert scanner.tick_scheduler.stats()['coalesced'] == 2
+
+    # Kapanış beklemeden değerlendirilir ve bekleyen tick'i temizler
+    scanner._on_kline_message(None, kline_message('AAAUSDT', 0, 1.4, True))
+    assert analyzed == ['AAAUSDT']
+    assert scanner.tick_scheduler.pop_due() == []
+    assert scanner.kline_data['AAAUSDT'].last()[4] == 1.4
@@ -0,0 +1,132 @@
+"""
+TimeframeAggregator: taban mumlarından üst zaman dilimi kovaları, açık tick'ler ve kapanış tespiti
+"""
+import numpy as np
+import pytest
+from binance_scanner import BinancePerperualScanner
+from kline_buffer import KlineRingBuffer
+from timeframe_aggregator import TimeframeAggregator
+
+MINUTE = 60000
+
+
+def base_bars(count, start=0, seed=4):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    opens = np.r_[100.0, closes[:-1]]
+    highs = np.maximum(opens, closes) + rng.uniform(0, 0.5, count)
+    lows = np.minimum(opens, closes) - rng.uniform(0, 0.5, count)
+    volumes = rng.uniform(1, 10, count)
+    return [(start + i * MINUTE, opens[i], highs[i], lows[i], closes[i], volumes[i]) for i in range(count)]
+
+
+def expected_bucket(bars):
+    return (bars[0][0], bars[0][1], max(bar[2] for bar in bars), min(bar[3] for bar in bars),
+            bars[-1][4], sum(bar[5] for bar in bars))
+
+
+def assert_bar(actual, expected, is_closed):
+    assert actual[0] == expected[0]
+    assert actual[1:6] == pytest.approx(expected[1:6])
+    assert actual[6] is is_closed
+
+
+def test_rejects_non_multiple_timeframe():
+    with pytest.raises(ValueError):
+        TimeframeAggregator(60, 90)
+    with pytest.raises(ValueError):
+        TimeframeAggregator(300, 300)
+
+
+def test_buckets_match_resample_and_close_on_last_base_bar():
+    aggregator = TimeframeAggregator(60, 300)
+    bars = base_bars(15)
+    for index, bar in enumerate(bars):
+        # Açık tick'ler önce kısmi değerlerle gelir, özet değişmez
+        assert aggregator.update('BTCUSDT', bar[0], bar[1], bar[1], bar[1], bar[1], bar[5] / 2, False)
+        assert aggregator.update('BTCUSDT', *bar, True)
+        bucket = bars[index - index % 5:index + 1]
+        assert_bar(aggregator.buffer('BTCUSDT').last(), expected_bucket(bucket), index % 5 == 4)
+
+    klines = aggregator.buffer('BTCUSDT')
+    assert klines.closed_count == 3 and not klines.has_open
+    for row, start in enumerate(range(0, 15, 5)):
+        assert_bar(tuple(column[row] for column in klines.columns()) + (True,),
+                   expected_bucket(bars[start:start + 5]), True)
+
+
+def test_open_tick_uses_closed_summary():
+    aggregator = TimeframeAggregator(60, 300)
+    bars = base_bars(3)
+    for bar in bars[:2]:
+        aggregator.update('BTCUSDT', *bar, True)
+    open_time, open_price, high, low, close, volume = bars[2]
+    aggregator.update('BTCUSDT', open_time, open_price, high, low, close, volume, False)
+    aggregator.update('BTCUSDT', open_time, open_price, high, low, close, volume * 2, False)
+    # Açık tabanın son tick'i sayılır, önceki tick'in hacmi birikmez
+    expected = expected_bucket(bars[:2] + [(open_time, open_price, high, low, close, volume * 2)])
+    assert_bar(aggregator.buffer('BTCUSDT').last(), expected, False)
+
+
+def test_duplicate_closed_base_bar_is_ignored():
+    aggregator = TimeframeAggregator(60, 300)
+    bars = base_bars(3)
+    for bar in bars:
+        aggregator.update('BTCUSDT', *bar, True)
+    assert not aggregator.update('BTCUSDT', *bars[1], True)
+    assert_bar(aggregator.buffer('BTCUSDT').last(), expected_bucket(bars), False)
+
+
+def test_mid_bucket_start_reads_base_buffer():
+    aggregator = TimeframeAggregator(60, 300)
+    bars = base_bars(5)
+    base = KlineRingBuffer(50)
+    for bar in bars[:3]:
+        base.append(*bar, True)
+    base.append(*bars[3], False)
+
+    # Kova ortasında başlayan akış önceki kapanmış tabanları depodan alır
+    aggregator.update('BTCUSDT', *bars[3], False, base=base)
+    assert_bar(aggregator.buffer('BTCUSDT').last(), expected_bucket(bars[:4]), False)
+    aggregator.update('BTCUSDT', *bars[3], True, base=base)
+    aggregator.update('BTCUSDT', *bars[4], True, base=base)
+    assert_bar(aggregator.buffer('BTCUSDT').last(), expected_bucket(bars), True)
+
+
+def test_seeded_closed_buckets_are_final():
+    aggregator = TimeframeAggregator(60, 300)
+    bars = base_bars(10)
+    aggregator.seed('BTCUSDT', [(0, 1.0, 2.0, 0.5, 1.5, 10.0, True),
+                                (5 * MINUTE, 9.0, 9.0, 9.0, 9.0, 9.0, False)])
+    klines = aggregator.buffer('BTCUSDT')
+    # Açık REST mumu alınmaz, kapanmış kovaya gelen taban mumları yok sayılır
+    assert klines.closed_count == 1 and not klines.has_open
+    assert not aggregator.update('BTCUSDT', *bars[2], True)
+    assert klines.last()[1:6] == (1.0, 2.0, 0.5, 1.5, 10.0)
+
+    for bar in bars[5:]:
+        aggregator.update('BTCUSDT', *bar, True)
+    assert klines.closed_count == 2
+    assert_bar(klines.last(), expected_bucket(bars[5:]), True)
+
+
+def test_buckets_are_utc_aligned():
+    aggregator = TimeframeAggregator(60, 900)
+    bars = base_bars(20, start=1_700_000_100_000 - 1_700_000_100_000 % MINUTE)
+    for bar in bars:
+        aggregator.update('BTCUSDT', *bar, True)
+    open_times = aggregator.buffer('BTCUSDT').column('open_time')
+    assert all(open_time % (900 * 1000) == 0 for open_time in open_times.tolist())
+
+
+def test_scanner_builds_higher_timeframes_from_base_stream():
+    scanner = BinancePerperualScanner(timeframe='1m', timeframes=['1m', '5m', '15m'], symbols=['BTCUSDT'])
+    bars = base_bars(30)
+    for bar in bars:
+        scanner._store_kline('BTCUSDT', *bar, True, persist=False)
+
+    five = scanner.klines_for('5m')['BTCUSDT']
+    fifteen = scanner.klines_for('15m')['BTCUSDT']
+    assert five.closed_count == 6 and fifteen.closed_count == 2
+    assert_bar(five.last(), expected_bucket(bars[25:]), True)
+    assert_bar(fifteen.last(), expected_bucket(bars[15:]), True)
@@ -0,0 +1,197 @@
+"""
+WeightScheduler / UpstreamClient davranışı: ağırlık başlıklarını taklit eden yerel sunucuya karşı
+Zamanlayıcıya elle ilerletilen saat verilir; pencere ve ban süreleri beklemeden test edilir.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from upstream import (PRIORITY_CHART, PRIORITY_SCANNER, UpstreamClient, UpstreamThrottled,
+                      WeightScheduler, request_weight)
+
+WINDOW = 60.0
+# limit 1000 kline isteği ağırlık 5
+PARAMS = {'interval': '5m', 'limit': 1000}
+WEIGHT = request_weight('/fapi/v1/klines', PARAMS)
+
+
+class ManualClock:
+    def __init__(self, now: float = 1_000_020.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class WeightStub:
+    """Binance gibi X-MBX-USED-WEIGHT-1M döndürür; sıradaki yanıtlar 429/418 olarak ayarlanabilir"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.used_weight = 0
+        self.responses = []
+        self.received = []
+
+    def respond(self, path):
+        query = parse_qs(urlsplit(path).query)
+        with self.lock:
+            self.received.append(query.get('symbol', [''])[0])
+            headers = {'X-MBX-USED-WEIGHT-1M': str(self.used_weight)}
+            if self.responses:
+                status, extra = self.responses.pop(0)
+                headers.update(extra)
+                return status, headers
+            return 200, headers
+
+
+@pytest.fixture
+def stub():
+    stub = WeightStub()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            status, headers = stub.respond(self.path)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', '2')
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(b'[]')
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}/fapi/v1/klines"
+    stub.host = urlsplit(stub.url).netloc
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(stub, limit):
+    clock = ManualClock()
+    scheduler = WeightScheduler(limits={stub.host: limit}, window=WINDOW, clock=clock)
+    client = UpstreamClient(pool_size=8, retries=0, http2=False, scheduler=scheduler)
+    return client, scheduler, clock
+
+
+def get(client, stub, symbol, **kwargs):
+    return client.get(stub.url, params=dict(PARAMS, symbol=symbol), **kwargs)
+
+
+def advance(scheduler, clock, seconds):
+    """Saati ilerlet ve bekleyen istekleri uyandır"""
+    with scheduler.condition:
+        clock.now += seconds
+        scheduler.condition.notify_all()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "koşul zamanında sağlanmadı"
+        time.sleep(0.005)
+
+
+def start_callers(client, stub, requests):
+    """(sembol, öncelik) listesini ayrı iş parçacıklarından gönder; hataları topla"""
+    errors = []
+
+    def call(symbol, priority):
+        try:
+            get(client, stub, symbol, priority=priority)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call, args=item, daemon=True) for item in requests]
+    for thread in threads:
+        thread.start()
+    return threads, errors
+
+
+def test_used_weight_header_throttles(stub):
+    client, scheduler, clock = make_client(stub, limit=100)  # bütçe %90 = 90
+    try:
+        # Başka istemcilerin harcadığı ağırlık sadece sunucu başlığından öğrenilir
+        stub.used_weight = 88
+        get(client, stub, 'A')
+        assert scheduler.stats()[stub.host]['used_weight'] == 88
+
+        with pytest.raises(UpstreamThrottled):
+            get(client, stub, 'B', max_wait=1.0)
+        assert stub.received == ['A']
+
+        # Pencere sıfırlanınca bekleyen istek gönderilir
+        threads, errors = start_callers(client, stub, [('C', PRIORITY_SCANNER)])
+        wait_until(lambda: scheduler.stats()[stub.host]['queue_depth'] == 1)
+        time.sleep(0.05)
+        assert stub.received == ['A']
+
+        stub.used_weight = WEIGHT
+        advance(scheduler, clock, WINDOW)
+        threads[0].join(5)
+        assert not errors and stub.received == ['A', 'C']
+    finally:
+        client.close()
+
+
+def test_high_priority_goes_first(stub):
+    # Bütçe (int(6 * 0.9) = 5) tek isteğe yeter: her pencerede sadece sıranın başı gönderilir
+    client, scheduler, clock = make_client(stub, limit=6)
+    try:
+        stub.used_weight = 5
+        get(client, stub, 'warmup')
+
+        requests = [(f'LOW{i}', PRIORITY_CHART) for i in range(3)]
+        threads, errors = start_callers(client, stub, requests)
+        wait_until(lambda: scheduler.stats()[stub.host]['queue_depth'] == 3)
+        requests = [(f'HIGH{i}', PRIORITY_SCANNER) for i in range(3)]
+        more, more_errors = start_callers(client, stub, requests)
+        wait_until(lambda: scheduler.stats()[stub.host]['queue_depth'] == 6)
+
+        for served in range(2, 8):
+            advance(scheduler, clock, WINDOW)
+            wait_until(lambda: len(stub.received) == served)
+
+        for thread in threads + more:
+            thread.join(5)
+        assert not errors and not more_errors
+        assert stub.received[1:] == ['HIGH0', 'HIGH1', 'HIGH2', 'LOW0', 'LOW1', 'LOW2']
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize('status', [429, 418])
+def test_retry_after_blocks_every_caller(stub, status):
+    client, scheduler, clock = make_client(stub, limit=2400)
+    try:
+        stub.responses.append((status, {'Retry-After': '30'}))
+        assert get(client, stub, 'A').status_code == status
+        assert scheduler.stats()[stub.host]['banned_for'] == 30
+
+        # Ban süresince hiçbir öncelik istek gönderemez
+        for priority in (PRIORITY_SCANNER, PRIORITY_CHART):
+            with pytest.raises(UpstreamThrottled):
+                get(client, stub, 'B', priority=priority, max_wait=5.0)
+
+        requests = [(f'W{i}', PRIORITY_SCANNER if i % 2 else PRIORITY_CHART) for i in range(4)]
+        threads, errors = start_callers(client, stub, requests)
+        wait_until(lambda: scheduler.stats()[stub.host]['queue_depth'] == 4)
+        advance(scheduler, clock, 29.0)
+        time.sleep(0.05)
+        assert stub.received == ['A']
+
+        advance(scheduler, clock, 1.0)
+        for thread in threads:
+            thread.join(5)
+        assert not errors
+        assert sorted(stub.received[1:]) == ['W0', 'W1', 'W2', 'W3']
+    finally:
+        client.close()
@@ -0,0 +1,94 @@
+"""
+CandleCache son kullanma zamanı: max_age sadece açık mum içeren yanıtlara uygulanır,
+haftalık ve aylık mum sınırları takvime göre hesaplanır
+"""
+from datetime import datetime, timezone
+import pytest
+import upstream_cache
+from upstream_cache import CandleCache, next_boundary
+
+HOUR = 3600
+NOW = 1_700_000_000 - 1_700_000_000 % HOUR + 600  # saat başından 10 dk sonra
+
+
+def kline(open_seconds, period=HOUR):
+    open_ms = open_seconds * 1000
+    return [open_ms, "1", "2", "0.5", "1.5", "10", open_ms + period * 1000 - 1, "0", 1, "0", "0", "0"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    current = [float(NOW)]
+    monkeypatch.setattr(upstream_cache.time, 'time', lambda: current[0])
+    return current
+
+
+def cached_until(cache, data, interval='1h'):
+    fetches = []
+    cache.get(('futures', 'BTCUSDT', interval, '2'), interval, lambda: fetches.append(1) or (200, data))
+    return cache.entries[('futures', 'BTCUSDT', interval, '2')][0]
+
+
+def test_open_candle_capped_by_max_age(clock):
+    data = [kline(NOW - 600 - HOUR), kline(NOW - 600)]
+    assert cached_until(CandleCache(max_age=10), data) == NOW + 10
+
+
+def test_closed_only_range_lives_until_boundary(clock):
+    # Son mum kapanmış (işlem durdurulmuş sembol / geçmiş aralık)
+    data = [kline(NOW - 600 - 2 * HOUR), kline(NOW - 600 - HOUR)]
+    assert cached_until(CandleCache(max_age=10), data) == NOW - 600 + HOUR
+
+
+def test_boundary_before_max_age(clock):
+    clock[0] = NOW - 600 + HOUR - 3
+    data = [kline(NOW - 600)]
+    assert cached_until(CandleCache(max_age=10), data) == NOW - 600 + HOUR
+
+
+def test_non_kline_payload_uses_max_age(clock):
+    assert cached_until(CandleCache(max_age=10), {'lq': []}) == NOW + 10
+    assert cached_until(CandleCache(max_age=10), []) == NOW + 10
+
+
+def test_expired_entry_is_refetched(clock):
+    cache = CandleCache(max_age=10)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return 200, [kline(NOW - 600)]
+
+    key = ('futures', 'BTCUSDT', '1h', '1')
+    cache.get(key, '1h', fetch)
+    cache.get(key, '1h', fetch)
+    assert len(fetches) == 1
+    clock[0] += 11
+    cache.get(key, '1h', fetch)
+    assert len(fetches) == 2
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.mark.parametrize('interval,now,expected', [
+    ('5m', utc(2024, 3, 7, 10, 2), utc(2024, 3, 7, 10, 5)),
+    # Haftalık mum Pazartesi açılır: Perşembe -> sonraki Pazartesi, Pazartesi 00:00 -> bir hafta sonrası
+    ('1w', utc(2024, 3, 7, 12), utc(2024, 3, 11)),
+    ('1w', utc(2024, 3, 11), utc(2024, 3, 18)),
+    ('1w', utc(2024, 3, 10, 23, 59), utc(2024, 3, 11)),
+    # Aylık mum takvim ayına göre kapanır
+    ('1M', utc(2024, 2, 10), utc(2024, 3, 1)),
+    ('1M', utc(2024, 1, 31, 23), utc(2024, 2, 1)),
+    ('1M', utc(2024, 12, 15), utc(2025, 1, 1)),
+])
+def test_next_boundary(interval, now, expected):
+    assert next_boundary(interval, now) == expected
+
+
+def test_closed_weekly_range_lives_until_monday(monkeypatch):
+    now = utc(2024, 3, 7, 12)
+    monkeypatch.setattr(upstream_cache.time, 'time', lambda: now)
+    closed = [[int(utc(2024, 2, 26) * 1000), "1", "2", "0.5", "1.5", "10", int(utc(2024, 3, 4) * 1000) - 1]]
+    assert cached_until(CandleCache(max_age=10), closed, '1w') == utc(2024, 3, 11)
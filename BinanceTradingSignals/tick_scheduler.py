@@ -0,0 +1,107 @@
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class TickScheduler:
+    """
+    Açık mum tick'lerini sembol başına birleştiren değerlendirme zamanlayıcısı
+    Tick gelen sembol kirli işaretlenir; her kirli sembol interval'de en fazla bir kez,
+    değerlendirme anındaki en güncel durumla işlenir. Kapanış gibi acil değerlendirmeler
+    zamanlayıcıyı beklemeden yapılır ve ran() ile bildirilir.
+    """
+
+    def __init__(self, interval: float = 0.25, clock: Callable[[], float] = time.monotonic):
+        self.interval = interval
+        self.clock = clock
+        # sembol -> (ilk bekleyen tick zamanı, sıra no) - sıra no heap kaydının geçerliliğini belirler
+        self.dirty: Dict[str, Tuple[float, int]] = {}
+        self.last_run: Dict[str, float] = {}
+        self.heap: List[Tuple[float, int, str]] = []
+        self.sequence = itertools.count()
+
+        # Sayaçlar
+        self.ticks = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.evaluations = 0
+        self.urgent = 0
+        self.lag_count = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+
+    def mark(self, symbol: str) -> bool:
+        """Sembolü kirli işaretle; sembol zaten bekliyorsa tick birleştirilir (False döner)"""
+        self.ticks += 1
+        if symbol in self.dirty:
+            self.coalesced += 1
+            return False
+
+        now = self.clock()
+        token = next(self.sequence)
+        self.dirty[symbol] = (now, token)
+        due = max(now, self.last_run.get(symbol, float('-inf')) + self.interval)
+        heapq.heappush(self.heap, (due, token, symbol))
+        return True
+
+    def _record(self, symbol: str, now: float):
+        """Bekleyen tick'lerin gecikmesini kaydet ve sembolü temizle"""
+        pending = self.dirty.pop(symbol, None)
+        if pending is not None:
+            lag = now - pending[0]
+            self.lag_count += 1
+            self.lag_total += lag
+            self.lag_max = max(self.lag_max, lag)
+        self.last_run[symbol] = now
+
+    def ran(self, symbol: str):
+        """Sembol zamanlayıcı dışında (ör. mum kapanışında) değerlendirildi"""
+        self.urgent += 1
+        self._record(symbol, self.clock())
+
+    def pop_due(self) -> List[str]:
+        """Değerlendirme zamanı gelen sembolleri ilk tick sırasıyla döndür"""
+        now = self.clock()
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            _, token, symbol = heapq.heappop(self.heap)
+            pending = self.dirty.get(symbol)
+            if pending is None or pending[1] != token:
+                # Sembol bu arada acil değerlendirildi veya bırakıldı
+                continue
+            self._record(symbol, now)
+            self.evaluations += 1
+            due.append(symbol)
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """En yakın geçerli değerlendirme zamanı (bekleyen yoksa None)"""
+        while self.heap:
+            _, token, symbol = self.heap[0]
+            pending = self.dirty.get(symbol)
+            if pending is not None and pending[1] == token:
+                return self.heap[0][0]
+            heapq.heappop(self.heap)
+        return None
+
+    def discard(self, symbols: Iterable[str]):
+        """Artık taranmayan sembollerin bekleyen tick'lerini bırak"""
+        for symbol in symbols:
+            if self.dirty.pop(symbol, None) is not None:
+                self.dropped += 1
+            self.last_run.pop(symbol, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'interval_ms': round(self.interval * 1000, 1),
+            'pending': len(self.dirty),
+            'ticks': self.ticks,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'evaluations': self.evaluations,
+            'urgent': self.urgent,
+            'coalesce_ratio': round(self.coalesced / self.ticks, 4) if self.ticks else 0.0,
+            'avg_lag_ms': round(self.lag_total / self.lag_count * 1000, 2) if self.lag_count else 0.0,
+            'max_lag_ms': round(self.lag_max * 1000, 2)
+        }
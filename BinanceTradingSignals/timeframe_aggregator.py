@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from kline_buffer import KlineRingBuffer
+
+
+class TimeframeAggregator:
+    """
+    Taban zaman dilimi mumlarından tek bir üst zaman dilimini (ör. 1m -> 15m) artımlı üreten depo
+    Açık kovanın kapanmış taban mumlarından gelen open/high/low/hacim özeti tutulur;
+    her taban güncellemesi bu özete açık taban mumu eklenerek O(1) işlenir.
+    Kova sınırları Binance ile aynı şekilde UTC'ye hizalıdır.
+    """
+
+    def __init__(self, base_seconds: int, timeframe_seconds: int, capacity: int = 200):
+        if timeframe_seconds <= base_seconds or timeframe_seconds % base_seconds:
+            raise ValueError(f"{timeframe_seconds} sn, {base_seconds} sn taban aralığının katı olmalı")
+
+        self.base_ms = base_seconds * 1000
+        self.period_ms = timeframe_seconds * 1000
+        self.timeframe_seconds = timeframe_seconds
+        self.capacity = capacity
+        self.buffers: Dict[str, KlineRingBuffer] = {}
+        # sembol -> [kova başlangıcı, open, high, low, kapanmış hacim, sıradaki taban mumu]
+        self.buckets: Dict[str, List] = {}
+
+    @property
+    def bars_per_bucket(self) -> int:
+        return self.period_ms // self.base_ms
+
+    def buffer(self, symbol: str) -> KlineRingBuffer:
+        """Sembolün üst zaman dilimi deposunu döndür (yoksa oluştur)"""
+        klines = self.buffers.get(symbol)
+        if klines is None:
+            klines = self.buffers[symbol] = KlineRingBuffer(self.capacity)
+        return klines
+
+    def seed(self, symbol: str, rows: Sequence[tuple]):
+        """
+        Üst zaman dilimi geçmişini REST satırlarından (open_time, o, h, l, c, v, is_closed) kur
+        Sadece kapanmış mumlar alınır; açık kova taban mumlarından üretilir.
+        """
+        klines = KlineRingBuffer(self.capacity)
+        for row in rows:
+            if row[6]:
+                klines.append(*row)
+        self.buffers[symbol] = klines
+        self.buckets.pop(symbol, None)
+
+    def load(self, symbol: str, columns):
+        """Kapanmış üst zaman dilimi mumlarını (open_time, o, h, l, c, v) dizilerinden yükle"""
+        klines = KlineRingBuffer(self.capacity)
+        klines.load(*columns)
+        self.buffers[symbol] = klines
+        self.buckets.pop(symbol, None)
+
+    def _open_bucket(self, bucket_start: int, open_time: int, base: Optional[KlineRingBuffer]) -> List:
+        """Kova özetini taban deposundaki [bucket_start, open_time) kapanmış mumlarından kur"""
+        state = [bucket_start, None, -np.inf, np.inf, 0.0, bucket_start]
+        if base is None:
+            return state
+
+        open_times, opens, highs, lows, _, volumes = base.columns(include_open=False)
+        first = int(np.searchsorted(open_times, bucket_start))
+        last = int(np.searchsorted(open_times, open_time))
+        if last > first:
+            state[1] = float(opens[first])
+            state[2] = float(highs[first:last].max())
+            state[3] = float(lows[first:last].min())
+            state[4] = float(volumes[first:last].sum())
+            state[5] = int(open_times[last - 1]) + self.base_ms
+        return state
+
+    def update(self, symbol: str, open_time: int, open_price: float, high: float, low: float,
+               close: float, volume: float, is_closed: bool, base: Optional[KlineRingBuffer] = None) -> bool:
+        """
+        Taban mumunu kovasına işle
+        base: sembolün taban deposu - kova ortasından başlanırsa önceki mumlar buradan okunur
+        Üst zaman dilimi mumu yazıldıysa True döner.
+        """
+        bucket_start = open_time - open_time % self.period_ms
+        klines = self.buffer(symbol)
+
+        # REST'ten gelen kapanmış kovalar kesindir
+        last_open_time = klines.last_open_time
+        if last_open_time is not None and (bucket_start < last_open_time or
+                                           (bucket_start == last_open_time and not klines.has_open)):
+            return False
+
+        state = self.buckets.get(symbol)
+        if state is None or state[0] != bucket_start:
+            state = self.buckets[symbol] = self._open_bucket(bucket_start, open_time, base)
+
+        if open_time < state[5]:
+            # Özete zaten işlenmiş taban mumu
+            return False
+
+        bucket_open = state[1] if state[1] is not None else open_price
+        bucket_high = max(state[2], high)
+        bucket_low = min(state[3], low)
+        bucket_volume = state[4] + volume
+
+        if is_closed:
+            state[1], state[2], state[3], state[4] = bucket_open, bucket_high, bucket_low, bucket_volume
+            state[5] = open_time + self.base_ms
+
+        bucket_closed = is_closed and open_time + self.base_ms >= bucket_start + self.period_ms
+        return klines.append(bucket_start, bucket_open, bucket_high, bucket_low, close,
+                             bucket_volume, bucket_closed)
@@ -1,8 +1,10 @@
 import numpy as np
 import pandas as pd
 import ta
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, List, Optional
+from collections import deque
 import math
+import time
 
 class FinyXAdvancedSignal:
     """
@@ -15,6 +17,9 @@ class FinyXAdvancedSignal:
         self.last_signal_bar = None
         self.signal_cooldown = 3
         
+        # Son hesabın süreleri (sn): (göstergeler, koşullar) - aşama metrikleri için
+        self.last_timing = (0.0, 0.0)
+        
         # Tesla 3-6-9 Kuralı (Frekans Harmonikleri)
         self.tesla_3 = 3
         self.tesla_6 = 6
@@ -28,16 +33,82 @@ class FinyXAdvancedSignal:
     def calculate_signals(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         DataFrame ile Pine Script mantığını uygula
-        df: OHLCV verisi içeren DataFrame
+        df: OHLCV verisi içeren DataFrame (veya sütun görünümü veren KlineRingBuffer)
         """
         if len(df) < 200:  # Minimum veri kontrolü
             return self._empty_signal()
             
-        close = df['close'].values
-        open_prices = df['open'].values
-        high = df['high'].values
-        low = df['low'].values
-        volume = df['volume'].values
+        arrays = self.signal_arrays(np.asarray(df['open'], dtype=float), np.asarray(df['high'], dtype=float),
+                                    np.asarray(df['low'], dtype=float), np.asarray(df['close'], dtype=float),
+                                    np.asarray(df['volume'], dtype=float))
+        is_buy_signal, is_pump_signal, is_sell_signal = \
+            arrays['is_buy_signal'], arrays['is_pump_signal'], arrays['is_sell_signal']
+        rsi, close, volume, volume_avg, price_change = \
+            arrays['rsi'], arrays['close'], arrays['volume'], arrays['volume_avg'], arrays['price_change']
+        strong_uptrend, strong_downtrend, weak_uptrend, weak_downtrend = \
+            arrays['strong_uptrend'], arrays['strong_downtrend'], arrays['weak_uptrend'], arrays['weak_downtrend']
+        
+        # Son değerleri al (güncel mum)
+        current_idx = -1
+        
+        result = {
+            'buy_signal': bool(is_buy_signal[current_idx]) if len(is_buy_signal) > 0 else False,
+            'pump_signal': bool(is_pump_signal[current_idx]) if len(is_pump_signal) > 0 else False,
+            'sell_signal': bool(is_sell_signal[current_idx]) if len(is_sell_signal) > 0 else False,
+            'rsi': float(rsi[current_idx]) if len(rsi) > 0 else 0,
+            'trend': self._get_trend_text(strong_uptrend[current_idx], strong_downtrend[current_idx], 
+                                        weak_uptrend[current_idx], weak_downtrend[current_idx]),
+            'volume_status': self._get_volume_status(volume[current_idx], volume_avg[current_idx]),
+            'price': float(close[current_idx]),
+            'price_change': float(price_change[current_idx]) if len(price_change) > 0 else 0
+        }
+        
+        return result
+    
+    def calculate_signals_batch(self, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                                closes: np.ndarray, volumes: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Aynı mum sayısına sahip, açılış zamanına hizalı sembolleri tek geçişte değerlendir
+        Girdiler (semboller x mumlar) matrisleridir; satır başına calculate_signals ile aynı sonuç döner.
+        Kısa geçmişler soldan NaN ile doldurulabilir - 200'den az gerçek mumu olan satır boş sinyal alır.
+        """
+        closes = np.asarray(closes, dtype=float)
+        if closes.ndim != 2 or closes.shape[1] < 200:  # Minimum veri kontrolü
+            return [self._empty_signal() for _ in range(len(closes))]
+        
+        # Son mumda pivot hiçbir zaman oluşmaz, causal hesap aynı sonucu pivot taraması olmadan verir
+        arrays = self.signal_arrays(np.asarray(opens, dtype=float), np.asarray(highs, dtype=float),
+                                    np.asarray(lows, dtype=float), closes, np.asarray(volumes, dtype=float),
+                                    causal=True)
+        last = {name: values[:, -1].tolist() for name, values in arrays.items()}
+        available = np.count_nonzero(~np.isnan(closes), axis=1).tolist()
+        
+        results = []
+        for row in range(len(closes)):
+            if available[row] < 200:
+                results.append(self._empty_signal())
+                continue
+            results.append({
+                'buy_signal': bool(last['is_buy_signal'][row]),
+                'pump_signal': bool(last['is_pump_signal'][row]),
+                'sell_signal': bool(last['is_sell_signal'][row]),
+                'rsi': float(last['rsi'][row]),
+                'trend': self._get_trend_text(last['strong_uptrend'][row], last['strong_downtrend'][row],
+                                              last['weak_uptrend'][row], last['weak_downtrend'][row]),
+                'volume_status': self._get_volume_status(last['volume'][row], last['volume_avg'][row]),
+                'price': float(last['close'][row]),
+                'price_change': float(last['price_change'][row])
+            })
+        return results
+    
+    def signal_arrays(self, open_prices: np.ndarray, high: np.ndarray, low: np.ndarray,
+                      close: np.ndarray, volume: np.ndarray, causal: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Tüm geçmiş için gösterge, koşul ve sinyal dizilerini tek seferde hesapla
+        Girdiler 1B (tek sembol) veya açılış zamanına hizalı 2B (semboller x mumlar) olabilir
+        causal=True: her mum sadece kendisine kadarki verilerle değerlendirilmiş gibi (backtest / canlı ile aynı)
+        """
+        started = time.perf_counter()
         
         # Zaman dilimi tespiti
         current_timeframe = self.timeframe_seconds
@@ -85,8 +156,17 @@ class FinyXAdvancedSignal:
         lookback = 5 if is_low_tf else 8
         
         # Pivot noktaları
-        pivot_high = self._pivot_high(high, lookback)
-        pivot_low = self._pivot_low(low, lookback)
+        if causal:
+            # Pivot sağında lookback mum gerektirir; mum kendi anında değerlendirildiğinde
+            # (canlı tarama, FinyXStreamingSignal) pivot hiçbir zaman oluşmamış olur
+            pivot_high = pivot_low = np.full(close.shape, np.nan)
+        elif close.ndim == 1:
+            pivot_high = self._pivot_high(high, lookback)
+            pivot_low = self._pivot_low(low, lookback)
+        else:
+            pivot_high = np.vstack([self._pivot_high(row, lookback) for row in high])
+            pivot_low = np.vstack([self._pivot_low(row, lookback) for row in low])
+        indicators_done = time.perf_counter()
         
         # Güçlü dip/tepe tespiti
         is_strong_dip = (~np.isnan(pivot_low)) & (volume > volume_avg * 1.2)
@@ -143,23 +223,31 @@ class FinyXAdvancedSignal:
         avoid_sell = strong_downtrend | (rsi < 40) | (close < ema_trend_long * 0.95)
         
         is_sell_signal = (sell_condition_1 | sell_condition_2 | sell_condition_3) & (~avoid_sell)
+        self.last_timing = (indicators_done - started, time.perf_counter() - indicators_done)
         
-        # Son değerleri al (güncel mum)
-        current_idx = -1
-        
-        result = {
-            'buy_signal': bool(is_buy_signal[current_idx]) if len(is_buy_signal) > 0 else False,
-            'pump_signal': bool(is_pump_signal[current_idx]) if len(is_pump_signal) > 0 else False,
-            'sell_signal': bool(is_sell_signal[current_idx]) if len(is_sell_signal) > 0 else False,
-            'rsi': float(rsi[current_idx]) if len(rsi) > 0 else 0,
-            'trend': self._get_trend_text(strong_uptrend[current_idx], strong_downtrend[current_idx], 
-                                        weak_uptrend[current_idx], weak_downtrend[current_idx]),
-            'volume_status': self._get_volume_status(volume[current_idx], volume_avg[current_idx]),
-            'price': float(close[current_idx]),
-            'price_change': float(price_change[current_idx]) if len(price_change) > 0 else 0
+        return {
+            'close': close,
+            'volume': volume,
+            'volume_avg': volume_avg,
+            'price_change': price_change,
+            'rsi': rsi,
+            'strong_uptrend': strong_uptrend,
+            'strong_downtrend': strong_downtrend,
+            'weak_uptrend': weak_uptrend,
+            'weak_downtrend': weak_downtrend,
+            'buy_condition_1': buy_condition_1,
+            'buy_condition_2': buy_condition_2,
+            'buy_condition_3': buy_condition_3,
+            'pump_condition_1': pump_condition_1,
+            'pump_condition_2': pump_condition_2,
+            'pump_condition_3': pump_condition_3,
+            'sell_condition_1': sell_condition_1,
+            'sell_condition_2': sell_condition_2,
+            'sell_condition_3': sell_condition_3,
+            'is_buy_signal': is_buy_signal,
+            'is_pump_signal': is_pump_signal,
+            'is_sell_signal': is_sell_signal
         }
-        
-        return result
     
     def _empty_signal(self) -> Dict[str, Any]:
         """Boş sinyal döndür"""
@@ -175,97 +263,137 @@ class FinyXAdvancedSignal:
         }
     
     # Teknik gösterge fonksiyonları
+    # 1B dizi tek sembol (pandas / ta), 2B (semboller x mumlar) dizi tüm semboller için NumPy ile hesaplanır
+    def _ewm_rows(self, data: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+        """
+        pandas ewm(alpha, adjust=False).mean() ile aynı özyineleme, mum ekseninde tüm satırlar birlikte
+        Başta NaN olan satırlar ilk geçerli değerden başlar
+        """
+        columns = np.ascontiguousarray(data.T)  # mum başına bitişik satır
+        result = np.empty(columns.shape)
+        factor = 1 - alpha
+        denominator = factor + alpha
+        
+        weighted = result[0] = columns[0]
+        for i in range(1, len(columns)):
+            current = columns[i]
+            updated = (factor * weighted + alpha * current) / denominator
+            # Aynı değer veya eksik gözlemde ortalama değişmez; ortalama henüz başlamadıysa ilk gözlem alınır
+            keep = (weighted == current) | (current != current)
+            weighted = result[i] = np.where(keep, weighted, np.where(weighted == weighted, updated, current))
+        
+        observations = np.cumsum(columns == columns, axis=0)
+        result[observations < max(min_periods, 1)] = np.nan
+        return result.T
+    
+    def _windows(self, data: np.ndarray, period: int) -> Optional[np.ndarray]:
+        """Satır başına period uzunluklu kayan pencereler (yetersiz veri varsa None)"""
+        if data.shape[1] < period:
+            return None
+        return np.lib.stride_tricks.sliding_window_view(data, period, axis=1)
+    
+    def _rolling_rows(self, data: np.ndarray, period: int, reducer) -> np.ndarray:
+        """Kayan pencere özetini ilk period-1 mumu NaN olacak şekilde hesapla"""
+        result = np.full(data.shape, np.nan)
+        windows = self._windows(data, period)
+        if windows is not None:
+            result[:, period - 1:] = reducer(windows, axis=-1)
+        return result
+    
     def _sma(self, data: np.ndarray, period: int) -> np.ndarray:
         """Simple Moving Average"""
+        if data.ndim == 2:
+            return self._rolling_rows(data, period, np.sum) / period
         return pd.Series(data).rolling(window=period).mean().values
     
     def _ema(self, data: np.ndarray, period: int) -> np.ndarray:
         """Exponential Moving Average"""
+        if data.ndim == 2:
+            return self._ewm_rows(data, 2 / (period + 1))
         return pd.Series(data).ewm(span=period, adjust=False).mean().values
     
     def _rsi(self, data: np.ndarray, period: int = 14) -> np.ndarray:
         """Relative Strength Index"""
-        return ta.momentum.RSIIndicator(pd.Series(data), window=period).rsi().values
+        if data.ndim == 1:
+            return ta.momentum.RSIIndicator(pd.Series(data), window=period).rsi().values
+        
+        # ta.momentum.RSIIndicator ile aynı Wilder formülü (ilk mumun NaN farkı 0 sayılır)
+        diff = data - self._shift(data, 1)
+        up = self._ewm_rows(np.where(diff > 0, diff, 0.0), 1 / period, period)
+        down = self._ewm_rows(-np.where(diff < 0, diff, 0.0), 1 / period, period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(down == 0, 100, 100 - (100 / (1 + up / down)))
     
     def _macd(self, data: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """MACD"""
-        macd_indicator = ta.trend.MACD(pd.Series(data), window_fast=fast, window_slow=slow, window_sign=signal)
-        return (macd_indicator.macd().values, 
-                macd_indicator.macd_signal().values, 
-                macd_indicator.macd_diff().values)
+        if data.ndim == 1:
+            macd_indicator = ta.trend.MACD(pd.Series(data), window_fast=fast, window_slow=slow, window_sign=signal)
+            return (macd_indicator.macd().values, 
+                    macd_indicator.macd_signal().values, 
+                    macd_indicator.macd_diff().values)
+        
+        # ta.trend.MACD ile aynı formül
+        macd = self._ewm_rows(data, 2 / (fast + 1), fast) - self._ewm_rows(data, 2 / (slow + 1), slow)
+        macd_signal = self._ewm_rows(macd, 2 / (signal + 1), signal)
+        return macd, macd_signal, macd - macd_signal
     
     def _highest(self, data: np.ndarray, period: int) -> np.ndarray:
         """En yüksek değer"""
+        if data.ndim == 2:
+            return self._rolling_rows(data, period, np.max)
         return pd.Series(data).rolling(window=period).max().values
     
     def _lowest(self, data: np.ndarray, period: int) -> np.ndarray:
         """En düşük değer"""
+        if data.ndim == 2:
+            return self._rolling_rows(data, period, np.min)
         return pd.Series(data).rolling(window=period).min().values
     
     def _shift(self, data: np.ndarray, periods: int) -> np.ndarray:
-        """Veriyi kaydır"""
+        """Veriyi son eksende kaydır (boolean seriler Pine Script'teki gibi False ile doldurulur)"""
+        fill = False if data.dtype == bool else np.nan
         if periods > 0:
-            return np.concatenate([np.full(periods, np.nan), data[:-periods]])
+            padding = np.full(data.shape[:-1] + (periods,), fill)
+            return np.concatenate([padding, data[..., :-periods]], axis=-1)
         elif periods < 0:
-            return np.concatenate([data[-periods:], np.full(-periods, np.nan)])
+            padding = np.full(data.shape[:-1] + (-periods,), fill)
+            return np.concatenate([data[..., -periods:], padding], axis=-1)
         return data
     
     def _pivot_high(self, data: np.ndarray, left_bars: int, right_bars: int = None) -> np.ndarray:
         """Pivot High"""
-        if right_bars is None:
-            right_bars = left_bars
-        
-        result = np.full(len(data), np.nan)
-        
-        for i in range(left_bars, len(data) - right_bars):
-            current = data[i]
-            is_highest = True
-            
-            # Sol taraf kontrolü
-            for j in range(i - left_bars, i):
-                if data[j] >= current:
-                    is_highest = False
-                    break
-            
-            # Sağ taraf kontrolü
-            if is_highest:
-                for j in range(i + 1, i + right_bars + 1):
-                    if data[j] >= current:
-                        is_highest = False
-                        break
-            
-            if is_highest:
-                result[i] = current
-        
-        return result
+        return self._pivot(data, left_bars, right_bars, True)
     
     def _pivot_low(self, data: np.ndarray, left_bars: int, right_bars: int = None) -> np.ndarray:
         """Pivot Low"""
+        return self._pivot(data, left_bars, right_bars, False)
+    
+    def _pivot(self, data: np.ndarray, left_bars: int, right_bars: Optional[int], is_high: bool) -> np.ndarray:
+        """
+        sliding_window_view ile vektörize pivot tespiti
+        Komşulardan biri eşit veya daha uçtaysa pivot yoktur; NaN komşular pivotu engellemez
+        """
         if right_bars is None:
             right_bars = left_bars
         
-        result = np.full(len(data), np.nan)
+        data = np.asarray(data, dtype=float)
+        n = len(data)
+        result = np.full(n, np.nan)
         
-        for i in range(left_bars, len(data) - right_bars):
-            current = data[i]
-            is_lowest = True
-            
-            # Sol taraf kontrolü
-            for j in range(i - left_bars, i):
-                if data[j] <= current:
-                    is_lowest = False
-                    break
-            
-            # Sağ taraf kontrolü
-            if is_lowest:
-                for j in range(i + 1, i + right_bars + 1):
-                    if data[j] <= current:
-                        is_lowest = False
-                        break
-            
-            if is_lowest:
-                result[i] = current
+        window = left_bars + right_bars + 1
+        if n < window:
+            return result
+        
+        windows = np.lib.stride_tricks.sliding_window_view(data, window)
+        center = windows[:, left_bars]
+        neighbors = np.delete(windows, left_bars, axis=1)
+        
+        if is_high:
+            blocked = (neighbors >= center[:, None]).any(axis=1)
+        else:
+            blocked = (neighbors <= center[:, None]).any(axis=1)
         
+        result[left_bars:n - right_bars] = np.where(blocked, np.nan, center)
         return result
     
     def _get_trend_text(self, strong_up: bool, strong_down: bool, weak_up: bool, weak_down: bool) -> str:
@@ -289,3 +417,315 @@ class FinyXAdvancedSignal:
             return "Düşük"
         else:
             return "Normal"
+
+
+
+class _RollingWindowSum:
+    """Son N kapanmış değerin toplamı (açık mum toplama geçici olarak eklenir)"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque()
+        self.total = 0.0
+        self.pushes = 0
+    
+    def push(self, value: float):
+        self.values.append(value)
+        self.total += value
+        if len(self.values) > self.size:
+            self.total -= self.values.popleft()
+        
+        # Kayan nokta birikimini her tam turda sıfırla
+        self.pushes += 1
+        if self.pushes % self.size == 0:
+            self.total = math.fsum(self.values)
+
+
+class _RollingExtreme:
+    """Monotonik deque ile son N kapanmış değerin maksimumu/minimumu"""
+    
+    def __init__(self, size: int, use_max: bool = True):
+        self.size = size
+        self.use_max = use_max
+        self.items = deque()  # (index, value)
+        self.count = 0
+    
+    def push(self, value: float):
+        if self.use_max:
+            while self.items and self.items[-1][1] <= value:
+                self.items.pop()
+        else:
+            while self.items and self.items[-1][1] >= value:
+                self.items.pop()
+        self.items.append((self.count, value))
+        self.count += 1
+        while self.items[0][0] <= self.count - 1 - self.size:
+            self.items.popleft()
+    
+    def value_with(self, current: float) -> float:
+        """Açık mum dahil pencerenin uç değeri"""
+        if not self.items:
+            return current
+        best = self.items[0][1]
+        return max(best, current) if self.use_max else min(best, current)
+
+
+class FinyXStreamingSignal(FinyXAdvancedSignal):
+    """
+    FinyXAdvancedSignal'in artımlı (tick başına O(1)) versiyonu
+    Kapanmış mumlar duruma işlenir, açık mum durumu değiştirmeden geçici olarak değerlendirilir.
+    Sonuç, aynı geçmişin tamamı üzerinde çalıştırılan calculate_signals ile aynıdır.
+    """
+    
+    def __init__(self, timeframe_seconds: int = 300, min_bars: int = 200):
+        super().__init__(timeframe_seconds)
+        self.min_bars = min_bars
+        self.reset()
+    
+    @classmethod
+    def from_history(cls, timeframe_seconds: int, open_times: np.ndarray, opens: np.ndarray,
+                     highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                     volumes: np.ndarray) -> 'FinyXStreamingSignal':
+        """Kapanmış mum dizilerinden motoru kur"""
+        engine = cls(timeframe_seconds)
+        for row in zip(open_times.tolist(), opens.tolist(), highs.tolist(), lows.tolist(),
+                       closes.tolist(), volumes.tolist()):
+            engine.update(*row, True)
+        return engine
+    
+    @classmethod
+    def for_buffer(cls, engine: Optional['FinyXStreamingSignal'], klines,
+                   timeframe_seconds: int) -> 'FinyXStreamingSignal':
+        """
+        Mum deposu (KlineRingBuffer) için kullanılacak motoru döndür
+        Motorun son mumu deponun son mumu veya bir öncekiyse motor aynen kullanılır; motor yoksa
+        veya depoda boşluk oluştuysa son mum hariç depodan yeniden kurulur (sütun görünümleri, kopya yok)
+        """
+        if engine is not None and engine.last_open_time is not None and \
+                klines.last_open_time - engine.last_open_time in (0, timeframe_seconds * 1000):
+            return engine
+        return cls.from_history(timeframe_seconds, *[column[:-1] for column in klines.columns()])
+    
+    def reset(self):
+        """Tüm gösterge durumunu sıfırla"""
+        self.bar_count = 0
+        self.last_open_time: Optional[int] = None
+        self._last_result = self._empty_signal()
+        
+        # EMA durumları (pandas ewm adjust=False ile aynı özyineleme)
+        self.ema_state = {12: None, 26: None, 50: None, 100: None}
+        
+        # Wilder RSI durumu (ta.momentum.RSIIndicator ile aynı)
+        self.rsi_period = 14
+        self.avg_up = None
+        self.avg_down = None
+        self.prev_close = None
+        
+        # MACD sinyal hattı durumu
+        self.macd_signal_period = 9
+        self.macd_signal = None
+        self.macd_count = 0
+        self.prev_histogram = np.nan
+        
+        # Kayan pencereler (açık mum hariç kapanmış değerler)
+        self.volume_window = _RollingWindowSum(19)
+        self.high_window = _RollingExtreme(88, use_max=True)
+        
+        # Önceki iki kapanmış mum
+        self.prev_lows = deque(maxlen=2)
+        self.prev_highs = deque(maxlen=2)
+        
+        # Önceki mumun koşul bayrakları
+        self.prev_weak_uptrend = False
+        self.prev_weak_downtrend = False
+        self.prev_perfect_dip = False
+        self.prev_perfect_peak = False
+    
+    def update(self, open_time: int, open_price: float, high: float, low: float,
+               close: float, volume: float, is_closed: bool) -> Dict[str, Any]:
+        """
+        Yeni tick'i işle ve güncel mumun sinyalini döndür
+        is_closed=True ise mum duruma kalıcı olarak işlenir
+        """
+        if is_closed and self.last_open_time is not None and open_time <= self.last_open_time:
+            # Aynı kapanmış mum tekrar geldi - durumu bozmadan değerlendir
+            return self._empty_signal() if self.bar_count < self.min_bars else self._last_result
+        
+        values = self._evaluate(open_price, high, low, close, volume)
+        
+        if is_closed:
+            self._commit(open_time, high, low, close, volume, values)
+            self._last_result = values['result']
+        
+        if self.bar_count + (0 if is_closed else 1) < self.min_bars:
+            return self._empty_signal()
+        
+        return values['result']
+    
+    def _ema_step(self, period: int, value: float) -> float:
+        prev = self.ema_state[period]
+        if prev is None:
+            return value
+        alpha = 2.0 / (period + 1)
+        return (1 - alpha) * prev + alpha * value
+    
+    def _evaluate(self, open_price: float, high: float, low: float,
+                  close: float, volume: float) -> Dict[str, Any]:
+        """Güncel mum için tüm göstergeleri ve koşulları hesapla (durum değişmez)"""
+        started = time.perf_counter()
+        is_low_tf = self.timeframe_seconds <= 300
+        
+        # Hacim ortalaması (SMA 20)
+        if len(self.volume_window.values) >= 19:
+            volume_avg = (self.volume_window.total + volume) / 20
+        else:
+            volume_avg = np.nan
+        price_change = (close - open_price) / open_price * 100 if open_price else np.nan
+        
+        # EMA'lar
+        emas = {period: self._ema_step(period, close) for period in self.ema_state}
+        ema_fast, ema_medium, ema_slow, ema_trend_long = emas[12], emas[26], emas[50], emas[100]
+        
+        # Altın spiral kontrolü
+        price_ratio = close / self.high_window.value_with(high)
+        is_golden_zone = (self.phi_inverse - 0.08) <= price_ratio <= (self.phi_inverse + 0.08)
+        
+        # Trend
+        strong_uptrend = ema_fast > ema_medium > ema_slow > ema_trend_long and close > ema_fast
+        strong_downtrend = ema_fast < ema_medium < ema_slow < ema_trend_long and close < ema_fast
+        weak_uptrend = ema_fast > ema_medium and close > ema_fast and not strong_uptrend
+        weak_downtrend = ema_fast < ema_medium and close < ema_fast and not strong_downtrend
+        sideways_market = not (strong_uptrend or strong_downtrend or weak_uptrend or weak_downtrend)
+        
+        trend_change_up = self.prev_weak_downtrend and (sideways_market or weak_uptrend)
+        trend_change_down = self.prev_weak_uptrend and (sideways_market or weak_downtrend)
+        
+        # RSI (Wilder)
+        alpha = 1.0 / self.rsi_period
+        if self.prev_close is None:
+            up = down = 0.0
+        else:
+            diff = close - self.prev_close
+            up = diff if diff > 0 else 0.0
+            down = -diff if diff < 0 else 0.0
+        avg_up = up if self.avg_up is None else (1 - alpha) * self.avg_up + alpha * up
+        avg_down = down if self.avg_down is None else (1 - alpha) * self.avg_down + alpha * down
+        if self.bar_count + 1 < self.rsi_period:
+            rsi = np.nan
+        elif avg_down == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - (100 / (1 + avg_up / avg_down))
+        
+        # MACD
+        if self.bar_count + 1 >= 26:
+            macd_line = emas[12] - emas[26]
+            if self.macd_signal is None:
+                macd_signal = macd_line
+            else:
+                signal_alpha = 2.0 / (self.macd_signal_period + 1)
+                macd_signal = (1 - signal_alpha) * self.macd_signal + signal_alpha * macd_line
+            if self.macd_count + 1 >= self.macd_signal_period:
+                signal_line = macd_signal
+            else:
+                signal_line = np.nan
+        else:
+            macd_line = macd_signal = signal_line = np.nan
+        histogram = macd_line - signal_line
+        macd_bullish = macd_line > signal_line and histogram > self.prev_histogram
+        macd_bearish = macd_line < signal_line and histogram < self.prev_histogram
+        indicators_done = time.perf_counter()
+        
+        # Pivot noktaları sağ tarafta lookback kadar mum gerektirdiğinden
+        # son iki mumda hiçbir zaman oluşmaz - güçlü dip/tepe burada daima False
+        if len(self.prev_lows) == 2:
+            low_2, low_1 = self.prev_lows
+            high_2, high_1 = self.prev_highs
+        else:
+            low_2 = low_1 = high_2 = high_1 = np.nan
+        
+        v_shape_dip = low_2 > low_1 > low and volume > volume_avg
+        inverted_v_peak = high_2 < high_1 < high and volume > volume_avg
+        perfect_dip = v_shape_dip
+        perfect_peak = inverted_v_peak
+        
+        # Hacim analizi
+        volume_surge = volume > volume_avg * (2.0 if is_low_tf else 1.8)
+        volume_above_normal = volume > volume_avg * 1.4
+        
+        prev_close = self.prev_close if self.prev_close is not None else np.nan
+        big_volume_up = close > open_price and volume > volume_avg * 2.5 and close > prev_close
+        big_volume_down = close < open_price and volume > volume_avg * 2.5 and close < prev_close
+        
+        # BUY
+        buy_condition_1 = perfect_dip and (strong_downtrend or weak_downtrend) and rsi < 40 and volume_above_normal
+        buy_condition_2 = trend_change_up and macd_bullish and rsi < 50 and volume_surge
+        buy_condition_3 = sideways_market and perfect_dip and rsi < 35 and big_volume_up
+        avoid_buy = strong_uptrend or rsi > 60 or close > ema_trend_long * 1.05
+        is_buy_signal = (buy_condition_1 or buy_condition_2 or buy_condition_3) and not avoid_buy
+        
+        # PUMP
+        pump_condition_1 = self.prev_perfect_dip and close > high_1 and volume_surge and \
+                           price_change > (1.2 if is_low_tf else 0.8)
+        pump_condition_2 = trend_change_up and big_volume_up and close > ema_fast * 1.008
+        pump_condition_3 = is_golden_zone and macd_bullish and volume > volume_avg * 1.6 and close > open_price
+        avoid_pump = strong_uptrend and rsi > 70
+        is_pump_signal = (pump_condition_1 or pump_condition_2 or pump_condition_3) and not avoid_pump
+        
+        # SELL
+        sell_condition_1 = perfect_peak and (strong_uptrend or weak_uptrend) and rsi > 65 and volume_above_normal
+        sell_condition_2 = trend_change_down and macd_bearish and rsi > 50 and volume_surge
+        sell_condition_3 = sideways_market and perfect_peak and rsi > 70 and big_volume_down
+        avoid_sell = strong_downtrend or rsi < 40 or close < ema_trend_long * 0.95
+        is_sell_signal = (sell_condition_1 or sell_condition_2 or sell_condition_3) and not avoid_sell
+        
+        result = {
+            'buy_signal': bool(is_buy_signal),
+            'pump_signal': bool(is_pump_signal),
+            'sell_signal': bool(is_sell_signal),
+            'rsi': float(rsi),
+            'trend': self._get_trend_text(strong_uptrend, strong_downtrend, weak_uptrend, weak_downtrend),
+            'volume_status': self._get_volume_status(volume, volume_avg),
+            'price': float(close),
+            'price_change': float(price_change)
+        }
+        self.last_timing = (indicators_done - started, time.perf_counter() - indicators_done)
+        
+        return {
+            'result': result,
+            'emas': emas,
+            'avg_up': avg_up,
+            'avg_down': avg_down,
+            'macd_signal': macd_signal,
+            'histogram': histogram,
+            'weak_uptrend': weak_uptrend,
+            'weak_downtrend': weak_downtrend,
+            'perfect_dip': perfect_dip,
+            'perfect_peak': perfect_peak
+        }
+    
+    def _commit(self, open_time: int, high: float, low: float, close: float,
+                volume: float, values: Dict[str, Any]):
+        """Kapanmış mumu gösterge durumuna işle"""
+        self.ema_state = values['emas']
+        self.avg_up = values['avg_up']
+        self.avg_down = values['avg_down']
+        self.prev_close = close
+        
+        if not np.isnan(values['macd_signal']):
+            self.macd_signal = values['macd_signal']
+            self.macd_count += 1
+        self.prev_histogram = values['histogram']
+        
+        self.volume_window.push(volume)
+        self.high_window.push(high)
+        self.prev_lows.append(low)
+        self.prev_highs.append(high)
+        
+        self.prev_weak_uptrend = values['weak_uptrend']
+        self.prev_weak_downtrend = values['weak_downtrend']
+        self.prev_perfect_dip = values['perfect_dip']
+        self.prev_perfect_peak = values['perfect_peak']
+        
+        self.bar_count += 1
+        self.last_open_time = open_time
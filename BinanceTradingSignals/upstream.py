@@ -0,0 +1,304 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from metrics import UPSTREAM_ERRORS, UPSTREAM_REQUESTS, UPSTREAM_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 opsiyonel: httpx ve h2 kuruluysa kullanılır
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+# (bağlantı, okuma) zaman aşımı - saniye
+DEFAULT_TIMEOUT = (3.05, 10.0)
+
+# İstek öncelikleri (küçük olan önce gider)
+PRIORITY_SCANNER = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_CHART = 10
+
+# Host başına dakikalık IP ağırlık limitleri
+HOST_WEIGHT_LIMITS = {
+    'fapi.binance.com': 2400,
+    'api.binance.com': 6000
+}
+
+# Sabit ağırlıklı endpoint'ler (sembol parametresiz hali)
+ENDPOINT_WEIGHTS = {
+    '/fapi/v1/exchangeInfo': 1,
+    '/fapi/v1/ticker/24hr': 40,
+    '/fapi/v1/ticker/price': 2,
+    '/api/v3/exchangeInfo': 20,
+    '/api/v3/ticker/24hr': 80,
+    '/api/v3/ticker/price': 4
+}
+
+
+def request_weight(path: str, params: Optional[Dict[str, Any]] = None) -> int:
+    """Binance dokümantasyonuna göre isteğin ağırlığını tahmin et"""
+    params = params or {}
+    if path.endswith('/klines'):
+        if not path.startswith('/fapi/'):
+            return 2
+        limit = int(params.get('limit', 500))
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+    if path.endswith('/ticker/24hr') or path.endswith('/ticker/price'):
+        if 'symbol' in params:
+            return 2 if path.startswith('/api/') and path.endswith('/ticker/24hr') else 1
+    return ENDPOINT_WEIGHTS.get(path, 1)
+
+
+class UpstreamThrottled(Exception):
+    """İstek ağırlık bütçesi veya ban süresi nedeniyle zamanında gönderilemedi"""
+
+
+class _HostState:
+    """Tek host'un ağırlık penceresi, ban süresi ve bekleme kuyruğu"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.window_start = 0.0
+        self.used = 0
+        self.banned_until = 0.0
+        self.queue: List[Tuple[int, int]] = []
+
+        # Sayaçlar
+        self.granted = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+
+class WeightScheduler:
+    """
+    Binance ağırlık limitine göre upstream isteklerini sıraya koyan zamanlayıcı
+    Kullanılan ağırlık yerel tahmin ve X-MBX-USED-WEIGHT-1M başlığının büyüğüdür.
+    Bütçe dolunca istekler pencere sıfırlanana kadar öncelik sırasıyla bekler;
+    418/429 yanıtlarında Retry-After süresince host'a istek gönderilmez.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = 1200,
+                 window: float = 60.0, headroom: float = 0.9, clock: Callable[[], float] = time.time):
+        self.limits = dict(HOST_WEIGHT_LIMITS if limits is None else limits)
+        self.default_limit = default_limit
+        self.window = window
+        self.headroom = headroom
+        self.clock = clock
+        self.hosts: Dict[str, _HostState] = {}
+        self.condition = threading.Condition()
+        self.sequence = itertools.count()
+
+    def _host(self, host: str) -> _HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = _HostState(self.limits.get(host, self.default_limit))
+        return state
+
+    def _roll(self, state: _HostState, now: float):
+        """Dakika penceresi değiştiyse kullanılan ağırlığı sıfırla"""
+        window_start = now - now % self.window
+        if window_start != state.window_start:
+            state.window_start = window_start
+            state.used = 0
+
+    def _wait_time(self, state: _HostState, now: float, weight: int) -> float:
+        """İsteğin gönderilebilmesi için beklenmesi gereken süre (0 = hemen)"""
+        if now < state.banned_until:
+            return state.banned_until - now
+        budget = int(state.limit * self.headroom)
+        if state.used + min(weight, budget) > budget:
+            return state.window_start + self.window - now
+        return 0.0
+
+    def acquire(self, host: str, weight: int, priority: int = PRIORITY_DEFAULT,
+                max_wait: Optional[float] = None):
+        """
+        Bütçe ve sıra uygun olana kadar bekle, sonra ağırlığı ayır
+        max_wait aşılacaksa UpstreamThrottled fırlatılır.
+        """
+        with self.condition:
+            state = self._host(host)
+            ticket = (priority, next(self.sequence))
+            heapq.heappush(state.queue, ticket)
+            started = self.clock()
+            deadline = started + max_wait if max_wait is not None else None
+
+            try:
+                while True:
+                    now = self.clock()
+                    self._roll(state, now)
+                    wait = self._wait_time(state, now, weight)
+
+                    if wait <= 0 and state.queue[0] == ticket:
+                        heapq.heappop(state.queue)
+                        state.used += weight
+                        state.granted += 1
+                        state.wait_seconds += now - started
+                        # Sıradaki istek de bütçeye sığıyor olabilir
+                        self.condition.notify_all()
+                        return
+
+                    if deadline is not None and now + max(wait, 0.0) > deadline:
+                        state.rejected += 1
+                        raise UpstreamThrottled(f"{host} ağırlık limiti: {wait:.1f} sn beklenmeli")
+
+                    timeout = wait if wait > 0 else None
+                    if deadline is not None:
+                        timeout = min(timeout or deadline - now, deadline - now)
+                    self.condition.wait(timeout)
+            except BaseException:
+                if ticket in state.queue:
+                    state.queue.remove(ticket)
+                    heapq.heapify(state.queue)
+                    self.condition.notify_all()
+                raise
+
+    def record_response(self, host: str, status_code: int, headers):
+        """Yanıt başlıklarından kullanılan ağırlığı ve ban süresini güncelle"""
+        with self.condition:
+            state = self._host(host)
+            now = self.clock()
+            self._roll(state, now)
+
+            used = headers.get('X-MBX-USED-WEIGHT-1M') or headers.get('x-mbx-used-weight-1m')
+            if used is not None:
+                state.used = max(state.used, int(used))
+
+            if status_code in (418, 429):
+                state.throttled += 1
+                retry_after = headers.get('Retry-After')
+                delay = float(retry_after) if retry_after else (60.0 if status_code == 429 else 120.0)
+                state.banned_until = max(state.banned_until, now + delay)
+                logger.warning(f"{host} {status_code} döndü, {delay:.0f} sn istek gönderilmeyecek")
+
+            self.condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Host başına kuyruk derinliği ve ağırlık kullanımı"""
+        with self.condition:
+            now = self.clock()
+            report = {}
+            for host, state in self.hosts.items():
+                self._roll(state, now)
+                report[host] = {
+                    'used_weight': state.used,
+                    'weight_limit': state.limit,
+                    'utilisation': round(state.used / state.limit, 4) if state.limit else 0.0,
+                    'queue_depth': len(state.queue),
+                    'granted': state.granted,
+                    'throttled': state.throttled,
+                    'rejected': state.rejected,
+                    'banned_for': round(max(0.0, state.banned_until - now), 1),
+                    'avg_wait_ms': round(state.wait_seconds / state.granted * 1000, 2) if state.granted else 0.0
+                }
+            return report
+
+
+class UpstreamClient:
+    """
+    Tüm Binance REST çağrılarının geçtiği paylaşılan HTTP istemcisi
+    Host başına keep-alive bağlantı havuzu, ortak zaman aşımı ve geçici hatalarda yeniden deneme sağlar.
+    httpx + h2 kuruluysa HTTP/2 kullanılır. Her istek WeightScheduler'dan geçer.
+    """
+
+    def __init__(self, pool_size: int = 20, retries: int = 2,
+                 timeout: Tuple[float, float] = DEFAULT_TIMEOUT, http2: Optional[bool] = None,
+                 scheduler: Optional[WeightScheduler] = None):
+        self.timeout = timeout
+        self.scheduler = scheduler or WeightScheduler()
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        self.request_count = 0
+        self.error_count = 0
+        self.lock = threading.Lock()
+
+        if self.http2:
+            self.client = httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                transport=httpx.HTTPTransport(http2=True, retries=retries)
+            )
+        else:
+            # 429/418 burada yeniden denenmez - ağırlık limitini aşan istekleri tekrarlamak ban'i uzatır
+            retry = Retry(total=retries, connect=retries, read=retries, status=retries,
+                          backoff_factor=0.2, status_forcelist=(500, 502, 503, 504),
+                          allowed_methods=frozenset(['GET']), raise_on_status=False,
+                          respect_retry_after_header=False)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+            self.client = requests.Session()
+            self.client.mount('https://', adapter)
+            self.client.mount('http://', adapter)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[Tuple[float, float]] = None, priority: int = PRIORITY_DEFAULT,
+            max_wait: Optional[float] = None):
+        """
+        GET isteği yap ve yanıt nesnesini döndür
+        Yanıt status_code, headers ve json() sağlar (requests veya httpx)
+        priority: küçük değer önce gönderilir; max_wait: ağırlık bütçesi için en fazla bekleme
+        """
+        timeout = timeout or self.timeout
+        parts = urlsplit(url)
+        host = parts.netloc
+        try:
+            self.scheduler.acquire(host, request_weight(parts.path, params), priority, max_wait)
+        except UpstreamThrottled:
+            UPSTREAM_ERRORS.labels(host, 'throttled').inc()
+            raise
+        with self.lock:
+            self.request_count += 1
+
+        started = time.perf_counter()
+        try:
+            if self.http2:
+                response = self.client.get(url, params=params,
+                                           timeout=httpx.Timeout(timeout[1], connect=timeout[0]))
+            else:
+                response = self.client.get(url, params=params, timeout=timeout)
+        except Exception as e:
+            with self.lock:
+                self.error_count += 1
+            UPSTREAM_SECONDS.labels(host).observe(time.perf_counter() - started)
+            UPSTREAM_REQUESTS.labels(host, 'error').inc()
+            UPSTREAM_ERRORS.labels(host, type(e).__name__).inc()
+            raise
+
+        UPSTREAM_SECONDS.labels(host).observe(time.perf_counter() - started)
+        UPSTREAM_REQUESTS.labels(host, response.status_code).inc()
+        if response.status_code >= 400:
+            UPSTREAM_ERRORS.labels(host, f'http_{response.status_code}').inc()
+        self.scheduler.record_response(host, response.status_code, response.headers)
+        return response
+
+    def close(self):
+        self.client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'http2': self.http2,
+            'requests': self.request_count,
+            'errors': self.error_count,
+            'hosts': self.scheduler.stats()
+        }
+
+
+# Uygulama ve tarayıcının paylaştığı istemci
+shared_client = UpstreamClient()
@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Binance kline aralıkları (saniye)
+INTERVAL_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "2h": 7200, "4h": 14400, "6h": 21600, "8h": 28800, "12h": 43200,
+    "1d": 86400, "3d": 259200, "1w": 604800, "1M": 2592000
+}
+# Haftalık mumlar Pazartesi 00:00 UTC'de açılır (epoch Perşembe) - 1M uzunluğu sabit değil
+WEEK_OFFSET_SECONDS = 4 * 86400
+
+
+def next_boundary(interval: str, now: float) -> float:
+    """now'dan sonraki ilk Binance mum sınırı (sn, UTC)"""
+    if interval == '1M':
+        current = datetime.fromtimestamp(now, timezone.utc)
+        year, month = (current.year + 1, 1) if current.month == 12 else (current.year, current.month + 1)
+        return datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+    period = INTERVAL_SECONDS.get(interval, 60)
+    offset = WEEK_OFFSET_SECONDS if interval == '1w' else 0
+    return ((now - offset) // period + 1) * period + offset
+
+
+class _InFlight:
+    """Devam eden upstream isteği - aynı anahtarı isteyen diğer thread'ler bunu bekler"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class CandleCache:
+    """
+    (market, symbol, interval, limit) anahtarlı TTL + LRU önbellek
+    Kayıtlar bir sonraki mum sınırında geçersiz olur. Açık (kapanmamış) mumu içeren yanıtlar
+    mum içinde değiştiği için en geç max_age saniye tutulur; sadece kapanmış mumlar sınıra kadar kalır.
+    Aynı anahtar için eşzamanlı istekler tek upstream isteğinde birleştirilir.
+    """
+
+    def __init__(self, max_entries: int = 2000, max_age: float = 10.0):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.in_flight: Dict[Hashable, _InFlight] = {}
+        self.lock = threading.Lock()
+
+        # Sayaçlar
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _includes_open_candle(data: Any, now: float) -> bool:
+        """Kline yanıtının son mumu henüz kapanmadıysa True (kline listesi değilse açık sayılır)"""
+        try:
+            return int(data[-1][6]) >= now * 1000
+        except (TypeError, IndexError, KeyError, ValueError):
+            return True
+
+    def _expires_at(self, interval: str, now: float, data: Any = None) -> float:
+        """Mum sınırına hizalı son kullanma zamanı (açık mum içeren yanıtta en geç max_age sonra)"""
+        boundary = next_boundary(interval, now)
+        if self._includes_open_candle(data, now):
+            return min(boundary, now + self.max_age)
+        return boundary
+
+    def get(self, key: Hashable, interval: str, fetch: Callable[[], Tuple[int, Any]]) -> Tuple[int, Any]:
+        """
+        Önbellekteki (status_code, data) yanıtını döndür, yoksa fetch ile al
+        Sadece 200 yanıtları önbelleğe alınır; hata tüm bekleyenlere iletilir.
+        """
+        with self.lock:
+            now = time.time()
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self.entries[key]
+
+            waiter = self.in_flight.get(key)
+            owner = waiter is None
+            if owner:
+                self.misses += 1
+                waiter = self.in_flight[key] = _InFlight()
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            waiter.event.wait()
+            if waiter.error is not None:
+                raise waiter.error
+            return waiter.value
+
+        try:
+            value = fetch()
+            waiter.value = value
+        except BaseException as e:
+            waiter.error = e
+            raise
+        finally:
+            with self.lock:
+                if waiter.error is None and waiter.value[0] == 200:
+                    self.entries[key] = (self._expires_at(interval, time.time(), waiter.value[1]), waiter.value)
+                    self.entries.move_to_end(key)
+                    while len(self.entries) > self.max_entries:
+                        self.entries.popitem(last=False)
+                        self.evictions += 1
+                self.in_flight.pop(key, None)
+            waiter.event.set()
+
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek sayaçlarını döndür"""
+        with self.lock:
+            requests = self.hits + self.misses + self.coalesced
+            return {
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'in_flight': len(self.in_flight),
+                'hit_ratio': round((self.hits + self.coalesced) / requests, 4) if requests else 0.0
+            }